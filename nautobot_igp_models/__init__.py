@@ -3,7 +3,7 @@
 # Metadata is inherited from Nautobot. If not including Nautobot in the environment, this should be added
 from importlib import metadata
 
-from django.db.models.signals import post_migrate
+from django.db.models.signals import m2m_changed, post_delete, post_migrate, post_save, pre_delete, pre_save
 from nautobot.apps import NautobotAppConfig
 
 __version__ = metadata.version(__name__)
@@ -42,22 +42,81 @@ class NautobotIgpModelsConfig(NautobotAppConfig):
                 "Planned",
                 "Provisioning",
             ],
-        }
+        },
+        # Milliseconds added to failure detection time for flooding, SPF and FIB update in convergence estimates
+        "convergence_allowance_ms": 1000,
+        # Lifetime in seconds of cached effective interface configurations and device config contexts; 0 disables
+        "effective_config_cache_timeout": 300,
+        # Record calls, queries, config context merges and wall time of effective configuration resolution
+        "instrumentation_enabled": False,
+        # Overrides of the per-area limits of the OSPF Area Scaling Job (routers, links, lsdb_bytes, spf_operations)
+        "ospf_area_thresholds": {},
+        # Reference bandwidth in Mbps of auto-cost for ISIS/OSPF configurations without their own
+        "reference_bandwidth_mbps": 100000,
+        # Number of IGP topology snapshots per full checkpoint; the others store deltas against their predecessor
+        "snapshot_checkpoint_interval": 24,
     }
     caching_config = {}
+    middleware = ["nautobot_igp_models.middleware.InstrumentationSummaryMiddleware"]
     docs_view_name = "plugins:nautobot_igp_models:docs"
 
     def ready(self):
         """Callback invoked after the app is loaded."""
         super().ready()
 
+        from nautobot.dcim.models import Cable, Device  # pylint: disable=import-outside-toplevel
+        from nautobot.extras.models import ConfigContext  # pylint: disable=import-outside-toplevel
+        from nautobot.ipam.models import IPAddress  # pylint: disable=import-outside-toplevel
+
+        from .models import (  # pylint: disable=import-outside-toplevel
+            IGPRoutingInstance,
+            ISISConfiguration,
+            ISISInterfaceConfiguration,
+            OSPFConfiguration,
+            OSPFInterfaceConfiguration,
+        )
         from .signals import (  # pylint: disable=import-outside-toplevel
+            igp_routing_instance_post_save,
+            igp_routing_instance_pre_save,
+            invalidate_effective_config_context,
+            invalidate_effective_config_context_scope,
+            invalidate_effective_config_device,
+            invalidate_effective_config_object,
+            invalidate_topology,
+            ip_address_post_save,
             post_migrate_create_statuses,
             post_migrate_load_resources,
         )
 
         post_migrate.connect(post_migrate_create_statuses, sender=self)
         post_migrate.connect(post_migrate_load_resources, sender=self)
+        pre_save.connect(igp_routing_instance_pre_save, sender=IGPRoutingInstance)
+        post_save.connect(igp_routing_instance_post_save, sender=IGPRoutingInstance)
+        post_save.connect(ip_address_post_save, sender=IPAddress)
+
+        # Effective configuration cache invalidation
+        for model in (ISISConfiguration, ISISInterfaceConfiguration, OSPFConfiguration, OSPFInterfaceConfiguration):
+            post_save.connect(invalidate_effective_config_object, sender=model)
+            post_delete.connect(invalidate_effective_config_object, sender=model)
+        post_save.connect(invalidate_effective_config_device, sender=Device)
+        post_delete.connect(invalidate_effective_config_device, sender=Device)
+        post_save.connect(invalidate_effective_config_context, sender=ConfigContext)
+        pre_delete.connect(invalidate_effective_config_context, sender=ConfigContext)
+        for field in ConfigContext._meta.many_to_many:
+            m2m_changed.connect(invalidate_effective_config_context_scope, sender=field.remote_field.through)
+
+        # Whole-topology analysis cache invalidation
+        for model in (
+            IGPRoutingInstance,
+            ISISConfiguration,
+            ISISInterfaceConfiguration,
+            OSPFConfiguration,
+            OSPFInterfaceConfiguration,
+            Cable,
+            Device,
+        ):
+            post_save.connect(invalidate_topology, sender=model)
+            post_delete.connect(invalidate_topology, sender=model)
 
 
 config = NautobotIgpModelsConfig  # pylint:disable=invalid-name
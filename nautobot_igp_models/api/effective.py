@@ -0,0 +1,64 @@
+"""Effective configuration fields on the interface configuration API endpoints.
+
+``effective_metric`` (ISIS) or ``effective_cost`` (OSPF) and the full ``effective_config`` of each interface
+configuration are Nautobot opt-in fields (``Meta.opt_in_fields``): ``GET`` requests render them when ``?include=``
+names them, e.g. ``?include=effective_cost,effective_config``. They are not computed per object by the serializer:
+the view selects the parent configurations and devices with the page (``with_inheritance_related()``), then resolves
+the whole page with ``resolve_effective_configs()``, which reads the effective configuration cache and computes each
+device's config context once for the misses. The number of queries and config context merges per page therefore does
+not grow with the page size.
+"""
+
+from django.db.models import QuerySet
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema_field
+
+from nautobot_igp_models.inheritance import resolve_effective_configs, with_inheritance_related
+
+EFFECTIVE_FIELDS = {"effective_metric", "effective_cost", "effective_config"}
+
+
+def attach_effective_configs(interface_configs):
+    """Resolve the effective configuration of ``interface_configs`` in one batch and attach it to each object."""
+    effective = resolve_effective_configs(interface_configs)
+    for interface_config in interface_configs:
+        interface_config._effective_config = effective[interface_config.pk]  # pylint: disable=protected-access
+
+
+class EffectiveConfigSerializerMixin:
+    """Serializer mixin rendering ``effective_config`` from the configuration attached by the view."""
+
+    @extend_schema_field(OpenApiTypes.OBJECT)
+    def get_effective_config(self, obj):
+        """Return the effective configuration attached by the view, resolving it if it was not."""
+        if not hasattr(obj, "_effective_config"):
+            attach_effective_configs([obj])
+        return obj._effective_config  # pylint: disable=protected-access
+
+
+class EffectiveConfigViewSetMixin:
+    """NautobotModelViewSet mixin resolving the effective configuration of each page in one batch."""
+
+    def include_effective(self):
+        """Return whether the request is a GET request whose serializer renders effective configuration fields."""
+        request = getattr(self, "request", None)
+        if request is None or request.method != "GET":
+            return False
+        return not EFFECTIVE_FIELDS.isdisjoint(self.get_serializer().fields)
+
+    def get_queryset(self):
+        """Select the related objects the effective configuration reads when the request opts in."""
+        queryset = super().get_queryset()
+        if self.include_effective():
+            queryset = with_inheritance_related(queryset)
+        return queryset
+
+    def get_serializer(self, *args, **kwargs):
+        """Attach the effective configuration of the serialized objects before serializing them."""
+        if args and self.include_effective():
+            instance = args[0]
+            if isinstance(instance, QuerySet):
+                instance = list(instance)
+                args = (instance, *args[1:])
+            attach_effective_configs(instance if isinstance(instance, list) else [instance])
+        return super().get_serializer(*args, **kwargs)
@@ -1,11 +1,19 @@
 """API serializers for nautobot_igp_models."""
 
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema_field
 from nautobot.apps.api import NautobotModelSerializer, TaggedModelSerializerMixin
+from rest_framework import serializers
 
 from nautobot_igp_models import models
+from nautobot_igp_models.api.effective import EffectiveConfigSerializerMixin
+from nautobot_igp_models.api.sparse_fields import SparseFieldsSerializerMixin
+from nautobot_igp_models.api.upsert import BulkUpsertSerializerMixin
 
 
-class IGPRoutingInstanceSerializer(NautobotModelSerializer, TaggedModelSerializerMixin):  # pylint: disable=too-many-ancestors
+class IGPRoutingInstanceSerializer(
+    BulkUpsertSerializerMixin, SparseFieldsSerializerMixin, NautobotModelSerializer, TaggedModelSerializerMixin
+):  # pylint: disable=too-many-ancestors
     """IGPRoutingInstance Serializer."""
 
     class Meta:
@@ -15,7 +23,9 @@ class IGPRoutingInstanceSerializer(NautobotModelSerializer, TaggedModelSerialize
         fields = "__all__"
 
 
-class ISISConfigurationSerializer(NautobotModelSerializer, TaggedModelSerializerMixin):  # pylint: disable=too-many-ancestors
+class ISISConfigurationSerializer(
+    BulkUpsertSerializerMixin, SparseFieldsSerializerMixin, NautobotModelSerializer, TaggedModelSerializerMixin
+):  # pylint: disable=too-many-ancestors
     """ISISConfiguration Serializer."""
 
     class Meta:
@@ -25,17 +35,34 @@ class ISISConfigurationSerializer(NautobotModelSerializer, TaggedModelSerializer
         fields = "__all__"
 
 
-class ISISInterfaceConfigurationSerializer(NautobotModelSerializer, TaggedModelSerializerMixin):  # pylint: disable=too-many-ancestors
+class ISISInterfaceConfigurationSerializer(
+    BulkUpsertSerializerMixin,
+    SparseFieldsSerializerMixin,
+    EffectiveConfigSerializerMixin,
+    NautobotModelSerializer,
+    TaggedModelSerializerMixin,
+):  # pylint: disable=too-many-ancestors
     """ISISInterfaceConfiguration Serializer."""
 
+    effective_metric = serializers.SerializerMethodField()
+    effective_config = serializers.SerializerMethodField()
+
     class Meta:
         """Meta attributes."""
 
         model = models.ISISInterfaceConfiguration
         fields = "__all__"
+        opt_in_fields = ["effective_metric", "effective_config"]
+
+    @extend_schema_field(OpenApiTypes.INT)
+    def get_effective_metric(self, obj):
+        """Return the metric of the effective configuration, device config context included."""
+        return self.get_effective_config(obj)["metric"]
 
 
-class OSPFConfigurationSerializer(NautobotModelSerializer, TaggedModelSerializerMixin):  # pylint: disable=too-many-ancestors
+class OSPFConfigurationSerializer(
+    BulkUpsertSerializerMixin, SparseFieldsSerializerMixin, NautobotModelSerializer, TaggedModelSerializerMixin
+):  # pylint: disable=too-many-ancestors
     """OSPFConfiguration Serializer."""
 
     class Meta:
@@ -45,11 +72,26 @@ class OSPFConfigurationSerializer(NautobotModelSerializer, TaggedModelSerializer
         fields = "__all__"
 
 
-class OSPFInterfaceConfigurationSerializer(NautobotModelSerializer, TaggedModelSerializerMixin):  # pylint: disable=too-many-ancestors
+class OSPFInterfaceConfigurationSerializer(
+    BulkUpsertSerializerMixin,
+    SparseFieldsSerializerMixin,
+    EffectiveConfigSerializerMixin,
+    NautobotModelSerializer,
+    TaggedModelSerializerMixin,
+):  # pylint: disable=too-many-ancestors
     """OSPFInterfaceConfiguration Serializer."""
 
+    effective_cost = serializers.SerializerMethodField()
+    effective_config = serializers.SerializerMethodField()
+
     class Meta:
         """Meta attributes."""
 
         model = models.OSPFInterfaceConfiguration
         fields = "__all__"
+        opt_in_fields = ["effective_cost", "effective_config"]
+
+    @extend_schema_field(OpenApiTypes.INT)
+    def get_effective_cost(self, obj):
+        """Return the cost of the effective configuration, device config context included."""
+        return self.get_effective_config(obj)["cost"]
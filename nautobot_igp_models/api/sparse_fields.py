@@ -0,0 +1,117 @@
+"""Sparse fieldsets on the IGP API endpoints.
+
+``GET`` requests accept ``?fields=`` (render only these fields; ``id`` is always rendered) and ``?exclude=`` (render
+every field but these), as comma-separated or repeated query parameters. They combine with Nautobot's own ``?depth``,
+``?include`` and ``?exclude_m2m`` parameters, and apply to the top-level objects only.
+
+Nautobot's ``get_queryset()`` derives ``select_related()`` and ``prefetch_related()`` from the serializer's fields, so
+relations that are not rendered are no longer joined or prefetched. When every rendered field reads only model
+columns, the queryset is further restricted with ``.only()`` to those columns: ``?fields=cost`` on OSPF interface
+configurations selects two columns from a single table.
+"""
+
+from django.core.exceptions import FieldDoesNotExist
+from nautobot.core.api.filter_backends import NautobotFilterBackend
+from rest_framework.exceptions import ParseError
+from rest_framework.settings import api_settings
+
+FIELDS_PARAM = "fields"
+EXCLUDE_PARAM = "exclude"
+
+# Serializer fields rendered from the primary key alone
+PK_FIELDS = {"id", "url", "object_type", "notes_url"}
+
+
+def query_param_values(params, name):
+    """Return the comma-separated or repeated values of a query parameter."""
+    return {value.strip() for param in params.getlist(name) for value in param.split(",") if value.strip()}
+
+
+class SparseFieldsSerializerMixin:
+    """Serializer mixin dropping the fields not selected by the ``fields`` and ``exclude`` query parameters."""
+
+    _sparse_fields = None
+    is_sparse = False
+
+    @property
+    def fields(self):
+        """Return the serializer fields, restricted to the requested fieldset on top-level GET requests."""
+        if self._sparse_fields is None:
+            fields = super().fields
+            request = self.context.get("request") if hasattr(self, "_context") else None
+            if request is None or request.method != "GET" or self.is_nested:
+                return fields
+            params = getattr(request, "query_params", request.GET)
+            selected, excluded = query_param_values(params, FIELDS_PARAM), query_param_values(params, EXCLUDE_PARAM)
+            unknown = sorted((selected | excluded) - set(fields))
+            if unknown:
+                raise ParseError(f"Unknown field(s) in the fields/exclude parameters: {', '.join(unknown)}")
+            if selected:
+                selected.add("id")
+            self._sparse_fields = {
+                name: field
+                for name, field in fields.items()
+                if (not selected or name in selected) and name not in excluded
+            }
+            self.is_sparse = bool(selected or excluded)
+        return self._sparse_fields
+
+
+def only_fields(serializer):
+    """Return the model fields to load with ``.only()`` for the rendered fields of ``serializer``.
+
+    Returns:
+        list: Model field names, or None if a rendered field reads more than model columns (e.g. ``display``).
+    """
+    opts = serializer.Meta.model._meta
+    names = {opts.pk.name}
+    for name, field in serializer.fields.items():
+        if field.write_only or name in PK_FIELDS:
+            continue
+        try:
+            model_field = opts.get_field(field.source)
+        except FieldDoesNotExist:
+            return None
+        if model_field.concrete:
+            names.add(model_field.name)
+        elif not model_field.many_to_many:
+            return None
+    return sorted(names)
+
+
+class SparseFieldsFilterBackend(NautobotFilterBackend):
+    """NautobotFilterBackend not taking the ``fields`` and ``exclude`` query parameters for filters."""
+
+    def get_filterset_kwargs(self, request, queryset, view):
+        """Drop the sparse fieldset parameters from the filterset data."""
+        kwargs = super().get_filterset_kwargs(request, queryset, view)
+        for param in (FIELDS_PARAM, EXCLUDE_PARAM):
+            kwargs["data"].pop(param, None)
+        return kwargs
+
+
+class SparseFieldsViewSetMixin:
+    """NautobotModelViewSet mixin pruning the queryset to the requested fieldset (see the module docstring)."""
+
+    filter_backends = [
+        SparseFieldsFilterBackend if backend is NautobotFilterBackend else backend
+        for backend in api_settings.DEFAULT_FILTER_BACKENDS
+    ]
+
+    def get_queryset(self):
+        """Restrict the queryset to the columns of the rendered fields, when they are all model columns."""
+        queryset = super().get_queryset()
+        serializer = self.get_serializer()
+        if not serializer.is_sparse:
+            return queryset
+        names = only_fields(serializer)
+        if names is None:
+            return queryset
+        # Keep the prefetches of rendered relations; natural key prefetches only serve natural_slug
+        rendered = {field.source for field in serializer.fields.values() if not field.write_only}
+        prefetches = [
+            lookup
+            for lookup in queryset._prefetch_related_lookups  # pylint: disable=protected-access
+            if getattr(lookup, "prefetch_to", lookup) in rendered
+        ]
+        return queryset.prefetch_related(None).prefetch_related(*prefetches).only(*names)
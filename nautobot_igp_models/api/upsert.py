@@ -0,0 +1,380 @@
+"""Bulk upsert of IGP objects keyed on their natural keys.
+
+The natural key of a model is its ``unique_together`` constraint: ``(device, protocol, vrf)`` for routing instances,
+``(instance, name)`` for ISIS configurations, ``(instance, process_id)`` for OSPF configurations and
+``(isis_config, interface)`` / ``(ospf_config, interface)`` for interface configurations.
+
+``POST <endpoint>/upsert/`` takes a list of objects in the model's API representation. The existing objects matching
+any of their natural keys are fetched with one query, and the related objects referenced by ID with one query per
+foreign key. Each object is then validated by the model's serializer, as a partial update of the existing object or
+as a new one, without further queries: ``BulkUpsertSerializerMixin`` reads the related objects from the serializer
+context, and model validation skips the resolved foreign keys and the uniqueness checks, which the natural key lookup
+and the database constraints cover. If every object is valid, the new objects are written with
+``bulk_create()`` and the changed ones with ``bulk_update()``, in one transaction; otherwise nothing is written. The
+response lists the result of each object, in order.
+
+Object permissions are enforced as by the regular endpoints: existing objects the user may not change are rejected
+with a 403, and the written objects are read back through ``restrict(user, "add")`` / ``restrict(user, "change")``
+before the transaction commits, which is rolled back with a 403 if any of them falls outside the user's constraints.
+A database constraint violation (such as a routing instance ``name`` already in use) rolls the transaction back
+with a 400; the objects are then written one by one in a rolled back savepoint to find the offending ones, which are
+reported with the model's uniqueness messages. The raw database error is only logged.
+
+Bulk writes do not call ``save()`` or send signals: the fields ``save()`` derives are set by ``DERIVED_FIELDS``, the
+cache generations of the written objects are bumped, and NETs depending on a changed router ID or ISIS area are
+re-derived. No change log (``ObjectChange``) entries are recorded, and no webhooks, job hooks or other change events
+are sent for upserted objects; use the regular endpoints where these are required.
+"""
+
+import logging
+import uuid
+from functools import partial
+
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import IntegrityError, transaction
+from django.db.models import NOT_PROVIDED
+from django.utils import timezone
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.validators import UniqueValidator
+
+from nautobot_igp_models import cache, models
+from nautobot_igp_models.signals import queue_net_rederivation
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 1000
+
+# Per model: (method setting the fields save() derives, the fields it sets)
+DERIVED_FIELDS = {
+    models.IGPRoutingInstance: ("sync_router_id_number", ["router_id_number"]),
+    models.ISISConfiguration: ("derive_net", ["system_id", "system_id_number", "isis_area_hex"]),
+    models.OSPFInterfaceConfiguration: ("sync_area_number", ["area_number"]),
+}
+
+# Serializer context key of the related objects resolved for the payload: {field name: {pk: object}}
+UPSERT_RELATED = "upsert_related"
+
+# Routing instance fields whose change re-derives the NETs of auto-NET ISIS configurations
+NET_INPUT_FIELDS = {"router_id", "isis_area"}
+
+
+def natural_key_fields(model):
+    """Return the model fields of the natural key of ``model``."""
+    return [model._meta.get_field(name) for name in model._meta.unique_together[0]]
+
+
+def _key_value(field, serializer, item):
+    """Return the database value of a natural key field of a payload item, resolving related objects if needed."""
+    value = item.get(field.name, NOT_PROVIDED)
+    if value is NOT_PROVIDED:
+        return None if field.default is NOT_PROVIDED else field.get_default()
+    if value is None:
+        return None
+    if not field.is_relation:
+        return field.to_python(value)
+    pk = related_pk(value)
+    if pk is None:
+        # Related object given by its attributes
+        return serializer.fields[field.name].to_internal_value(value).pk
+    return pk
+
+
+def related_pk(value):
+    """Return the primary key a related field value refers to, or None if it is given by other attributes."""
+    raw = value.get("id") if isinstance(value, dict) else value
+    try:
+        return uuid.UUID(str(raw))
+    except ValueError:
+        return None
+
+
+def _resolve_related(model, serializer, items, user):
+    """Fetch the related objects ``items`` reference by primary key, with one query per foreign key.
+
+    The field querysets are restricted to the objects ``user`` may view, as the related fields do.
+    """
+    related = {}
+    for model_field in model._meta.concrete_fields:
+        field = serializer.fields.get(model_field.name)
+        if not model_field.is_relation or field is None or field.read_only:
+            continue
+        pks = {pk for item in items if (pk := related_pk(item.get(model_field.name))) is not None}
+        if not pks:
+            continue
+        queryset = field.get_queryset()
+        if hasattr(queryset, "restrict"):
+            queryset = queryset.restrict(user, "view")
+        related[model_field.name] = {obj.pk: obj for obj in queryset.filter(pk__in=pks)}
+    return related
+
+
+def _resolved_value(objects, to_internal_value, data):
+    """Return the pre-resolved object ``data`` refers to, or resolve it with the related field."""
+    obj = objects.get(related_pk(data))
+    return obj if obj is not None else to_internal_value(data)
+
+
+def _field_values(obj, fields):
+    return {field.attname: getattr(obj, field.attname) for field in fields}
+
+
+def _permitted_pks(model, user, action, pks):
+    """Return the subset of ``pks`` the object permissions of ``user`` allow ``action`` on."""
+    if not pks:
+        return set()
+    return set(model.objects.restrict(user, action).filter(pk__in=pks).values_list("pk", flat=True))
+
+
+def _constraint_errors(model, obj):
+    """Return serializer-style errors naming the unique constraints ``obj`` conflicts with."""
+    opts = model._meta
+    checks = [(field.name,) for field in opts.concrete_fields if field.unique and not field.primary_key]
+    errors = {}
+    for check in (*checks, *opts.unique_together):
+        lookup = {opts.get_field(name).attname: getattr(obj, opts.get_field(name).attname) for name in check}
+        if model.objects.filter(**lookup).exclude(pk=obj.pk).exists():
+            key = check[0] if len(check) == 1 else api_settings.NON_FIELD_ERRORS_KEY
+            errors.setdefault(key, []).extend(obj.unique_error_message(model, check).messages)
+    return errors or {"detail": ["The object violates a database constraint."]}
+
+
+def _rejected(results, forbidden=(), detail=None):
+    """Return the response of a payload written nothing for, marking each object's result."""
+    for result in results:
+        if result["index"] in forbidden:
+            result["result"] = "forbidden"
+        else:
+            result["result"] = "invalid" if "errors" in result else "skipped"
+    data = {"results": results} if detail is None else {"detail": detail, "results": results}
+    return Response(data, status=status.HTTP_403_FORBIDDEN if forbidden else status.HTTP_400_BAD_REQUEST)
+
+
+class BulkUpsertSerializerMixin:
+    """Serializer mixin validating upsert payload items without per-item queries (see the module docstring)."""
+
+    _upsert_fields_bound = False
+
+    @property
+    def fields(self):
+        """Return the serializer fields, reading related objects from the ``UPSERT_RELATED`` context if given."""
+        fields = super().fields
+        related = self.context.get(UPSERT_RELATED) if hasattr(self, "_context") else None
+        if related is not None and not self._upsert_fields_bound:
+            for name, objects in related.items():
+                if name in fields:
+                    fields[name].to_internal_value = partial(_resolved_value, objects, fields[name].to_internal_value)
+            for field in fields.values():
+                field.validators = [
+                    validator for validator in field.validators if not isinstance(validator, UniqueValidator)
+                ]
+            self._upsert_fields_bound = True
+        return fields
+
+    def get_validators(self):
+        """Drop the unique_together validators when validating an upsert payload."""
+        if UPSERT_RELATED in self.context:
+            return []
+        return super().get_validators()
+
+    def validate(self, attrs):
+        """Run model validation as ValidatedModelSerializer does, without re-querying foreign keys or uniqueness."""
+        if UPSERT_RELATED not in self.context:
+            return super().validate(attrs)
+        model = self.Meta.model
+        m2m_fields = {field.name for field in model._meta.get_fields() if field.many_to_many}
+        local_attrs = {
+            name: value
+            for name, value in attrs.items()
+            if name not in ("custom_fields", "relationships", "tags") and name not in m2m_fields
+        }
+        instance = self.instance if self.instance is not None else model()
+        for name, value in local_attrs.items():
+            setattr(instance, name, value)
+        # Set foreign keys were resolved by the related fields or are enforced by the database
+        resolved = [
+            field.name
+            for field in model._meta.concrete_fields
+            if field.is_relation and getattr(instance, field.attname) is not None
+        ]
+        instance.full_clean(exclude=resolved, validate_unique=False)
+        return attrs
+
+
+class BulkUpsertMixin:
+    """Add a ``POST upsert/`` action to a NautobotModelViewSet (see the module docstring)."""
+
+    upsert_batch_size = DEFAULT_BATCH_SIZE
+
+    @extend_schema(
+        filters=False,
+        request={"application/json": {"type": "array", "items": {"type": "object"}}},
+        responses={200: OpenApiTypes.OBJECT, 400: OpenApiTypes.OBJECT},
+    )
+    @action(detail=False, methods=["post"], url_path="upsert")
+    def upsert(self, request):
+        """Create or update a list of objects matched on their natural key, all in one transaction."""
+        model = self.queryset.model
+        opts = model._meta
+        if not request.user.has_perms(
+            [f"{opts.app_label}.add_{opts.model_name}", f"{opts.app_label}.change_{opts.model_name}"]
+        ):
+            return Response(
+                {"detail": "Upsert requires both the add and change permissions."}, status=status.HTTP_403_FORBIDDEN
+            )
+        items = request.data
+        if not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+            return Response({"detail": "Expected a list of objects."}, status=status.HTTP_400_BAD_REQUEST)
+
+        key_fields = natural_key_fields(model)
+        key_serializer = self.get_serializer()
+        results = [{"index": index} for index in range(len(items))]
+        keys = []
+        for index, item in enumerate(items):
+            try:
+                keys.append(tuple(_key_value(field, key_serializer, item) for field in key_fields))
+            except (ValidationError, ValueError, ObjectDoesNotExist) as error:
+                keys.append(None)
+                results[index]["errors"] = getattr(error, "detail", {"detail": [str(error)]})
+
+        first_values = {key[0] for key in keys if key is not None}
+        existing = {
+            tuple(_field_values(obj, key_fields).values()): obj
+            for obj in model.objects.filter(**{f"{key_fields[0].name}__in": first_values})
+        }
+        changeable = _permitted_pks(model, request.user, "change", [obj.pk for obj in existing.values()])
+        context = {
+            **self.get_serializer_context(),
+            UPSERT_RELATED: _resolve_related(model, key_serializer, items, request.user),
+        }
+
+        to_create, to_update, m2m_values, update_fields, seen = [], [], [], set(), {}
+        net_instances, forbidden, written = [], set(), {}
+        concrete_fields = {field.name: field for field in opts.concrete_fields}
+        m2m_fields = {field.name for field in opts.get_fields() if field.many_to_many and not field.auto_created}
+        for index, (item, key) in enumerate(zip(items, keys, strict=True)):
+            if key is None:
+                continue
+            if key in seen:
+                results[index]["errors"] = {"detail": [f"Duplicate natural key of item {seen[key]}."]}
+                continue
+            seen[key] = index
+            if "relationships" in item:
+                results[index]["errors"] = {"relationships": ["Relationships are not supported by upsert."]}
+                continue
+            instance = existing.get(key)
+            if instance is not None and instance.pk not in changeable:
+                results[index]["errors"] = {"detail": ["You do not have permission to change this object."]}
+                forbidden.add(index)
+                continue
+            previous = _field_values(instance, opts.concrete_fields) if instance is not None else None
+            serializer = self.get_serializer(instance, data=item, partial=instance is not None, context=context)
+            if not serializer.is_valid():
+                results[index]["errors"] = serializer.errors
+                continue
+
+            obj = instance if instance is not None else model()
+            changed, m2m = set(), {}
+            for name, value in serializer.validated_data.items():
+                if name in concrete_fields:
+                    setattr(obj, name, value)
+                    changed.add(name)
+                elif name in m2m_fields:
+                    m2m[name] = value
+            if instance is None:
+                to_create.append(obj)
+                results[index].update(result="created", id=str(obj.pk))
+            else:
+                changed = {
+                    name
+                    for name in changed
+                    if getattr(obj, concrete_fields[name].attname) != previous[concrete_fields[name].attname]
+                }
+                if not changed and not m2m:
+                    results[index].update(result="unchanged", id=str(obj.pk))
+                    continue
+                to_update.append(obj)
+                update_fields |= changed
+                if model is models.IGPRoutingInstance and changed & NET_INPUT_FIELDS:
+                    net_instances.append(obj.pk)
+                results[index].update(result="updated", id=str(obj.pk))
+            written[obj.pk] = index
+            if m2m:
+                m2m_values.append((obj, m2m))
+
+        if any("errors" in result for result in results):
+            return _rejected(results, forbidden)
+
+        derived_fields = DERIVED_FIELDS.get(model, (None, []))[1]
+        fields = sorted(update_fields | set(derived_fields) | {"last_updated"})
+        try:
+            denied = self._write_upsert(model, request.user, to_create, to_update, fields, m2m_values, net_instances)
+        except IntegrityError as error:
+            logger.warning("Upsert of %d %s rolled back: %s", len(written), opts.verbose_name_plural, error)
+            for pk, errors in self._integrity_errors(model, to_create, to_update, fields).items():
+                results[written[pk]]["errors"] = errors
+            return _rejected(results, detail="The objects violate a database constraint.")
+        if denied:
+            for pk in denied:
+                results[written[pk]]["errors"] = {"detail": ["The object would violate your object permissions."]}
+            return _rejected(results, forbidden={written[pk] for pk in denied})
+        counts = {
+            name: sum(1 for result in results if result["result"] == name)
+            for name in ("created", "updated", "unchanged")
+        }
+        return Response({**counts, "results": results})
+
+    def _write_upsert(self, model, user, to_create, to_update, fields, m2m_values, net_instances):
+        """Write the objects in one transaction, rolled back if any of them is outside the user's permissions.
+
+        Returns:
+            set: Primary keys of the objects the user may not add or change; nothing is written unless it is empty.
+        """
+        derive = DERIVED_FIELDS.get(model, (None, []))[0]
+        if derive:
+            for obj in (*to_create, *to_update):
+                getattr(obj, derive)()
+        now = timezone.now()
+        for obj in to_update:
+            obj.last_updated = now
+        with transaction.atomic():
+            model.objects.bulk_create(to_create, batch_size=self.upsert_batch_size)
+            if to_update:
+                model.objects.bulk_update(to_update, fields, batch_size=self.upsert_batch_size)
+            for obj, m2m in m2m_values:
+                for name, value in m2m.items():
+                    getattr(obj, name).set(value)
+            created_pks, updated_pks = {obj.pk for obj in to_create}, {obj.pk for obj in to_update}
+            denied = (created_pks - _permitted_pks(model, user, "add", created_pks)) | (
+                updated_pks - _permitted_pks(model, user, "change", updated_pks)
+            )
+            if denied:
+                transaction.set_rollback(True)
+                return denied
+            if net_instances:
+                queue_net_rederivation(net_instances)
+        cache.bump_objects(model, [obj.pk for obj in to_update])
+        if to_create:
+            cache.bump(cache.TOPOLOGY_SCOPE)
+        return denied
+
+    def _integrity_errors(self, model, to_create, to_update, fields):
+        """Write the objects one by one in a rolled back transaction and return {pk: errors} of the failing ones."""
+        errors, created_pks = {}, {obj.pk for obj in to_create}
+        with transaction.atomic():
+            for obj in (*to_create, *to_update):
+                try:
+                    with transaction.atomic():
+                        if obj.pk in created_pks:
+                            model.objects.bulk_create([obj])
+                        else:
+                            model.objects.bulk_update([obj], fields)
+                except IntegrityError:
+                    errors[obj.pk] = _constraint_errors(model, obj)
+            transaction.set_rollback(True)
+        return errors
@@ -1,20 +1,86 @@
 """API views for nautobot_igp_models."""
 
+from django.core.exceptions import ImproperlyConfigured
+from django.http import StreamingHttpResponse
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema
 from nautobot.apps.api import NautobotModelViewSet
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.response import Response
 
-from nautobot_igp_models import filters, models
+from nautobot_igp_models import arrow_export, filters, models
 from nautobot_igp_models.api import serializers
+from nautobot_igp_models.api.effective import EffectiveConfigViewSetMixin
+from nautobot_igp_models.api.sparse_fields import SparseFieldsViewSetMixin
+from nautobot_igp_models.api.upsert import BulkUpsertMixin
+from nautobot_igp_models.convergence import DEFAULT_OUTLIER_FACTOR, estimate_convergence
+from nautobot_igp_models.topology import PROTOCOL_MODELS
 
 
-class IGPRoutingInstanceViewSet(NautobotModelViewSet):  # pylint: disable=too-many-ancestors
+class IGPRoutingInstanceViewSet(SparseFieldsViewSetMixin, BulkUpsertMixin, NautobotModelViewSet):  # pylint: disable=too-many-ancestors
     """IGPRoutingInstance viewset."""
 
     queryset = models.IGPRoutingInstance.objects.all()
     serializer_class = serializers.IGPRoutingInstanceSerializer
     filterset_class = filters.IGPRoutingInstanceFilterSet
 
-
-class ISISConfigurationViewSet(NautobotModelViewSet):  # pylint: disable=too-many-ancestors
+    @extend_schema(
+        filters=False,
+        parameters=[OpenApiParameter("table", OpenApiTypes.STR, enum=arrow_export.TABLES, required=True)],
+        responses={(200, arrow_export.CONTENT_TYPE): OpenApiTypes.BINARY},
+    )
+    @action(detail=False, url_path="topology-snapshot")
+    def topology_snapshot(self, request):
+        """Stream the IGP topology nodes or edges visible to the user as an Arrow IPC stream."""
+        table = request.query_params.get("table")
+        if table not in arrow_export.TABLES:
+            return Response(
+                {"table": [f"Must be one of: {', '.join(arrow_export.TABLES)}"]}, status=status.HTTP_400_BAD_REQUEST
+            )
+        try:
+            arrow_export.import_pyarrow()
+        except ImproperlyConfigured as error:
+            return Response({"detail": str(error)}, status=status.HTTP_501_NOT_IMPLEMENTED)
+
+        response = StreamingHttpResponse(
+            arrow_export.iter_table_stream(table, user=request.user), content_type=arrow_export.CONTENT_TYPE
+        )
+        response["Content-Disposition"] = f'attachment; filename="igp-{table}.arrows"'
+        return response
+
+    @extend_schema(
+        filters=False,
+        parameters=[
+            OpenApiParameter("protocol", OpenApiTypes.STR, enum=list(PROTOCOL_MODELS)),
+            OpenApiParameter("outlier_factor", OpenApiTypes.FLOAT),
+            OpenApiParameter("outliers", OpenApiTypes.BOOL),
+        ],
+        responses={200: OpenApiTypes.OBJECT},
+    )
+    @action(detail=False, url_path="convergence")
+    def convergence(self, request):
+        """Estimate worst-case failure detection and convergence time per adjacency and per device."""
+        protocol = request.query_params.get("protocol")
+        if protocol is not None and protocol not in PROTOCOL_MODELS:
+            return Response(
+                {"protocol": [f"Must be one of: {', '.join(PROTOCOL_MODELS)}"]}, status=status.HTTP_400_BAD_REQUEST
+            )
+        try:
+            outlier_factor = float(request.query_params.get("outlier_factor", DEFAULT_OUTLIER_FACTOR))
+        except ValueError:
+            return Response({"outlier_factor": ["Must be a number."]}, status=status.HTTP_400_BAD_REQUEST)
+
+        estimate = estimate_convergence(
+            protocols=[protocol] if protocol else None, user=request.user, outlier_factor=outlier_factor
+        )
+        if request.query_params.get("outliers", "").lower() in ("true", "1"):
+            estimate["adjacencies"] = [row for row in estimate["adjacencies"] if row["outlier"]]
+            estimate["devices"] = [row for row in estimate["devices"] if row["outliers"]]
+        return Response(estimate)
+
+
+class ISISConfigurationViewSet(SparseFieldsViewSetMixin, BulkUpsertMixin, NautobotModelViewSet):  # pylint: disable=too-many-ancestors
     """ISISConfiguration viewset."""
 
     queryset = models.ISISConfiguration.objects.all()
@@ -22,7 +88,9 @@ class ISISConfigurationViewSet(NautobotModelViewSet):  # pylint: disable=too-man
     filterset_class = filters.ISISConfigurationFilterSet
 
 
-class ISISInterfaceConfigurationViewSet(NautobotModelViewSet):  # pylint: disable=too-many-ancestors
+class ISISInterfaceConfigurationViewSet(
+    SparseFieldsViewSetMixin, EffectiveConfigViewSetMixin, BulkUpsertMixin, NautobotModelViewSet
+):  # pylint: disable=too-many-ancestors
     """ISIS Interface Configuration viewset."""
 
     queryset = models.ISISInterfaceConfiguration.objects.all()
@@ -30,7 +98,7 @@ class ISISInterfaceConfigurationViewSet(NautobotModelViewSet):  # pylint: disabl
     filterset_class = filters.ISISInterfaceConfigurationFilterSet
 
 
-class OSPFConfigurationViewSet(NautobotModelViewSet):  # pylint: disable=too-many-ancestors
+class OSPFConfigurationViewSet(SparseFieldsViewSetMixin, BulkUpsertMixin, NautobotModelViewSet):  # pylint: disable=too-many-ancestors
     """OSPFConfiguration viewset."""
 
     queryset = models.OSPFConfiguration.objects.all()
@@ -38,7 +106,9 @@ class OSPFConfigurationViewSet(NautobotModelViewSet):  # pylint: disable=too-man
     filterset_class = filters.OSPFConfigurationFilterSet
 
 
-class OSPFInterfaceConfigurationViewSet(NautobotModelViewSet):  # pylint: disable=too-many-ancestors
+class OSPFInterfaceConfigurationViewSet(
+    SparseFieldsViewSetMixin, EffectiveConfigViewSetMixin, BulkUpsertMixin, NautobotModelViewSet
+):  # pylint: disable=too-many-ancestors
     """OSPF Interface Configuration viewset."""
 
     queryset = models.OSPFInterfaceConfiguration.objects.all()
@@ -0,0 +1,145 @@
+"""OSPF area scaling estimates: link state database size and SPF load per area.
+
+Router and interface counts per area come from one aggregate query on the normalized ``area_number``; adjacencies
+come from one pass over the compiled OSPF graph. LSA sizes follow the OSPFv2 encoding (RFC 2328, appendix A.4):
+
+- Type-1 (router) LSA: one per router, a 24 byte header plus 12 bytes per link description. Every interface is
+  described once (stub or transit network) and point-to-point adjacencies add a point-to-point link on each end.
+- Type-2 (network) LSA: one per broadcast or NBMA segment with adjacencies, 24 bytes plus 4 per attached router.
+
+The SPF estimate counts the vertices (routers and transit networks) and directed edges of the area's LSDB graph and
+scales them by ``log2(vertices)`` for the priority queue of Dijkstra's algorithm.
+"""
+
+import math
+
+from django.conf import settings
+from django.db.models import Count
+
+from nautobot_igp_models.graph import compile_graph
+from nautobot_igp_models.models import OSPFInterfaceConfiguration
+from nautobot_igp_models.utils import int_to_ospf_area, ospf_area_to_int
+
+ROUTER_LSA_HEADER_BYTES = 24
+ROUTER_LSA_LINK_BYTES = 12
+NETWORK_LSA_HEADER_BYTES = 24
+NETWORK_LSA_ROUTER_BYTES = 4
+
+# Network types that elect a designated router, so that a segment is represented by a network LSA; an unset
+# network type is broadcast on the Ethernet interfaces the app models
+DR_NETWORK_TYPES = {"broadcast", "non-broadcast", "", None}
+
+DEFAULT_AREA_THRESHOLDS = {
+    "routers": 200,
+    "links": 800,
+    "lsdb_bytes": 256 * 1024,
+    "spf_operations": 50000,
+}
+
+AREA_COLUMNS = [
+    "area",
+    "routers",
+    "interfaces",
+    "links",
+    "point_to_point_links",
+    "transit_links",
+    "router_lsas",
+    "router_lsa_bytes",
+    "network_lsas",
+    "network_lsa_bytes",
+    "lsdb_bytes",
+    "spf_operations",
+    "exceeded",
+]
+
+
+def area_thresholds():
+    """Return the per-area limits, with the ``ospf_area_thresholds`` setting overriding DEFAULT_AREA_THRESHOLDS."""
+    return {
+        **DEFAULT_AREA_THRESHOLDS,
+        **settings.PLUGINS_CONFIG.get("nautobot_igp_models", {}).get("ospf_area_thresholds", {}),
+    }
+
+
+def _link_area(row):
+    try:
+        area_a, area_b = ospf_area_to_int(row["a_area"]), ospf_area_to_int(row["b_area"])
+    except ValueError:
+        return None
+    return area_a if area_a == area_b else None
+
+
+def count_area_links(graph):
+    """Count the point-to-point and transit (DR-elected) links of each area of a compiled OSPF graph.
+
+    Returns:
+        dict: Area number -> {"point_to_point_links": int, "transit_links": int}. Links whose ends are in
+        different areas are not counted.
+    """
+    links = {}
+    for row in graph.links:
+        area = _link_area(row)
+        if area is None:
+            continue
+        counts = links.setdefault(area, {"point_to_point_links": 0, "transit_links": 0})
+        if row["a_network_type"] in DR_NETWORK_TYPES and row["b_network_type"] in DR_NETWORK_TYPES:
+            counts["transit_links"] += 1
+        else:
+            counts["point_to_point_links"] += 1
+    return links
+
+
+def estimate_area(routers, interfaces, point_to_point_links, transit_links):
+    """Estimate the LSDB size and SPF cost of one area from its router, interface and link counts."""
+    router_lsa_bytes = routers * ROUTER_LSA_HEADER_BYTES + ROUTER_LSA_LINK_BYTES * (
+        interfaces + 2 * point_to_point_links
+    )
+    network_lsa_bytes = transit_links * (NETWORK_LSA_HEADER_BYTES + 2 * NETWORK_LSA_ROUTER_BYTES)
+    vertices = routers + transit_links
+    # Each point-to-point link is an edge in both directions; each transit link joins two routers to its network
+    edges = 2 * point_to_point_links + 4 * transit_links
+    return {
+        "router_lsas": routers,
+        "router_lsa_bytes": router_lsa_bytes,
+        "network_lsas": transit_links,
+        "network_lsa_bytes": network_lsa_bytes,
+        "lsdb_bytes": router_lsa_bytes + network_lsa_bytes,
+        "spf_operations": round((vertices + edges) * math.log2(max(vertices, 2))),
+    }
+
+
+def analyze_ospf_areas(thresholds=None):
+    """Estimate the scaling figures of every OSPF area and flag those over the thresholds.
+
+    Args:
+        thresholds: Limits keyed by column name (default: ``area_thresholds()``).
+
+    Returns:
+        list: One dict per area with the AREA_COLUMNS keys, ordered by area; ``exceeded`` names the columns over
+        their threshold, joined with "; ".
+    """
+    if thresholds is None:
+        thresholds = area_thresholds()
+    links = count_area_links(compile_graph("OSPF"))
+    aggregates = (
+        OSPFInterfaceConfiguration.objects.filter(area_number__isnull=False)
+        .values("area_number")
+        .annotate(routers=Count("ospf_config__instance", distinct=True), interfaces=Count("pk"))
+        .order_by("area_number")
+    )
+    rows = []
+    for aggregate in aggregates:
+        area_links = links.get(aggregate["area_number"], {"point_to_point_links": 0, "transit_links": 0})
+        row = {
+            "area": int_to_ospf_area(aggregate["area_number"]),
+            "routers": aggregate["routers"],
+            "interfaces": aggregate["interfaces"],
+            "links": area_links["point_to_point_links"] + area_links["transit_links"],
+            **area_links,
+            **estimate_area(aggregate["routers"], aggregate["interfaces"], **area_links),
+        }
+        row["exceeded"] = "; ".join(
+            column for column, limit in thresholds.items() if limit is not None and row.get(column, 0) > limit
+        )
+        rows.append(row)
+    return rows
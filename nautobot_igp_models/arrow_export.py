@@ -0,0 +1,108 @@
+"""Export of the IGP topology as Apache Arrow IPC streams.
+
+The topology is written as two tables: ``nodes`` (one row per IGP routing instance) and ``edges`` (one row per cabled
+ISIS or OSPF adjacency, with the effective metric/cost of both ends). Rows are read from server-side cursors and
+written one record batch at a time, so memory use is bounded by the batch size rather than the topology size.
+
+``pyarrow`` is an optional dependency, installed with the ``arrow`` extra.
+"""
+
+import io
+
+from django.core.exceptions import ImproperlyConfigured
+
+from nautobot_igp_models.models import IGPRoutingInstance, ISISInterfaceConfiguration, OSPFInterfaceConfiguration
+from nautobot_igp_models.topology import (
+    DEFAULT_BATCH_SIZE,
+    EDGE_COLUMNS,
+    NODE_COLUMNS,
+    iter_edge_batches,
+    iter_node_batches,
+)
+
+TABLES = ("nodes", "edges")
+
+CONTENT_TYPE = "application/vnd.apache.arrow.stream"
+
+
+def import_pyarrow():
+    """Return the ``pyarrow`` module, or raise ImproperlyConfigured if it is not installed."""
+    try:
+        import pyarrow  # pylint: disable=import-outside-toplevel
+    except ImportError as error:
+        raise ImproperlyConfigured(
+            "Arrow topology export requires pyarrow; install nautobot-igp-models[arrow]"
+        ) from error
+    return pyarrow
+
+
+def table_schema(pa, table):
+    """Return the Arrow schema of ``table`` ("nodes" or "edges")."""
+    if table == "nodes":
+        types = {
+            "router_id_number": pa.uint32(),
+            "areas": pa.list_(pa.string()),
+            "nets": pa.list_(pa.string()),
+        }
+        columns = NODE_COLUMNS
+    else:
+        types = {"a_metric": pa.uint32(), "b_metric": pa.uint32()}
+        columns = EDGE_COLUMNS
+    return pa.schema([(column, types.get(column, pa.string())) for column in columns])
+
+
+def iter_table_batches(table, user=None, batch_size=DEFAULT_BATCH_SIZE):
+    """Yield lists of row dicts of ``table``, restricted to the objects ``user`` may view (if given)."""
+
+    def queryset(model):
+        queryset = model.objects.all()
+        return queryset.restrict(user, "view") if user is not None else queryset
+
+    if table == "nodes":
+        yield from iter_node_batches(queryset(IGPRoutingInstance), batch_size)
+    else:
+        yield from iter_edge_batches(queryset(ISISInterfaceConfiguration), batch_size)
+        yield from iter_edge_batches(queryset(OSPFInterfaceConfiguration), batch_size)
+
+
+def _write_options(pa):
+    if pa.Codec.is_available("zstd"):
+        return pa.ipc.IpcWriteOptions(compression="zstd")
+    return pa.ipc.IpcWriteOptions()
+
+
+def _iter_stream(table, sink, user, batch_size):
+    """Write ``table`` to ``sink``, yielding the running row count after the schema, each batch and the stream end."""
+    pa = import_pyarrow()
+    schema = table_schema(pa, table)
+    rows = 0
+    with pa.ipc.new_stream(sink, schema, options=_write_options(pa)) as writer:
+        yield rows
+        for batch in iter_table_batches(table, user, batch_size):
+            writer.write_batch(pa.RecordBatch.from_pylist(batch, schema=schema))
+            rows += len(batch)
+            yield rows
+    yield rows
+
+
+def write_table(table, sink, user=None, batch_size=DEFAULT_BATCH_SIZE):
+    """Write ``table`` to the binary file-like ``sink`` as an Arrow IPC stream.
+
+    Returns:
+        int: Number of rows written.
+    """
+    rows = 0
+    for rows in _iter_stream(table, sink, user, batch_size):
+        pass
+    return rows
+
+
+def iter_table_stream(table, user=None, batch_size=DEFAULT_BATCH_SIZE):
+    """Yield the Arrow IPC stream of ``table`` as bytes chunks, one per record batch (for streaming responses)."""
+    buffer = io.BytesIO()
+    for _ in _iter_stream(table, buffer, user, batch_size):
+        # The schema message is only written along with the first batch (or at the end of an empty stream)
+        if buffer.tell():
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
@@ -0,0 +1,161 @@
+"""Set-based consistency checks across the IGP dataset.
+
+Every check is a single SQL statement: GROUP BY/HAVING aggregates, or a query joining each cabled interface
+configuration to its peers on the same cable with correlated subqueries and filtering the mismatches in the
+database. The audit cost therefore does not grow with per-row queries or Python-side comparisons.
+"""
+
+from uuid import UUID
+
+from django.db.models import Count, F, OuterRef, Q, Subquery
+
+from nautobot_igp_models.models import (
+    IGPAuditReport,
+    IGPRoutingInstance,
+    ISISConfiguration,
+    ISISInterfaceConfiguration,
+    OSPFInterfaceConfiguration,
+)
+
+# Circuit types that form a Level-1 adjacency, which requires both ends to share an area
+ISIS_L1_CIRCUIT_TYPES = ("L1", "L1L2")
+
+
+def _rows(queryset):
+    """Evaluate a values() queryset into JSON-friendly dicts."""
+    return [{key: str(value) if isinstance(value, UUID) else value for key, value in row.items()} for row in queryset]
+
+
+def _cable_peer_mismatches(queryset, compared, labels):
+    """Return one row per cabled interface configuration whose peer disagrees on a ``compared`` value.
+
+    The peers of a configuration are the configurations of the same model on the other interfaces of its cable. The
+    values of the first peer with a higher primary key and a differing ``compared`` value are annotated with
+    correlated subqueries, and configurations without such a peer are filtered out, all in one query. A pair is
+    therefore reported once, from the end with the lower primary key.
+
+    Args:
+        queryset: Interface configuration queryset to audit.
+        compared (dict): Output alias -> lookup path of the values that must match on both ends.
+        labels (dict): Output alias -> lookup path of extra values to report for both ends.
+    """
+    paths = {"id": "pk", **labels, **compared}
+    differs = Q()
+    for path in compared.values():
+        differs |= ~Q(**{path: OuterRef(path)})
+    peers = (
+        queryset.model.objects.filter(differs, interface__cable=OuterRef("interface__cable"), pk__gt=OuterRef("pk"))
+        .exclude(interface=OuterRef("interface"))
+        .order_by("pk")
+    )
+    return (
+        queryset.filter(interface__cable__isnull=False)
+        .annotate(**{f"peer_{alias}": Subquery(peers.values(path)[:1]) for alias, path in paths.items()})
+        .filter(peer_id__isnull=False)
+        .order_by("interface__cable", "pk")
+        .values(
+            *(f"peer_{alias}" for alias in paths),
+            **{f"local_{alias}": F(path) for alias, path in paths.items()},
+        )
+    )
+
+
+def duplicate_router_ids():
+    """Router IDs used by instances on more than one device within the same VRF."""
+    return _rows(
+        IGPRoutingInstance.objects.filter(router_id__isnull=False)
+        .values(vrf_name=F("vrf__name"), router_id_host=F("router_id__host"))
+        .annotate(instance_count=Count("id"), device_count=Count("device", distinct=True))
+        .filter(device_count__gt=1)
+        .order_by("vrf_name", "router_id_host")
+    )
+
+
+def duplicate_system_ids():
+    """NETs (system_id) assigned to more than one ISIS configuration."""
+    return _rows(
+        ISISConfiguration.objects.exclude(system_id="")
+        .values("system_id")
+        .annotate(config_count=Count("id"))
+        .filter(config_count__gt=1)
+        .order_by("system_id")
+    )
+
+
+def isis_area_mismatches():
+    """Cabled ISIS Level-1 adjacencies whose instances sit in different areas.
+
+    Level-2-only circuits are excluded because L2 adjacencies form across area boundaries.
+    """
+    return _rows(
+        _cable_peer_mismatches(
+            ISISInterfaceConfiguration.objects.filter(circuit_type__in=ISIS_L1_CIRCUIT_TYPES),
+            compared={"isis_area": "isis_config__instance__isis_area"},
+            labels={"device": "interface__device__name", "interface": "interface__name"},
+        )
+    )
+
+
+def ospf_link_mismatches():
+    """Cabled OSPF links whose two ends disagree on area or network type."""
+    return _rows(
+        _cable_peer_mismatches(
+            OSPFInterfaceConfiguration.objects.all(),
+            compared={"area_number": "area_number", "network_type": "network_type"},
+            labels={"device": "interface__device__name", "interface": "interface__name", "area": "area"},
+        )
+    )
+
+
+def isis_device_mismatches():
+    """ISIS interface configurations whose interface or device is not on the ISIS instance's device."""
+    return _rows(
+        ISISInterfaceConfiguration.objects.filter(
+            ~Q(interface__device=F("isis_config__instance__device")) | ~Q(device=F("isis_config__instance__device"))
+        ).values(
+            "id",
+            "name",
+            interface_device=F("interface__device__name"),
+            instance_device=F("isis_config__instance__device__name"),
+        )
+    )
+
+
+def ospf_device_mismatches():
+    """OSPF interface configurations whose interface is not on the OSPF instance's device."""
+    return _rows(
+        OSPFInterfaceConfiguration.objects.exclude(interface__device=F("ospf_config__instance__device")).values(
+            "id",
+            "name",
+            interface_device=F("interface__device__name"),
+            instance_device=F("ospf_config__instance__device__name"),
+        )
+    )
+
+
+AUDIT_CHECKS = {
+    "duplicate_router_ids": duplicate_router_ids,
+    "duplicate_system_ids": duplicate_system_ids,
+    "isis_area_mismatches": isis_area_mismatches,
+    "ospf_link_mismatches": ospf_link_mismatches,
+    "isis_device_mismatches": isis_device_mismatches,
+    "ospf_device_mismatches": ospf_device_mismatches,
+}
+
+
+def run_audit(checks=None, save=True):
+    """Run the requested audit checks (all by default).
+
+    Args:
+        checks (list, optional): Names from AUDIT_CHECKS to run.
+        save (bool): Store the result as an IGPAuditReport.
+
+    Returns:
+        IGPAuditReport: The (saved or unsaved) report.
+    """
+    findings = {name: AUDIT_CHECKS[name]() for name in checks or AUDIT_CHECKS}
+    summary = {name: len(rows) for name, rows in findings.items()}
+    report = IGPAuditReport(total_findings=sum(summary.values()), summary=summary, findings=findings)
+    if save:
+        report.save()
+    return report
@@ -0,0 +1,242 @@
+"""Reference bandwidth auto-cost: ISIS metrics and OSPF costs derived from interface speeds.
+
+The cost of an interface is the reference bandwidth divided by its speed, rounded down and clamped to the range of
+the protocol's metric. The speed is the interface's ``speed`` field, or else the rate in its type (``10gbase-x-sfpp``
+is 10 Gbps); interfaces with neither keep their current value.
+
+The reference bandwidth of an ISIS/OSPF configuration is its ``reference_bandwidth`` field, or else the value given
+to ``auto_cost()``, or else the ``reference_bandwidth_mbps`` setting. All interface configurations in scope are read
+with one query, their costs computed in one pass, and the changes written with one ``bulk_update`` per model:
+
+- ``target="interface"`` sets the cost of every interface configuration as an explicit override;
+- ``target="default"`` sets the configuration default to the most common cost of its interfaces and keeps overrides
+  only on the interfaces whose cost differs from it.
+"""
+
+import logging
+import re
+from collections import Counter
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from nautobot_igp_models import cache
+from nautobot_igp_models.inheritance import resolve_effective_configs, with_inheritance_related
+from nautobot_igp_models.models import ISISConfiguration, OSPFConfiguration
+from nautobot_igp_models.topology import PROTOCOL_MODELS
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REFERENCE_BANDWIDTH_MBPS = 100_000
+DEFAULT_BATCH_SIZE = 1000
+
+TARGETS = ("interface", "default")
+
+# Per protocol: configuration model, interface configuration foreign key, interface field, configuration default
+# field and highest value (24-bit ISIS wide metrics, 16-bit OSPF costs)
+PROTOCOL_FIELDS = {
+    "ISIS": (ISISConfiguration, "isis_config", "metric", "default_metric", 16_777_215),
+    "OSPF": (OSPFConfiguration, "ospf_config", "cost", "default_cost", 65_535),
+}
+
+AUTOCOST_COLUMNS = [
+    "protocol",
+    "device",
+    "configuration",
+    "interface",
+    "speed_mbps",
+    "field",
+    "current",
+    "proposed",
+]
+
+# Rate in an interface type: "1000base-t" -> 1000 Mbps, "2.5gbase-t" -> 2.5 Gbps
+INTERFACE_TYPE_SPEED_RE = re.compile(r"^(\d+(?:\.\d+)?)(g?)base-")
+
+KBPS_PER_MBPS = 1000
+
+
+class AutoCostResult:
+    """Outcome of an auto-cost run."""
+
+    def __init__(self):
+        """Initialize empty counters."""
+        self.rows = []
+        self.unchanged = 0
+        self.skipped = []
+
+    @property
+    def updated(self):
+        """Number of configurations and interface configurations changed."""
+        return len(self.rows)
+
+
+def reference_bandwidth_setting():
+    """Return the ``reference_bandwidth_mbps`` setting, in Mbps."""
+    return settings.PLUGINS_CONFIG.get("nautobot_igp_models", {}).get(
+        "reference_bandwidth_mbps", DEFAULT_REFERENCE_BANDWIDTH_MBPS
+    )
+
+
+def interface_speed_kbps(speed, interface_type):
+    """Return the speed of an interface in Kbps from its ``speed`` field or type, or None if unknown."""
+    if speed:
+        return speed
+    match = INTERFACE_TYPE_SPEED_RE.match(interface_type or "")
+    if not match:
+        return None
+    mbps = float(match.group(1)) * (1000 if match.group(2) else 1)
+    return round(mbps * KBPS_PER_MBPS)
+
+
+def compute_cost(reference_mbps, speed_kbps, maximum):
+    """Return ``reference / speed`` rounded down, clamped to 1..maximum."""
+    return max(1, min(maximum, reference_mbps * KBPS_PER_MBPS // speed_kbps))
+
+
+def _most_common(costs):
+    """Return the most common cost, the lowest one on ties."""
+    counts = Counter(costs)
+    return min(counts, key=lambda cost: (-counts[cost], cost))
+
+
+def auto_cost(
+    protocol,
+    queryset=None,
+    target="interface",
+    reference_bandwidth=None,
+    dry_run=False,
+    batch_size=DEFAULT_BATCH_SIZE,
+):
+    """Compute, and unless ``dry_run`` write, reference bandwidth costs for the interfaces of ``protocol``.
+
+    Args:
+        protocol: "ISIS" or "OSPF".
+        queryset: ISIS/OSPF configurations whose interfaces are updated (default: all).
+        target: "interface" or "default" (see the module docstring).
+        reference_bandwidth: Reference bandwidth in Mbps for configurations without their own.
+        dry_run: Compute the changes without writing.
+        batch_size: Rows per ``bulk_update`` statement.
+
+    Returns:
+        AutoCostResult: ``rows`` holds one AUTOCOST_COLUMNS dict per change, configurations first.
+    """
+    if target not in TARGETS:
+        raise ValueError(f"Unknown auto-cost target {target!r}; expected one of {', '.join(TARGETS)}")
+    config_model, config_field, field, default_field, maximum = PROTOCOL_FIELDS[protocol]
+    interface_model = PROTOCOL_MODELS[protocol]
+    fallback_reference = reference_bandwidth or reference_bandwidth_setting()
+
+    interface_configs = interface_model.objects.all()
+    if queryset is not None:
+        interface_configs = interface_configs.filter(**{f"{config_field}__in": queryset})
+    rows = interface_configs.values_list(
+        "pk",
+        f"{config_field}_id",
+        f"{config_field}__name",
+        "interface__device__name",
+        "interface__name",
+        "interface__speed",
+        "interface__type",
+        field,
+        f"{config_field}__{default_field}",
+        f"{config_field}__reference_bandwidth",
+    ).order_by(f"{config_field}_id", "interface__device__name", "interface__name")
+
+    result = AutoCostResult()
+    configs = {}
+    interfaces = []
+    for pk, config_pk, config_name, device, interface, speed, interface_type, current, default, reference in rows:
+        configs.setdefault(config_pk, {"name": config_name, "device": device, "default": default, "costs": []})
+        speed_kbps = interface_speed_kbps(speed, interface_type)
+        cost = compute_cost(reference or fallback_reference, speed_kbps, maximum) if speed_kbps else None
+        if cost is None:
+            result.skipped.append(pk)
+        else:
+            configs[config_pk]["costs"].append(cost)
+        interfaces.append((pk, config_pk, device, interface, speed_kbps, current, cost))
+
+    now = timezone.now()
+    config_updates = []
+    if target == "default":
+        for config_pk, config in configs.items():
+            new_default = _most_common(config["costs"]) if config["costs"] else config["default"]
+            config["new_default"] = new_default
+            if new_default == config["default"]:
+                result.unchanged += 1
+                continue
+            config_updates.append(config_model(pk=config_pk, last_updated=now, **{default_field: new_default}))
+            result.rows.append(
+                {
+                    "protocol": protocol,
+                    "device": config["device"],
+                    "configuration": config["name"],
+                    "interface": "",
+                    "speed_mbps": None,
+                    "field": default_field,
+                    "current": config["default"],
+                    "proposed": new_default,
+                }
+            )
+
+    # Interfaces of unknown speed that inherit a changed default keep their effective cost as an override. Without a
+    # configuration default that cost comes from the device config context or the global default, resolved in one batch.
+    pinned = {
+        pk
+        for pk, config_pk, _, _, _, current, cost in interfaces
+        if target == "default"
+        and cost is None
+        and current is None
+        and configs[config_pk]["new_default"] != configs[config_pk]["default"]
+    }
+    inherited = [pk for pk, config_pk, *_ in interfaces if pk in pinned and configs[config_pk]["default"] is None]
+    effective = (
+        resolve_effective_configs(with_inheritance_related(interface_model.objects.filter(pk__in=inherited)))
+        if inherited
+        else {}
+    )
+
+    interface_updates = []
+    for pk, config_pk, device, interface, speed_kbps, current, cost in interfaces:
+        config = configs[config_pk]
+        if cost is None:
+            if pk not in pinned:
+                continue
+            proposed = config["default"] if config["default"] is not None else effective[pk][field]
+        elif target == "default" and cost == config["new_default"]:
+            proposed = None
+        else:
+            proposed = cost
+        if proposed == current:
+            result.unchanged += 1
+            continue
+        interface_updates.append(interface_model(pk=pk, last_updated=now, **{field: proposed}))
+        result.rows.append(
+            {
+                "protocol": protocol,
+                "device": device,
+                "configuration": config["name"],
+                "interface": interface,
+                "speed_mbps": speed_kbps / KBPS_PER_MBPS if speed_kbps else None,
+                "field": field,
+                "current": current,
+                "proposed": proposed,
+            }
+        )
+
+    if not dry_run and (config_updates or interface_updates):
+        with transaction.atomic():
+            config_model.objects.bulk_update(config_updates, [default_field, "last_updated"], batch_size=batch_size)
+            interface_model.objects.bulk_update(interface_updates, [field, "last_updated"], batch_size=batch_size)
+        cache.bump_objects(config_model, [config.pk for config in config_updates])
+        cache.bump_objects(interface_model, [interface_config.pk for interface_config in interface_updates])
+    logger.info(
+        "%s auto-cost: %d updated, %d unchanged, %d skipped%s",
+        protocol,
+        result.updated,
+        result.unchanged,
+        len(result.skipped),
+        " (dry run)" if dry_run else "",
+    )
+    return result
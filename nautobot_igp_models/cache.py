@@ -0,0 +1,131 @@
+"""Cache of resolved effective interface configuration and device config contexts.
+
+Entries are never deleted. Every key embeds generation counters of the objects the cached value depends on, and
+invalidation bumps a counter so that subsequent lookups build a new key. Stale entries simply expire. This works
+the same with any Django cache backend (LocMem in tests, Redis in production) and never needs a key scan.
+
+Generations:
+    - ``device:<pk>``: the device config context (local context data, or a config context that applies to it)
+    - ``<model>:<pk>``: an interface configuration, or the ISIS/OSPF configuration whose defaults it inherits
+    - ``topology``: whole-topology analyses (routing instances, interface configurations, cables, devices and
+      config contexts)
+    - ``global``: everything; bumped when the devices affected by a change cannot be determined
+"""
+
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+KEY_PREFIX = "nautobot_igp_models:effective"
+
+DEFAULT_TIMEOUT = 300
+
+
+def cache_timeout():
+    """Return the configured entry lifetime in seconds; 0 disables the cache."""
+    return settings.PLUGINS_CONFIG.get("nautobot_igp_models", {}).get("effective_config_cache_timeout", DEFAULT_TIMEOUT)
+
+
+def cache_enabled():
+    """Return whether effective configuration caching is enabled."""
+    return bool(cache_timeout())
+
+
+TOPOLOGY_SCOPE = "topology"
+
+
+def _generation_key(scope):
+    return f"{KEY_PREFIX}:gen:{scope}"
+
+
+def device_scope(device_pk):
+    """Generation scope of a device's config context."""
+    return f"device:{device_pk}"
+
+
+def object_scope(obj_or_model, pk=None):
+    """Generation scope of a model instance (or of a model class and pk)."""
+    if pk is None:
+        obj_or_model, pk = type(obj_or_model), obj_or_model.pk
+    return f"{obj_or_model._meta.label_lower}:{pk}"
+
+
+def get_generations(scopes):
+    """Return the current generation of each scope, initializing missing ones.
+
+    Missing generations start at the current time in nanoseconds rather than at 1, so that a generation counter
+    evicted by the cache backend can never be reinitialized to a value an older entry was stored under.
+    """
+    scopes = set(scopes) | {"global"}
+    keys = {_generation_key(scope): scope for scope in scopes}
+    found = cache.get_many(list(keys))
+    for key in set(keys) - set(found):
+        cache.add(key, time.time_ns(), timeout=None)
+        found[key] = cache.get(key)
+    return {scope: found[key] for key, scope in keys.items()}
+
+
+def bump(*scopes):
+    """Invalidate every cache entry depending on any of ``scopes``."""
+    for scope in scopes:
+        key = _generation_key(scope)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.add(key, time.time_ns(), timeout=None)
+
+
+def bump_objects(model, pks):
+    """Invalidate the entries depending on objects written without signals (``bulk_update()``, ``update()``).
+
+    Whole-topology analyses are invalidated as well.
+    """
+    bump(*(object_scope(model, pk) for pk in pks), TOPOLOGY_SCOPE)
+
+
+def bump_all():
+    """Invalidate every cache entry."""
+    bump("global")
+
+
+def _entry_key(kind, scopes, generations):
+    versions = ".".join(str(generations[scope]) for scope in ("global", *scopes))
+    return f"{KEY_PREFIX}:{kind}:{scopes[0]}:{versions}"
+
+
+def config_context_key(device_pk, generations):
+    """Cache key of a device config context."""
+    return _entry_key("context", [device_scope(device_pk)], generations)
+
+
+def topology_key(kind, generations):
+    """Cache key of a whole-topology analysis result."""
+    return _entry_key(kind, [TOPOLOGY_SCOPE], generations)
+
+
+def interface_config_scopes(interface_config, device_pk):
+    """Generation scopes an interface configuration's effective configuration depends on."""
+    protocol_config_field = "isis_config" if hasattr(interface_config, "isis_config_id") else "ospf_config"
+    protocol_config_model = type(interface_config)._meta.get_field(protocol_config_field).related_model
+    return [
+        object_scope(interface_config),
+        object_scope(protocol_config_model, getattr(interface_config, f"{protocol_config_field}_id")),
+        device_scope(device_pk),
+    ]
+
+
+def effective_config_key(interface_config, device_pk, generations):
+    """Cache key of an interface configuration's effective configuration."""
+    return _entry_key("config", interface_config_scopes(interface_config, device_pk), generations)
+
+
+def get_many(keys):
+    """Fetch cache entries by key."""
+    return cache.get_many(keys)
+
+
+def set_many(entries):
+    """Store cache entries with the configured timeout."""
+    if entries:
+        cache.set_many(entries, timeout=cache_timeout())
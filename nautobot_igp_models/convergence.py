@@ -0,0 +1,204 @@
+"""Worst-case failure detection and convergence time estimates from effective (inherited) timers.
+
+A neighbor failure is detected by BFD when both ends of the adjacency run it, otherwise by the IGP hold time (ISIS
+``hello_interval * hello_multiplier``, OSPF ``dead_interval``). BFD settings are read from the vendor blocks of the
+``igp.isis`` / ``igp.ospf`` config context, which the effective configuration carries along. Convergence adds a fixed
+allowance for flooding, SPF and FIB update to the detection time. Every cabled interface of a protocol is resolved in
+one pass through ``timers.cabled_effective_configs()``.
+"""
+
+from statistics import median
+
+from django.conf import settings
+
+from nautobot_igp_models.timers import cabled_effective_configs
+from nautobot_igp_models.topology import PROTOCOL_MODELS, iter_cabled_pairs
+
+DEFAULT_CONVERGENCE_ALLOWANCE_MS = 1000
+
+# An adjacency is an outlier when its convergence time exceeds this multiple of the protocol median
+DEFAULT_OUTLIER_FACTOR = 2
+
+# Vendor config context block -> (BFD key, transmit interval key, receive interval key)
+BFD_VENDOR_KEYS = {
+    "cisco": ("bfd", "interval", "min_rx"),
+    "juniper": ("bfd_liveness_detection", "minimum_interval", "minimum_receive_interval"),
+    "nokia": ("bfd", "interval", None),
+    "arista": ("bfd", None, None),
+}
+
+# Used when a BFD block leaves out the interval or multiplier (Arista only has an on/off flag)
+DEFAULT_BFD_INTERVAL_MS = 300
+DEFAULT_BFD_MULTIPLIER = 3
+
+ADJACENCY_COLUMNS = [
+    "protocol",
+    "a_device",
+    "a_interface",
+    "b_device",
+    "b_interface",
+    "a_hold_ms",
+    "b_hold_ms",
+    "a_bfd_ms",
+    "b_bfd_ms",
+    "detection",
+    "detection_ms",
+    "convergence_ms",
+    "outlier",
+    "notes",
+]
+
+DEVICE_COLUMNS = [
+    "protocol",
+    "device",
+    "adjacencies",
+    "bfd_adjacencies",
+    "worst_interface",
+    "worst_detection_ms",
+    "worst_convergence_ms",
+    "outliers",
+]
+
+
+def convergence_allowance():
+    """Return the time in milliseconds added to failure detection for flooding, SPF and FIB update."""
+    return settings.PLUGINS_CONFIG.get("nautobot_igp_models", {}).get(
+        "convergence_allowance_ms", DEFAULT_CONVERGENCE_ALLOWANCE_MS
+    )
+
+
+def hold_time_ms(protocol, effective):
+    """Return the IGP hold (dead) time in milliseconds of an effective interface configuration, or None if unset."""
+    if protocol == "ISIS":
+        if effective.get("hello_interval") is None or effective.get("hello_multiplier") is None:
+            return None
+        return effective["hello_interval"] * effective["hello_multiplier"] * 1000
+    if effective.get("dead_interval") is None:
+        return None
+    return effective["dead_interval"] * 1000
+
+
+def bfd_detection_ms(effective):
+    """Return the BFD detection time in milliseconds configured in the vendor blocks of an effective configuration.
+
+    The slower of the transmit and receive intervals is used, as the negotiated interval is never faster. Returns
+    None when no vendor block enables BFD.
+    """
+    detection = None
+    for vendor, (bfd_key, interval_key, receive_key) in BFD_VENDOR_KEYS.items():
+        bfd = (effective.get(vendor) or {}).get(bfd_key)
+        if isinstance(bfd, bool):
+            bfd = {"enabled": bfd}
+        if not isinstance(bfd, dict) or not bfd.get("enabled", True):
+            continue
+        interval = max(
+            (bfd[key] for key in (interval_key, receive_key) if key and bfd.get(key)),
+            default=DEFAULT_BFD_INTERVAL_MS,
+        )
+        vendor_detection = interval * (bfd.get("multiplier") or DEFAULT_BFD_MULTIPLIER)
+        detection = vendor_detection if detection is None else min(detection, vendor_detection)
+    return detection
+
+
+def _max_known(*values):
+    return max((value for value in values if value is not None), default=None)
+
+
+def _adjacency_row(protocol, side_a, side_b, config_a, config_b, allowance):
+    row = {
+        "protocol": protocol,
+        "a_device": side_a.interface.device.name,
+        "a_interface": side_a.interface.name,
+        "b_device": side_b.interface.device.name,
+        "b_interface": side_b.interface.name,
+        "a_hold_ms": hold_time_ms(protocol, config_a),
+        "b_hold_ms": hold_time_ms(protocol, config_b),
+        "a_bfd_ms": bfd_detection_ms(config_a),
+        "b_bfd_ms": bfd_detection_ms(config_b),
+        "outlier": False,
+        "notes": [],
+    }
+    if row["a_bfd_ms"] is not None and row["b_bfd_ms"] is not None:
+        row["detection"] = "bfd"
+        row["detection_ms"] = max(row["a_bfd_ms"], row["b_bfd_ms"])
+    else:
+        row["detection"] = "hold"
+        row["detection_ms"] = _max_known(row["a_hold_ms"], row["b_hold_ms"])
+        if row["a_bfd_ms"] is not None or row["b_bfd_ms"] is not None:
+            row["outlier"] = True
+            row["notes"].append("BFD is only enabled on one end")
+    row["convergence_ms"] = None if row["detection_ms"] is None else row["detection_ms"] + allowance
+    return row
+
+
+def _flag_outliers(rows, outlier_factor):
+    known = [row["convergence_ms"] for row in rows if row["convergence_ms"] is not None]
+    if not known:
+        return
+    threshold = median(known) * outlier_factor
+    for row in rows:
+        if row["convergence_ms"] is not None and row["convergence_ms"] > threshold:
+            row["outlier"] = True
+            row["notes"].append(f"convergence exceeds {outlier_factor}x the {row['protocol']} median")
+
+
+def _device_rows(rows):
+    devices = {}
+    for row in rows:
+        for side in "ab":
+            device = devices.setdefault(
+                (row["protocol"], row[f"{side}_device"]),
+                {
+                    "protocol": row["protocol"],
+                    "device": row[f"{side}_device"],
+                    "adjacencies": 0,
+                    "bfd_adjacencies": 0,
+                    "worst_interface": None,
+                    "worst_detection_ms": None,
+                    "worst_convergence_ms": None,
+                    "outliers": 0,
+                },
+            )
+            device["adjacencies"] += 1
+            device["bfd_adjacencies"] += row["detection"] == "bfd"
+            device["outliers"] += row["outlier"]
+            if row["convergence_ms"] is not None and (
+                device["worst_convergence_ms"] is None or row["convergence_ms"] > device["worst_convergence_ms"]
+            ):
+                device["worst_interface"] = row[f"{side}_interface"]
+                device["worst_detection_ms"] = row["detection_ms"]
+                device["worst_convergence_ms"] = row["convergence_ms"]
+    return sorted(devices.values(), key=lambda device: (device["protocol"], device["device"]))
+
+
+def estimate_convergence(protocols=None, user=None, outlier_factor=DEFAULT_OUTLIER_FACTOR):
+    """Estimate worst-case failure detection and convergence time of every cabled IGP adjacency.
+
+    Args:
+        protocols: Protocols to include ("ISIS", "OSPF"; default: both).
+        user: Only include interface configurations this user may view (default: all).
+        outlier_factor: Flag adjacencies converging slower than this multiple of their protocol's median. Adjacencies
+            with BFD on only one end are always flagged.
+
+    Returns:
+        dict: ``{"adjacencies": [...], "devices": [...]}`` with ADJACENCY_COLUMNS and DEVICE_COLUMNS rows. The
+        ``notes`` of adjacency rows are joined with "; ".
+    """
+    allowance = convergence_allowance()
+    adjacencies = []
+    for protocol in protocols or PROTOCOL_MODELS:
+        model = PROTOCOL_MODELS[protocol]
+        queryset = model.objects.all().restrict(user, "view") if user is not None else None
+        interface_configs, effective = cabled_effective_configs(model, queryset=queryset)
+        rows = [
+            _adjacency_row(protocol, side_a, side_b, effective[side_a.pk], effective[side_b.pk], allowance)
+            for side_a, side_b in iter_cabled_pairs(interface_configs)
+        ]
+        _flag_outliers(rows, outlier_factor)
+        adjacencies.extend(rows)
+
+    devices = _device_rows(adjacencies)
+    for row in adjacencies:
+        row["notes"] = "; ".join(row["notes"])
+    adjacencies.sort(key=lambda row: (-(row["convergence_ms"] or 0), row["a_device"], row["a_interface"]))
+    return {"adjacencies": adjacencies, "devices": devices}
@@ -0,0 +1,194 @@
+"""Failure impact simulation on the compiled IGP graph.
+
+For every source node the baseline SPF is computed once. A failure (one link, or a group of links that fail
+together) can only change routes from that source if one of its links is on the source's shortest path DAG, and then
+only towards DAG descendants left without any intact shortest path; only those nodes are recomputed, incrementally. Sources are
+spread over a process pool, each worker holding its own copy of the graph.
+"""
+
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+
+from nautobot_igp_models.graph import (
+    INFINITY,
+    compile_graph,
+    failure_affected,
+    incremental_shortest_paths,
+    shortest_path_dag,
+    shortest_paths,
+)
+
+logger = logging.getLogger(__name__)
+
+# Per failure: sources with affected routes, (source, destination) pairs that lose reachability, pairs whose cost
+# increases, and pairs moved to another path of the same cost
+IMPACT_FIELDS = ("affected_sources", "lost_pairs", "cost_increased_pairs", "rerouted_pairs")
+
+LINK_IMPACT_COLUMNS = [
+    "rank",
+    "protocol",
+    "cable_id",
+    "a_device",
+    "a_interface",
+    "b_device",
+    "b_interface",
+    *IMPACT_FIELDS,
+]
+
+# Below this many nodes the process pool start-up costs more than it saves
+MIN_PARALLEL_NODES = 200
+
+_worker_state = {}
+
+
+def index_failures(failures):
+    """Return (failures as frozensets of link indexes, {link: [indexes of the failures containing it]})."""
+    failures = [frozenset(failure) for failure in failures]
+    failures_by_link = {}
+    for failure_index, failure in enumerate(failures):
+        for link in failure:
+            failures_by_link.setdefault(link, []).append(failure_index)
+    return failures, failures_by_link
+
+
+def source_impact(graph, failures, failures_by_link, source):
+    """Evaluate from one source every failure that touches its shortest path DAG.
+
+    Args:
+        graph: IGPGraph.
+        failures (list): Frozensets of link indexes that fail together, as returned by ``index_failures()``.
+        failures_by_link (dict): Link index -> indexes of the failures containing it.
+        source (int): Source node index.
+
+    Returns:
+        dict: Failure index -> list of IMPACT_FIELDS counts, for failures that affect this source.
+    """
+    distance, predecessors, rank = shortest_paths(graph, source)
+    children, link_heads = shortest_path_dag(predecessors)
+    impact = {}
+    for failure_index in {index for link in link_heads for index in failures_by_link.get(link, ())}:
+        failed_links = failures[failure_index]
+        heads = [head for link in failed_links for head in link_heads.get(link, ())]
+        affected, rerouted = failure_affected(predecessors, children, rank, heads, failed_links)
+        new_distance = incremental_shortest_paths(graph, distance, affected, failed_links)
+        counts = [1, 0, 0, len(rerouted)]
+        for node, node_distance in new_distance.items():
+            if node_distance == INFINITY:
+                counts[1] += 1
+            elif node_distance > distance[node]:
+                counts[2] += 1
+            else:
+                counts[3] += 1
+        impact[failure_index] = counts
+    return impact
+
+
+def _init_worker(graph, failures):
+    _worker_state["graph"] = graph
+    _worker_state["failures"], _worker_state["failures_by_link"] = index_failures(failures)
+
+
+def _sources_impact(sources):
+    graph, failures, failures_by_link = (
+        _worker_state["graph"],
+        _worker_state["failures"],
+        _worker_state["failures_by_link"],
+    )
+    totals = {}
+    for source in sources:
+        for failure_index, counts in source_impact(graph, failures, failures_by_link, source).items():
+            total = totals.setdefault(failure_index, [0, 0, 0, 0])
+            for position, count in enumerate(counts):
+                total[position] += count
+    return totals
+
+
+def default_workers():
+    """Number of worker processes to use by default (one per CPU)."""
+    return os.cpu_count() or 1
+
+
+@contextmanager
+def worker_pool(workers, initializer, initargs):
+    """Yield a ProcessPoolExecutor of ``workers`` processes, or None when the work must run in-process.
+
+    None is yielded for a single worker and in daemonic processes, such as the children of Celery's default prefork
+    pool: multiprocessing does not let them start children, which would be orphaned if Celery killed the task (time
+    limit, worker shutdown), and every prefork child would start one process per CPU. Run the Celery worker with
+    ``--pool threads`` or ``--pool solo`` to use the process pool from Jobs.
+    """
+    if workers <= 1:
+        yield None
+    elif multiprocessing.current_process().daemon:
+        logger.warning(
+            "Running in-process: the current process is daemonic (Celery prefork pool); "
+            "use a threads or solo worker pool for parallel evaluation"
+        )
+        yield None
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=initargs) as pool:
+            yield pool
+
+
+def simulate_failures(graph, failures, workers=None):
+    """Compute the impact of each failure over all (source, destination) pairs.
+
+    Args:
+        graph: IGPGraph.
+        failures (list): Tuples of link indexes that fail together.
+        workers: Worker processes (default: one per CPU). Runs in-process for 1 worker, small graphs, or in a
+            daemonic process (see worker_pool()).
+
+    Returns:
+        list: Per failure, a dict of IMPACT_FIELDS counts.
+    """
+    workers = workers or default_workers()
+    chunks = [range(start, len(graph), workers * 4) for start in range(workers * 4)]
+    with worker_pool(workers if len(graph) >= MIN_PARALLEL_NODES else 1, _init_worker, (graph, failures)) as pool:
+        if pool is None:
+            _init_worker(graph, failures)
+            results = [_sources_impact(range(len(graph)))]
+        else:
+            results = list(pool.map(_sources_impact, chunks))
+
+    totals = [[0, 0, 0, 0] for _ in failures]
+    for result in results:
+        for failure_index, counts in result.items():
+            for position, count in enumerate(counts):
+                totals[failure_index][position] += count
+    return [dict(zip(IMPACT_FIELDS, counts, strict=True)) for counts in totals]
+
+
+def impact_sort_key(row):
+    """Sort key ranking failures by lost, then cost-increased, then rerouted pairs (highest first)."""
+    return (-row["lost_pairs"], -row["cost_increased_pairs"], -row["rerouted_pairs"])
+
+
+def link_failure_impact(protocol, area=None, workers=None):
+    """Rank the cabled links of ``protocol`` by the impact of their individual failure.
+
+    Returns:
+        list: One dict per link with the LINK_IMPACT_COLUMNS keys, most impactful first.
+    """
+    graph = compile_graph(protocol, area=area)
+    logger.info("%s graph: %d nodes, %d links", protocol, len(graph), len(graph.links))
+    impacts = simulate_failures(graph, [(link,) for link in range(len(graph.links))], workers=workers)
+    rows = [
+        {
+            "protocol": protocol,
+            "cable_id": link["cable_id"],
+            "a_device": link["a_device"],
+            "a_interface": link["a_interface"],
+            "b_device": link["b_device"],
+            "b_interface": link["b_interface"],
+            **impact,
+        }
+        for link, impact in zip(graph.links, impacts, strict=True)
+    ]
+    rows.sort(key=impact_sort_key)
+    for rank, row in enumerate(rows, start=1):
+        row["rank"] = rank
+    return rows
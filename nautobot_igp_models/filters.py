@@ -35,10 +35,20 @@ class ISISConfigurationFilterSet(NautobotFilterSet, StatusModelFilterSetMixin):
         label="IGP Instance (Device Name)",
     )
     system_id = django_filters.CharFilter(lookup_expr="exact", label="System ID")
+    lsp_id = django_filters.CharFilter(method="filter_lsp_id", label="System ID, LAN ID or LSP ID")
+
+    def filter_lsp_id(self, queryset, name, value):
+        """Match the 6-byte System ID of a System ID, LAN ID or LSP ID using the indexed integer column."""
+        if not value:
+            return queryset
+        try:
+            return queryset.for_system_id(value)
+        except ValueError:
+            return queryset.none()
 
     class Meta:
         model = models.ISISConfiguration
-        fields = ["id", "instance", "system_id", "status"]
+        fields = ["id", "instance", "system_id", "auto_net", "status"]
 
 
 class ISISInterfaceConfigurationFilterSet(NautobotFilterSet, StatusModelFilterSetMixin):
@@ -84,10 +94,41 @@ class OSPFConfigurationFilterSet(NautobotFilterSet):
 class OSPFInterfaceConfigurationFilterSet(NautobotFilterSet):
     ospf_config_name = django_filters.CharFilter(lookup_expr="exact", label="OSPF Configuration")
     interface = django_filters.CharFilter(lookup_expr="exact", label="Interface")
-    area = django_filters.CharFilter(lookup_expr="exact", label="OSPF Area")
+    area = django_filters.CharFilter(method="filter_area", label="OSPF Area")
+    area_min = django_filters.CharFilter(method="filter_area_range", label="OSPF Area (minimum)")
+    area_max = django_filters.CharFilter(method="filter_area_range", label="OSPF Area (maximum)")
     network_type = django_filters.CharFilter(lookup_expr="exact", label="Network Type")
     cost = django_filters.NumberFilter(lookup_expr="exact", label="Cost")
 
+    def filter_area(self, queryset, name, value):
+        """Match the area numerically, so that "0", "0.0.0.0" and "00.0.0.0" are equal."""
+        if not value:
+            return queryset
+        try:
+            return queryset.in_area(value)
+        except ValueError:
+            return queryset.none()
+
+    def filter_area_range(self, queryset, name, value):
+        """Apply an inclusive lower (area_min) or upper (area_max) bound on the numeric area."""
+        if not value:
+            return queryset
+        bound = {"minimum": value} if name == "area_min" else {"maximum": value}
+        try:
+            return queryset.in_area_range(**bound)
+        except ValueError:
+            return queryset.none()
+
     class Meta:
         model = models.OSPFInterfaceConfiguration
-        fields = ["id", "ospf_config_name", "interface", "area", "network_type", "cost", "status"]
+        fields = [
+            "id",
+            "ospf_config_name",
+            "interface",
+            "area",
+            "area_min",
+            "area_max",
+            "network_type",
+            "cost",
+            "status",
+        ]
@@ -0,0 +1,233 @@
+"""ISIS level-1 and level-2 flooding domains.
+
+An interface takes part in level 1 when its circuit type is L1 or L1L2, and in level 2 when it is L2 or L1L2. Two
+routing instances form a level-2 adjacency over a cable when both ends take part in level 2, and a level-1 adjacency
+when both ends take part in level 1 and the instances share an ISIS area. The flooding domains of a level are the
+connected components of its adjacency graph, found with a union-find over the adjacency arrays.
+
+A level-1 domain is left without an exit (an island) when none of its routers has a level-2 adjacency, so no router
+sets the attached bit and its routers cannot reach anything outside the domain. The link state database of a domain
+is estimated from the LSPs its routers originate (see ``lsp_size()``).
+
+Circuit types and ISIS areas are database fields, not inherited settings, so the whole analysis runs on two queries.
+Its result is cached until a routing instance, interface configuration, cable or device changes.
+"""
+
+import math
+from itertools import combinations, groupby
+from operator import itemgetter
+
+from django.db.models import Count, F, Q
+
+from nautobot_igp_models import cache
+from nautobot_igp_models.models import ISISInterfaceConfiguration
+from nautobot_igp_models.topology import cabled
+
+LEVEL_CIRCUIT_TYPES = {"L1": ("L1", "L1L2"), "L2": ("L2", "L1L2")}
+
+LSP_HEADER_BYTES = 27
+TLV_HEADER_BYTES = 2
+TLV_MAX_BYTES = 255
+# Extended IS reachability (TLV 22): system ID and pseudonode, 3 byte metric, sub-TLV length
+IS_REACH_ENTRY_BYTES = 11
+# Extended IP reachability (TLV 135): 4 byte metric, control byte, up to 4 prefix bytes
+IP_REACH_ENTRY_BYTES = 9
+# Default maximum LSP size; larger databases are split into fragments
+LSP_MTU_BYTES = 1492
+
+DOMAIN_COLUMNS = [
+    "level",
+    "domain",
+    "areas",
+    "routers",
+    "adjacencies",
+    "exits",
+    "island",
+    "lsp_count",
+    "lsdb_bytes",
+]
+
+
+class UnionFind:
+    """Disjoint sets over the integers ``0..size-1`` with path halving and union by size."""
+
+    def __init__(self, size):
+        """Start with every element in its own set."""
+        self.parent = list(range(size))
+        self.size = [1] * size
+
+    def find(self, element):
+        """Return the representative of the set containing ``element``."""
+        parent = self.parent
+        while parent[element] != element:
+            parent[element] = parent[parent[element]]
+            element = parent[element]
+        return element
+
+    def union(self, element_a, element_b):
+        """Merge the sets containing the two elements."""
+        root_a, root_b = self.find(element_a), self.find(element_b)
+        if root_a == root_b:
+            return
+        if self.size[root_a] < self.size[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        self.size[root_a] += self.size[root_b]
+
+
+def _tlv_bytes(entries, entry_bytes):
+    per_tlv = (TLV_MAX_BYTES // entry_bytes) or 1
+    return entries * entry_bytes + TLV_HEADER_BYTES * math.ceil(entries / per_tlv)
+
+
+def lsp_size(area, hostname, neighbors, prefixes):
+    """Estimate the bytes of the LSP a router originates at one level.
+
+    Counts the LSP header, the area address (TLV 1), hostname (TLV 137), extended IS reachability (TLV 22) and
+    extended IP reachability (TLV 135) TLVs.
+    """
+    area_bytes = len((area or "").replace(".", "")) // 2
+    return (
+        LSP_HEADER_BYTES
+        + TLV_HEADER_BYTES
+        + 1
+        + area_bytes
+        + TLV_HEADER_BYTES
+        + min(len(hostname), TLV_MAX_BYTES)
+        + _tlv_bytes(neighbors, IS_REACH_ENTRY_BYTES)
+        + _tlv_bytes(prefixes, IP_REACH_ENTRY_BYTES)
+    )
+
+
+def _load_routers():
+    """Return one row per ISIS routing instance with interface configurations and its interface count per level."""
+    return list(
+        ISISInterfaceConfiguration.objects.values(
+            instance=F("isis_config__instance"),
+            device_name=F("isis_config__instance__device__name"),
+            area=F("isis_config__instance__isis_area"),
+        )
+        .annotate(
+            **{
+                f"{level}_interfaces": Count("pk", filter=Q(circuit_type__in=circuit_types))
+                for level, circuit_types in LEVEL_CIRCUIT_TYPES.items()
+            }
+        )
+        .order_by("instance")
+    )
+
+
+def _load_adjacencies(routers, node_index):
+    """Return {level: (sources, targets)} arrays of node indexes of the cabled adjacencies of each level."""
+    adjacencies = {level: ([], []) for level in LEVEL_CIRCUIT_TYPES}
+    ends = cabled(ISISInterfaceConfiguration.objects.all()).values_list(
+        "cable_id", "interface_id", "isis_config__instance", "circuit_type"
+    )
+    for _, group in groupby(ends.iterator(), key=itemgetter(0)):
+        for (_, interface_a, instance_a, circuit_a), (_, interface_b, instance_b, circuit_b) in combinations(
+            list(group), 2
+        ):
+            if interface_a == interface_b or instance_a == instance_b:
+                continue
+            node_a, node_b = node_index[instance_a], node_index[instance_b]
+            for level, circuit_types in LEVEL_CIRCUIT_TYPES.items():
+                if circuit_a not in circuit_types or circuit_b not in circuit_types:
+                    continue
+                if level == "L1" and (
+                    not routers[node_a]["area"] or routers[node_a]["area"] != routers[node_b]["area"]
+                ):
+                    continue
+                adjacencies[level][0].append(node_a)
+                adjacencies[level][1].append(node_b)
+    return adjacencies
+
+
+def _components(routers, level, sources, targets):
+    """Group the routers taking part in ``level`` into connected components, largest first."""
+    union_find = UnionFind(len(routers))
+    for node_a, node_b in zip(sources, targets, strict=True):
+        union_find.union(node_a, node_b)
+    components = {}
+    for node, router in enumerate(routers):
+        if router[f"{level}_interfaces"]:
+            components.setdefault(union_find.find(node), []).append(node)
+    return sorted(components.values(), key=lambda members: (-len(members), routers[members[0]]["device_name"]))
+
+
+def analyze_flooding_domains():
+    """Compute the level-1 and level-2 flooding domains of all ISIS routing instances.
+
+    Returns:
+        dict: ``{"domains": [...], "instances": {instance id: {level: domain index}}}``. Each domain has the
+        DOMAIN_COLUMNS keys plus ``devices`` (sorted device names); ``areas`` and ``exits`` are sorted lists.
+    """
+    routers = _load_routers()
+    node_index = {router["instance"]: node for node, router in enumerate(routers)}
+    adjacencies = _load_adjacencies(routers, node_index)
+    degree = {level: [0] * len(routers) for level in LEVEL_CIRCUIT_TYPES}
+    for level, (sources, targets) in adjacencies.items():
+        for node in (*sources, *targets):
+            degree[level][node] += 1
+
+    domains, instances = [], {}
+    domain_of = {level: {} for level in LEVEL_CIRCUIT_TYPES}
+    # Prefixes each level-1 domain's exits propagate into level 2
+    leaked_prefixes = [0] * len(routers)
+    for level in LEVEL_CIRCUIT_TYPES:
+        for number, members in enumerate(_components(routers, level, *adjacencies[level]), start=1):
+            prefixes = {node: routers[node][f"{level}_interfaces"] + 1 for node in members}
+            if level == "L1":
+                exits = [node for node in members if degree["L2"][node]]
+                for node in exits:
+                    leaked_prefixes[node] = sum(prefixes.values()) - prefixes[node]
+            else:
+                exits = []
+                for node in members:
+                    prefixes[node] += leaked_prefixes[node]
+            sizes = [
+                lsp_size(routers[node]["area"], routers[node]["device_name"], degree[level][node], prefixes[node])
+                for node in members
+            ]
+            member_set = set(members)
+            domain = {
+                "level": level,
+                "domain": number,
+                "areas": sorted({routers[node]["area"] for node in members if routers[node]["area"]}),
+                "routers": len(members),
+                "devices": sorted(routers[node]["device_name"] for node in members),
+                "adjacencies": sum(1 for node in adjacencies[level][0] if node in member_set),
+                "exits": sorted(routers[node]["device_name"] for node in exits),
+                "island": level == "L1" and not exits,
+                "lsp_count": sum(math.ceil(size / LSP_MTU_BYTES) for size in sizes),
+                "lsdb_bytes": sum(sizes),
+            }
+            for node in members:
+                domain_of[level][node] = len(domains)
+            domains.append(domain)
+
+    for node, router in enumerate(routers):
+        instances[str(router["instance"])] = {
+            level: domain_of[level][node] for level in LEVEL_CIRCUIT_TYPES if node in domain_of[level]
+        }
+    return {"domains": domains, "instances": instances}
+
+
+def flooding_domains(use_cache=None):
+    """Return the flooding domain analysis, cached unless the effective configuration cache is disabled."""
+    if use_cache is None:
+        use_cache = cache.cache_enabled()
+    if not use_cache:
+        return analyze_flooding_domains()
+    key = cache.topology_key("flooding", cache.get_generations([cache.TOPOLOGY_SCOPE]))
+    result = cache.get_many([key]).get(key)
+    if result is None:
+        result = analyze_flooding_domains()
+        cache.set_many({key: result})
+    return result
+
+
+def instance_flooding_domains(instance_pk, use_cache=None):
+    """Return the flooding domains (one per level at most) a routing instance belongs to."""
+    result = flooding_domains(use_cache=use_cache)
+    levels = result["instances"].get(str(instance_pk), {})
+    return [result["domains"][index] for index in levels.values()]
@@ -4,6 +4,7 @@ import logging
 
 from django import forms
 from nautobot.apps.forms import (
+    BulkEditNullBooleanSelect,
     DynamicModelChoiceField,
     NautobotBulkEditForm,
     NautobotFilterForm,
@@ -100,8 +101,10 @@ class ISISConfigurationForm(NautobotModelForm):
             "name",
             "instance",
             "system_id",
+            "auto_net",
             "status",
             "default_metric",
+            "reference_bandwidth",
             "default_hello_interval",
             "default_hello_multiplier",
             "default_priority",
@@ -241,6 +244,7 @@ class ISISConfigurationBulkEditForm(NautobotBulkEditForm):
     instance = DynamicModelChoiceField(
         queryset=models.IGPRoutingInstance.objects.filter(protocol="ISIS"), required=False, label="IGP Instance"
     )
+    auto_net = forms.NullBooleanField(required=False, widget=BulkEditNullBooleanSelect, label="Auto NET")
 
     class Meta:
         nullable_fields = ()
@@ -380,6 +384,7 @@ class OSPFConfigurationForm(NautobotModelForm):
             "process_id",
             "status",
             "default_cost",
+            "reference_bandwidth",
             "default_hello_interval",
             "default_dead_interval",
             "default_priority",
@@ -0,0 +1,211 @@
+"""Compiled IGP graph and shortest path first (SPF) computations.
+
+The graph is built once from the edge rows of ``topology.iter_edge_batches()`` (cabled adjacencies with the effective
+metric of both ends) into integer-indexed adjacency lists, so SPF runs touch only Python lists and ints. Nodes are IGP
+routing instances and links are cables; each link is usable in both directions with its per-direction metric.
+"""
+
+import hashlib
+import heapq
+
+from nautobot_igp_models.topology import PROTOCOL_MODELS, iter_edge_batches
+
+INFINITY = float("inf")
+
+
+class IGPGraph:
+    """Integer-indexed IGP graph.
+
+    Attributes:
+        nodes (list): Routing instance id per node index.
+        labels (list): Device name per node index.
+        links (list): Edge row (see ``topology.EDGE_COLUMNS``) per link index.
+        out_edges (list): Per node, a list of (neighbor, metric, link) tuples.
+        in_edges (list): Per node, a list of (neighbor, metric, link) tuples of the edges towards it.
+    """
+
+    def __init__(self):
+        """Initialize an empty graph."""
+        self.nodes = []
+        self.labels = []
+        self.node_index = {}
+        self.links = []
+        self.out_edges = []
+        self.in_edges = []
+
+    def add_node(self, instance_id, label):
+        """Return the index of the node for ``instance_id``, adding it if needed."""
+        if instance_id not in self.node_index:
+            self.node_index[instance_id] = len(self.nodes)
+            self.nodes.append(instance_id)
+            self.labels.append(label)
+            self.out_edges.append([])
+            self.in_edges.append([])
+        return self.node_index[instance_id]
+
+    def add_link(self, row):
+        """Add a cabled adjacency from an edge row; adjacencies within a single instance are ignored."""
+        if row["a_instance_id"] == row["b_instance_id"]:
+            return
+        node_a = self.add_node(row["a_instance_id"], row["a_device"])
+        node_b = self.add_node(row["b_instance_id"], row["b_device"])
+        link = len(self.links)
+        self.links.append(row)
+        self.out_edges[node_a].append((node_b, row["a_metric"], link))
+        self.in_edges[node_b].append((node_a, row["a_metric"], link))
+        self.out_edges[node_b].append((node_a, row["b_metric"], link))
+        self.in_edges[node_a].append((node_b, row["b_metric"], link))
+
+    def link_endpoints(self, link):
+        """Return the (a, b) node indexes of ``link``."""
+        row = self.links[link]
+        return self.node_index[row["a_instance_id"]], self.node_index[row["b_instance_id"]]
+
+    def fingerprint(self):
+        """Return a digest of everything SPF results depend on: the links, their endpoints and metrics.
+
+        Edits that do not change the graph (descriptions, statuses, unrelated objects) keep the fingerprint, so it
+        can version cached analysis results.
+        """
+        digest = hashlib.sha256()
+        for row in sorted(
+            (row["cable_id"], row["a_instance_id"], row["b_instance_id"], row["a_metric"], row["b_metric"])
+            for row in self.links
+        ):
+            digest.update(repr(row).encode())
+        return digest.hexdigest()
+
+    def __len__(self):
+        """Number of nodes."""
+        return len(self.nodes)
+
+
+def compile_graph(protocol, queryset=None, area=None):
+    """Build the IGP graph of ``protocol`` ("ISIS" or "OSPF") from its cabled interface configurations.
+
+    Args:
+        protocol: "ISIS" or "OSPF".
+        queryset: Interface configurations to include (default: all of the protocol).
+        area: Only include adjacencies whose two ends are in this area (OSPF area or ISIS area).
+    """
+    if queryset is None:
+        queryset = PROTOCOL_MODELS[protocol].objects.all()
+    graph = IGPGraph()
+    for batch in iter_edge_batches(queryset):
+        for row in batch:
+            if area is None or row["a_area"] == row["b_area"] == area:
+                graph.add_link(row)
+    return graph
+
+
+def shortest_paths(graph, source):
+    """Run Dijkstra from ``source``.
+
+    Equal-cost predecessors are only recorded for nodes that are not settled yet, so every predecessor is settled
+    before its successors and the settle order is a topological order of the shortest path DAG, even with zero
+    metrics.
+
+    Returns:
+        tuple: (distance per node, list per node of the (predecessor, link) pairs of all equal-cost shortest paths,
+        settle rank per node, or None when unreachable)
+    """
+    distance = [INFINITY] * len(graph)
+    predecessors = [[] for _ in range(len(graph))]
+    rank = [None] * len(graph)
+    distance[source] = 0
+    heap = [(0, source)]
+    out_edges = graph.out_edges
+    settled = 0
+    while heap:
+        node_distance, node = heapq.heappop(heap)
+        if rank[node] is not None:
+            continue
+        rank[node] = settled
+        settled += 1
+        for neighbor, metric, link in out_edges[node]:
+            candidate = node_distance + metric
+            if candidate < distance[neighbor]:
+                distance[neighbor] = candidate
+                predecessors[neighbor] = [(node, link)]
+                heapq.heappush(heap, (candidate, neighbor))
+            elif candidate == distance[neighbor] and rank[neighbor] is None:
+                predecessors[neighbor].append((node, link))
+    return distance, predecessors, rank
+
+
+def shortest_path_dag(predecessors):
+    """Invert SPF predecessors into the shortest path DAG.
+
+    Returns:
+        tuple: (children per node, {link: [nodes reached over the link]}) for the links used by any shortest path.
+    """
+    children = [[] for _ in range(len(predecessors))]
+    link_heads = {}
+    for node, node_predecessors in enumerate(predecessors):
+        for predecessor, link in node_predecessors:
+            children[predecessor].append(node)
+            link_heads.setdefault(link, []).append(node)
+    return children, link_heads
+
+
+def failure_affected(predecessors, children, rank, heads, failed_links):
+    """Find the nodes that lose all, or only some, of their shortest paths when ``failed_links`` fail.
+
+    A node loses all of its shortest paths when each of its (predecessor, link) DAG entries uses a failed link or an
+    affected predecessor; only those nodes can change distance, and only their children need to be examined next.
+    Nodes are examined in settle order, so every predecessor is decided before its successors.
+
+    Returns:
+        tuple: (set of affected nodes, set of nodes that keep their cost over fewer equal-cost paths)
+    """
+    affected, rerouted = set(), set()
+    queued = set(heads)
+    heap = [(rank[node], node) for node in queued]
+    heapq.heapify(heap)
+    while heap:
+        _, node = heapq.heappop(heap)
+        node_predecessors = predecessors[node]
+        broken = sum(1 for predecessor, link in node_predecessors if link in failed_links or predecessor in affected)
+        if broken < len(node_predecessors):
+            rerouted.add(node)
+            continue
+        affected.add(node)
+        for child in children[node]:
+            if child not in queued:
+                queued.add(child)
+                heapq.heappush(heap, (rank[child], child))
+    return affected, rerouted
+
+
+def incremental_shortest_paths(graph, distance, affected, excluded_links):
+    """Recompute the distances of the ``affected`` nodes after ``excluded_links`` fail.
+
+    Only nodes whose shortest paths used a failed link can change distance; every other node keeps its ``distance``.
+    The affected nodes are seeded from their unaffected neighbors and settled with a Dijkstra restricted to them, so
+    the cost is proportional to the affected part of the tree rather than to the whole graph.
+
+    Returns:
+        dict: Affected node -> new distance (INFINITY when unreachable).
+    """
+    new_distance = dict.fromkeys(affected, INFINITY)
+    heap = []
+    for node in affected:
+        for neighbor, metric, link in graph.in_edges[node]:
+            if (
+                neighbor not in affected
+                and link not in excluded_links
+                and distance[neighbor] + metric < new_distance[node]
+            ):
+                new_distance[node] = distance[neighbor] + metric
+        if new_distance[node] < INFINITY:
+            heap.append((new_distance[node], node))
+    heapq.heapify(heap)
+    while heap:
+        node_distance, node = heapq.heappop(heap)
+        if node_distance > new_distance[node]:
+            continue
+        for neighbor, metric, link in graph.out_edges[node]:
+            if neighbor in affected and link not in excluded_links and node_distance + metric < new_distance[neighbor]:
+                new_distance[neighbor] = node_distance + metric
+                heapq.heappush(heap, (new_distance[neighbor], neighbor))
+    return new_distance
@@ -0,0 +1,500 @@
+"""Bulk import of IGP objects from YAML, JSON or CSV data."""
+
+import csv
+import json
+import logging
+import os
+
+import yaml
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from nautobot.dcim.models import Device, Interface
+from nautobot.extras.models import Status
+from nautobot.ipam.models import VRF, IPAddress
+
+from nautobot_igp_models.models import (
+    IGPRoutingInstance,
+    ISISConfiguration,
+    ISISInterfaceConfiguration,
+    OSPFConfiguration,
+    OSPFInterfaceConfiguration,
+)
+from nautobot_igp_models.utils import build_net
+
+logger = logging.getLogger(__name__)
+
+# Sections are processed in this order so that rows may reference objects created earlier in the same import.
+SECTIONS = (
+    "igp_routing_instances",
+    "isis_configurations",
+    "isis_interface_configurations",
+    "ospf_configurations",
+    "ospf_interface_configurations",
+)
+
+DEFAULT_BATCH_SIZE = 500
+
+
+class RowError:
+    """A single row that could not be imported."""
+
+    def __init__(self, section, row, message):
+        """Record the section, 1-based row number and error message."""
+        self.section = section
+        self.row = row
+        self.message = message
+
+    def __str__(self):
+        """Render the error as 'section[row]: message'."""
+        return f"{self.section}[{self.row}]: {self.message}"
+
+
+class BulkImportResult:
+    """Outcome of a bulk import: created counts per section and per-row errors."""
+
+    def __init__(self):
+        """Initialize empty counters."""
+        self.created = {section: 0 for section in SECTIONS}
+        self.errors = []
+
+    @property
+    def total_created(self):
+        """Total number of objects created across all sections."""
+        return sum(self.created.values())
+
+    def add_error(self, section, row, message):
+        """Record a row-level error."""
+        self.errors.append(RowError(section, row, message))
+
+
+def load_import_file(path, section=None):
+    """Load import data from a YAML, JSON or CSV file.
+
+    YAML and JSON files contain a mapping of section name to a list of rows. CSV files hold a single section,
+    which must be given via ``section``.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    with open(path, "r", encoding="utf-8") as f:
+        if extension == ".csv":
+            if section not in SECTIONS:
+                raise ValueError(f"A section ({', '.join(SECTIONS)}) is required for CSV imports.")
+            rows = [{key: value for key, value in row.items() if value not in ("", None)} for row in csv.DictReader(f)]
+            return {section: rows}
+        if extension == ".json":
+            data = json.load(f)
+        else:
+            data = yaml.safe_load(f)
+
+    if not isinstance(data, dict):
+        raise ValueError("Import file must contain a mapping of section name to a list of rows.")
+    unknown = set(data) - set(SECTIONS)
+    if unknown:
+        raise ValueError(f"Unknown section(s) in import file: {', '.join(sorted(unknown))}")
+    if section:
+        return {section: data.get(section, [])}
+    return data
+
+
+def _message(error):
+    """Flatten a ValidationError into a single line."""
+    if hasattr(error, "message_dict"):
+        return "; ".join(f"{field}: {' '.join(messages)}" for field, messages in error.message_dict.items())
+    return " ".join(error.messages)
+
+
+def _host(address):
+    """Strip the prefix length from an IP address string."""
+    return str(address).split("/", maxsplit=1)[0]
+
+
+class IGPBulkImporter:
+    """Validate and create IGP objects in bulk.
+
+    Foreign keys are resolved with one query per referenced model, rows are validated in memory (field validators,
+    model ``clean()`` and ``unique_together`` checks), NETs are derived in a single pass, and objects are written
+    with ``bulk_create`` in chunks. Invalid rows are reported in the result and do not abort the rest of the batch.
+
+    Note that ``bulk_create`` bypasses ``save()`` and model signals, so no change log entries are recorded.
+    """
+
+    def __init__(self, batch_size=DEFAULT_BATCH_SIZE):
+        """Initialize the importer."""
+        self.batch_size = batch_size
+        self.result = BulkImportResult()
+        # Objects created during this run, by natural key, so later sections can reference them.
+        self._instances = {}
+        self._isis_configs = {}
+        self._ospf_configs = {}
+        self._statuses = {}
+
+    def run(self, data, dry_run=False):
+        """Import ``data`` (a mapping of section name to rows) and return a BulkImportResult."""
+        with transaction.atomic():
+            self._statuses = self._lookup_statuses(data)
+            for section in SECTIONS:
+                rows = data.get(section) or []
+                if rows:
+                    getattr(self, f"_import_{section}")(rows)
+            if dry_run:
+                transaction.set_rollback(True)
+        return self.result
+
+    # Lookups: one query per referenced model
+
+    @staticmethod
+    def _lookup_statuses(data):
+        names = {row["status"] for rows in data.values() for row in rows or [] if row.get("status")}
+        return {status.name: status for status in Status.objects.filter(name__in=names)}
+
+    @staticmethod
+    def _lookup_unique(queryset, field, values):
+        """Map each value to its object, or to None when the value is ambiguous."""
+        mapping = {}
+        for obj in queryset.filter(**{f"{field}__in": values}):
+            key = str(getattr(obj, field))
+            mapping[key] = None if key in mapping else obj
+        return mapping
+
+    def _lookup_instances(self, names):
+        found = {
+            instance.name: instance
+            for instance in IGPRoutingInstance.objects.filter(name__in=names - set(self._instances)).select_related(
+                "device", "router_id"
+            )
+        }
+        found.update(self._instances)
+        return found
+
+    @staticmethod
+    def _lookup_interfaces(rows, instances):
+        """Map (device name, interface name) to Interface; the device defaults to the instance's device."""
+        keys = set()
+        for row in rows:
+            instance = instances.get(row.get("instance"))
+            device_name = row.get("device") or (instance.device.name if instance else None)
+            if device_name:
+                keys.add((device_name, row.get("interface")))
+        device_names = {device for device, _ in keys}
+        interface_names = {interface for _, interface in keys}
+        interfaces = Interface.objects.filter(device__name__in=device_names, name__in=interface_names).select_related(
+            "device"
+        )
+        return {(interface.device.name, interface.name): interface for interface in interfaces}
+
+    # Validation and write helpers
+
+    def _validate(self, section, index, obj, key, existing_keys, seen_keys):
+        """Run model validation and in-memory uniqueness checks; return True if the row is valid."""
+        if key in existing_keys or key in seen_keys:
+            self.result.add_error(section, index, f"Duplicate of an existing object ({', '.join(map(str, key))}).")
+            return False
+        # Foreign keys were resolved in bulk; validating them again would query each referenced object per row
+        resolved = [
+            field.name
+            for field in obj._meta.concrete_fields
+            if field.is_relation and getattr(obj, field.attname) is not None
+        ]
+        try:
+            obj.full_clean(exclude=resolved, validate_unique=False)
+        except ValidationError as e:
+            self.result.add_error(section, index, _message(e))
+            return False
+        seen_keys.add(key)
+        return True
+
+    def _write(self, section, model, objs):
+        for start in range(0, len(objs), self.batch_size):
+            model.objects.bulk_create(objs[start : start + self.batch_size], batch_size=self.batch_size)
+        self.result.created[section] += len(objs)
+        logger.info("Bulk imported %d %s", len(objs), model._meta.verbose_name_plural)
+
+    def _status(self, section, index, row):
+        name = row.get("status")
+        if not name:
+            return None
+        status = self._statuses.get(name)
+        if status is None:
+            self.result.add_error(section, index, f"Unknown status: {name}")
+            raise LookupError(name)
+        return status
+
+    @staticmethod
+    def _int(row, field):
+        value = row.get(field)
+        return None if value in (None, "") else int(value)
+
+    @staticmethod
+    def _bool(row, field):
+        value = row.get(field)
+        if isinstance(value, str):
+            return value.strip().lower() in ("1", "true", "yes")
+        return bool(value)
+
+    # Sections
+
+    def _import_igp_routing_instances(self, rows):
+        section = "igp_routing_instances"
+        devices = {
+            device.name: device
+            for device in Device.objects.filter(name__in={row.get("device") for row in rows if row.get("device")})
+        }
+        router_ids = self._lookup_unique(
+            IPAddress.objects.all(), "host", {_host(row["router_id"]) for row in rows if row.get("router_id")}
+        )
+        vrfs = self._lookup_unique(VRF.objects.all(), "name", {row["vrf"] for row in rows if row.get("vrf")})
+        existing_keys = set(
+            IGPRoutingInstance.objects.filter(device__in=devices.values()).values_list(
+                "device__name", "protocol", "vrf"
+            )
+        )
+        existing_names = set(
+            IGPRoutingInstance.objects.filter(name__in={row.get("name") for row in rows}).values_list("name", flat=True)
+        )
+
+        objs, seen_keys, seen_names = [], set(), set()
+        for index, row in enumerate(rows, start=1):
+            device = devices.get(row.get("device"))
+            if device is None:
+                self.result.add_error(section, index, f"Unknown device: {row.get('device')}")
+                continue
+            router_id = vrf = None
+            if row.get("router_id"):
+                router_id = router_ids.get(_host(row["router_id"]))
+                if router_id is None:
+                    self.result.add_error(section, index, f"Unknown or ambiguous router ID: {row['router_id']}")
+                    continue
+            if row.get("vrf"):
+                vrf = vrfs.get(row["vrf"])
+                if vrf is None:
+                    self.result.add_error(section, index, f"Unknown or ambiguous VRF: {row['vrf']}")
+                    continue
+            if row.get("name") in existing_names or row.get("name") in seen_names:
+                self.result.add_error(section, index, f"Duplicate instance name: {row.get('name')}")
+                continue
+            try:
+                status = self._status(section, index, row)
+            except LookupError:
+                continue
+
+            obj = IGPRoutingInstance(
+                name=row.get("name", ""),
+                description=row.get("description", ""),
+                device=device,
+                protocol=row.get("protocol", ""),
+                router_id=router_id,
+                vrf=vrf,
+                isis_area=row.get("isis_area") or None,
+                status=status,
+            )
+            obj.sync_router_id_number()
+            key = (device.name, obj.protocol, vrf.pk if vrf else None)
+            if self._validate(section, index, obj, key, existing_keys, seen_keys):
+                seen_names.add(obj.name)
+                objs.append(obj)
+
+        self._write(section, IGPRoutingInstance, objs)
+        self._instances.update((obj.name, obj) for obj in objs)
+
+    def _import_isis_configurations(self, rows):
+        section = "isis_configurations"
+        instances = self._lookup_instances({row.get("instance") for row in rows})
+        existing_keys = set(
+            ISISConfiguration.objects.filter(instance__in=list(instances.values())).values_list(
+                "instance__name", "name"
+            )
+        )
+
+        objs, seen_keys = [], set()
+        for index, row in enumerate(rows, start=1):
+            instance = instances.get(row.get("instance"))
+            if instance is None or instance.protocol != "ISIS":
+                self.result.add_error(section, index, f"Unknown ISIS instance: {row.get('instance')}")
+                continue
+            try:
+                status = self._status(section, index, row)
+                obj = ISISConfiguration(
+                    name=row.get("name", ""),
+                    instance=instance,
+                    system_id=row.get("system_id", ""),
+                    auto_net=self._bool(row, "auto_net"),
+                    status=status,
+                    default_metric=self._int(row, "default_metric"),
+                    reference_bandwidth=self._int(row, "reference_bandwidth"),
+                    default_hello_interval=self._int(row, "default_hello_interval"),
+                    default_hello_multiplier=self._int(row, "default_hello_multiplier"),
+                    default_priority=self._int(row, "default_priority"),
+                )
+            except LookupError:
+                continue
+            except ValueError as e:
+                self.result.add_error(section, index, str(e))
+                continue
+            if self._validate(section, index, obj, (instance.name, obj.name), existing_keys, seen_keys):
+                objs.append(obj)
+
+        # Derive missing and auto-NET NETs in one pass; instances sharing an area and router ID reuse the computed value.
+        nets = {}
+        for obj in objs:
+            if (obj.system_id and not obj.auto_net) or not obj.instance.router_id or not obj.instance.isis_area:
+                continue
+            net_key = (obj.instance.isis_area, obj.instance.router_id.host)
+            if net_key not in nets:
+                try:
+                    nets[net_key] = build_net(*net_key)
+                except ValueError as e:
+                    logger.error(f"Error generating full NET during import: {str(e)}")
+                    nets[net_key] = ""
+            obj.system_id = nets[net_key]
+        for obj in objs:
+            obj.sync_net_columns()
+
+        self._write(section, ISISConfiguration, objs)
+        self._isis_configs.update(((obj.instance.name, obj.name), obj) for obj in objs)
+
+    def _import_isis_interface_configurations(self, rows):
+        section = "isis_interface_configurations"
+        instances = self._lookup_instances({row.get("instance") for row in rows})
+        configs = {
+            (config.instance.name, config.name): config
+            for config in ISISConfiguration.objects.filter(instance__in=list(instances.values())).select_related(
+                "instance__device"
+            )
+        }
+        configs.update(self._isis_configs)
+        interfaces = self._lookup_interfaces(rows, instances)
+        existing_keys = set(
+            ISISInterfaceConfiguration.objects.filter(isis_config__in=list(configs.values())).values_list(
+                "isis_config_id", "interface_id"
+            )
+        )
+
+        objs, seen_keys = [], set()
+        for index, row in enumerate(rows, start=1):
+            config = configs.get((row.get("instance"), row.get("isis_config")))
+            if config is None:
+                self.result.add_error(
+                    section, index, f"Unknown ISIS configuration: {row.get('isis_config')} on {row.get('instance')}"
+                )
+                continue
+            device_name = row.get("device") or config.instance.device.name
+            interface = interfaces.get((device_name, row.get("interface")))
+            if interface is None:
+                self.result.add_error(section, index, f"Unknown interface: {row.get('interface')} on {device_name}")
+                continue
+            try:
+                status = self._status(section, index, row)
+                obj = ISISInterfaceConfiguration(
+                    name=row.get("name", ""),
+                    isis_config=config,
+                    device=interface.device,
+                    interface=interface,
+                    circuit_type=row.get("circuit_type", "L1L2"),
+                    network_type=row.get("network_type", ""),
+                    metric=self._int(row, "metric"),
+                    status=status,
+                )
+            except LookupError:
+                continue
+            except ValueError as e:
+                self.result.add_error(section, index, str(e))
+                continue
+            if self._validate(section, index, obj, (config.pk, interface.pk), existing_keys, seen_keys):
+                objs.append(obj)
+
+        self._write(section, ISISInterfaceConfiguration, objs)
+
+    def _import_ospf_configurations(self, rows):
+        section = "ospf_configurations"
+        instances = self._lookup_instances({row.get("instance") for row in rows})
+        existing_keys = set(
+            OSPFConfiguration.objects.filter(instance__in=list(instances.values())).values_list(
+                "instance__name", "process_id"
+            )
+        )
+
+        objs, seen_keys = [], set()
+        for index, row in enumerate(rows, start=1):
+            instance = instances.get(row.get("instance"))
+            if instance is None or instance.protocol != "OSPF":
+                self.result.add_error(section, index, f"Unknown OSPF instance: {row.get('instance')}")
+                continue
+            try:
+                status = self._status(section, index, row)
+                obj = OSPFConfiguration(
+                    name=row.get("name", ""),
+                    instance=instance,
+                    process_id=self._int(row, "process_id") or 1,
+                    status=status,
+                    default_cost=self._int(row, "default_cost"),
+                    reference_bandwidth=self._int(row, "reference_bandwidth"),
+                    default_hello_interval=self._int(row, "default_hello_interval"),
+                    default_dead_interval=self._int(row, "default_dead_interval"),
+                    default_priority=self._int(row, "default_priority"),
+                )
+            except LookupError:
+                continue
+            except ValueError as e:
+                self.result.add_error(section, index, str(e))
+                continue
+            if self._validate(section, index, obj, (instance.name, obj.process_id), existing_keys, seen_keys):
+                objs.append(obj)
+
+        self._write(section, OSPFConfiguration, objs)
+        self._ospf_configs.update(((obj.instance.name, obj.process_id), obj) for obj in objs)
+
+    def _import_ospf_interface_configurations(self, rows):
+        section = "ospf_interface_configurations"
+        instances = self._lookup_instances({row.get("instance") for row in rows})
+        configs = {
+            (config.instance.name, config.process_id): config
+            for config in OSPFConfiguration.objects.filter(instance__in=list(instances.values())).select_related(
+                "instance__device"
+            )
+        }
+        configs.update(self._ospf_configs)
+        interfaces = self._lookup_interfaces(rows, instances)
+        existing_keys = set(
+            OSPFInterfaceConfiguration.objects.filter(ospf_config__in=list(configs.values())).values_list(
+                "ospf_config_id", "interface_id"
+            )
+        )
+
+        objs, seen_keys = [], set()
+        for index, row in enumerate(rows, start=1):
+            try:
+                process_id = self._int(row, "process_id") or 1
+            except ValueError as e:
+                self.result.add_error(section, index, str(e))
+                continue
+            config = configs.get((row.get("instance"), process_id))
+            if config is None:
+                self.result.add_error(
+                    section, index, f"Unknown OSPF configuration: process {process_id} on {row.get('instance')}"
+                )
+                continue
+            device_name = row.get("device") or config.instance.device.name
+            interface = interfaces.get((device_name, row.get("interface")))
+            if interface is None:
+                self.result.add_error(section, index, f"Unknown interface: {row.get('interface')} on {device_name}")
+                continue
+            try:
+                status = self._status(section, index, row)
+                obj = OSPFInterfaceConfiguration(
+                    name=row.get("name", ""),
+                    ospf_config=config,
+                    interface=interface,
+                    area=str(row.get("area", "")),
+                    network_type=row.get("network_type", ""),
+                    cost=self._int(row, "cost"),
+                    status=status,
+                )
+                obj.sync_area_number()
+            except LookupError:
+                continue
+            except ValueError as e:
+                self.result.add_error(section, index, str(e))
+                continue
+            if self._validate(section, index, obj, (config.pk, interface.pk), existing_keys, seen_keys):
+                objs.append(obj)
+
+        self._write(section, OSPFInterfaceConfiguration, objs)
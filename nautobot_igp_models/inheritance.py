@@ -0,0 +1,150 @@
+"""Batch resolution of effective interface configuration.
+
+``get_effective_config()`` on the interface configuration models layers global defaults, the device config context,
+protocol configuration defaults, interface fields and the interface config context. Resolving it row by row costs
+several queries and a config context merge per interface; the helpers here resolve a whole batch with a fixed number
+of queries and one config context merge per device. Results are read through the effective configuration cache
+(see ``nautobot_igp_models.cache``) when it is enabled.
+"""
+
+from django.db.models import Q
+from nautobot.dcim.models import Device
+
+from nautobot_igp_models import cache
+from nautobot_igp_models.instrumentation import instrumented, record_merges
+from nautobot_igp_models.models import ISISInterfaceConfiguration
+
+# ConfigContext scope relations whose matching devices can be found with a simple filter
+CONFIG_CONTEXT_DEVICE_LOOKUPS = {
+    "roles": "role__in",
+    "device_types": "device_type__in",
+    "platforms": "platform__in",
+    "tenants": "tenant__in",
+    "tags": "tags__in",
+}
+
+
+def with_inheritance_related(queryset):
+    """Select the related objects read by ``get_effective_config()`` so resolution issues no per-row queries."""
+    if queryset.model is ISISInterfaceConfiguration:
+        return queryset.select_related("isis_config", "device", "interface__device")
+    return queryset.select_related("ospf_config", "interface__device")
+
+
+def config_context_device(interface_config):
+    """Return the device whose config context the interface configuration's inheritance chain reads."""
+    if isinstance(interface_config, ISISInterfaceConfiguration):
+        return interface_config.device
+    return interface_config.interface.device
+
+
+def config_context_device_pk(interface_config):
+    """Return the pk of ``config_context_device()`` without fetching the device."""
+    if isinstance(interface_config, ISISInterfaceConfiguration):
+        return interface_config.device_id
+    return interface_config.interface.device_id
+
+
+@instrumented("attach_config_contexts")
+def attach_config_contexts(interface_configs, use_cache=None):
+    """Compute each device's config context once and attach it as ``device.config_context``.
+
+    Config context data for all devices missing from the cache is fetched in a single annotated query.
+
+    Returns:
+        dict: Device pk -> rendered config context.
+    """
+    if use_cache is None:
+        use_cache = cache.cache_enabled()
+    devices_by_pk = {}
+    for interface_config in interface_configs:
+        device = config_context_device(interface_config)
+        devices_by_pk.setdefault(device.pk, []).append(device)
+
+    contexts, keys = {}, {}
+    if use_cache:
+        generations = cache.get_generations(cache.device_scope(device_pk) for device_pk in devices_by_pk)
+        keys = {device_pk: cache.config_context_key(device_pk, generations) for device_pk in devices_by_pk}
+        cached = cache.get_many(list(keys.values()))
+        contexts = {device_pk: cached[key] for device_pk, key in keys.items() if key in cached}
+
+    missing = set(devices_by_pk) - set(contexts)
+    if missing:
+        computed = {
+            device.pk: device.get_config_context()
+            for device in Device.objects.filter(pk__in=missing).annotate_config_context_data()
+        }
+        record_merges(len(computed))
+        contexts.update(computed)
+        if use_cache:
+            cache.set_many({keys[device_pk]: context for device_pk, context in computed.items()})
+
+    for device_pk, devices in devices_by_pk.items():
+        for device in devices:
+            device.config_context = contexts[device_pk]
+    return contexts
+
+
+@instrumented("resolve_effective_configs")
+def resolve_effective_configs(interface_configs, use_cache=None):
+    """Resolve the effective configuration of a batch of interface configurations of one model.
+
+    Args:
+        interface_configs: Interface configurations, ideally fetched through ``with_inheritance_related()``.
+        use_cache: Read through the effective configuration cache (default: enabled unless the configured
+            timeout is 0).
+
+    Returns:
+        dict: Interface configuration pk -> effective configuration dict.
+    """
+    if use_cache is None:
+        use_cache = cache.cache_enabled()
+    interface_configs = list(interface_configs)
+    if not use_cache:
+        attach_config_contexts(interface_configs, use_cache=False)
+        return {interface_config.pk: interface_config.get_effective_config() for interface_config in interface_configs}
+
+    scopes = {
+        interface_config.pk: cache.interface_config_scopes(interface_config, config_context_device_pk(interface_config))
+        for interface_config in interface_configs
+    }
+    generations = cache.get_generations(scope for config_scopes in scopes.values() for scope in config_scopes)
+    keys = {
+        interface_config.pk: cache.effective_config_key(
+            interface_config, config_context_device_pk(interface_config), generations
+        )
+        for interface_config in interface_configs
+    }
+    cached = cache.get_many(list(keys.values()))
+    effective = {pk: cached[key] for pk, key in keys.items() if key in cached}
+
+    misses = [interface_config for interface_config in interface_configs if interface_config.pk not in effective]
+    if misses:
+        attach_config_contexts(misses, use_cache=True)
+        computed = {interface_config.pk: interface_config.get_effective_config() for interface_config in misses}
+        effective.update(computed)
+        cache.set_many({keys[pk]: config for pk, config in computed.items()})
+    return effective
+
+
+def config_context_devices(config_context):
+    """Return the devices a config context applies to, or None if they cannot be determined with a filter.
+
+    Mirrors the config context scoping rules for the common relations: an empty relation matches every device,
+    and locations match devices in the location or any of its descendants.
+    """
+    query = Q()
+    for field in config_context._meta.many_to_many:
+        related = list(getattr(config_context, field.name).all())
+        if not related:
+            continue
+        if field.name == "locations":
+            location_pks = {
+                descendant.pk for location in related for descendant in location.descendants(include_self=True)
+            }
+            query &= Q(location__in=location_pks)
+        elif field.name in CONFIG_CONTEXT_DEVICE_LOOKUPS:
+            query &= Q(**{CONFIG_CONTEXT_DEVICE_LOOKUPS[field.name]: related})
+        else:
+            return None
+    return Device.objects.filter(query).distinct()
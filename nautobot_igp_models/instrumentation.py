@@ -0,0 +1,116 @@
+"""Opt-in instrumentation of effective configuration resolution.
+
+When the ``instrumentation_enabled`` app setting is true, every ``@instrumented`` operation records its call count,
+the database queries it issued and its wall time, and config context merges are counted. Totals are kept per
+process for the Prometheus metrics in ``nautobot_igp_models.metrics``, and per request for the debug summary header
+added by ``nautobot_igp_models.middleware``. When disabled, instrumented functions are called directly.
+
+Nested operations are measured inclusively; e.g. the queries of ``get_effective_config`` calls made by
+``resolve_effective_configs`` are counted for both operations.
+"""
+
+import functools
+import threading
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import connection
+
+OPERATION_FIELDS = ("calls", "queries", "seconds")
+
+_lock = threading.Lock()
+_totals = defaultdict(lambda: dict.fromkeys(OPERATION_FIELDS, 0))
+_merge_total = {"merges": 0}
+_request = threading.local()
+
+
+def instrumentation_enabled():
+    """Return whether instrumentation is enabled in the app settings."""
+    return bool(settings.PLUGINS_CONFIG.get("nautobot_igp_models", {}).get("instrumentation_enabled", False))
+
+
+def _record(operation, queries, seconds):
+    with _lock:
+        totals = _totals[operation]
+        totals["calls"] += 1
+        totals["queries"] += queries
+        totals["seconds"] += seconds
+    summary = getattr(_request, "summary", None)
+    if summary is not None:
+        totals = summary["operations"][operation]
+        totals["calls"] += 1
+        totals["queries"] += queries
+        totals["seconds"] += seconds
+
+
+def record_merges(count):
+    """Count ``count`` config context merges (one per device whose config context was rendered)."""
+    if not count or not instrumentation_enabled():
+        return
+    with _lock:
+        _merge_total["merges"] += count
+    summary = getattr(_request, "summary", None)
+    if summary is not None:
+        summary["merges"] += count
+
+
+def instrumented(operation):
+    """Decorate a function or method so that its calls, queries and wall time are recorded as ``operation``."""
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not instrumentation_enabled():
+                return func(*args, **kwargs)
+            query_count = [0]
+
+            def count_queries(execute, sql, params, many, context):
+                query_count[0] += 1
+                return execute(sql, params, many, context)
+
+            start = time.perf_counter()
+            try:
+                with connection.execute_wrapper(count_queries):
+                    return func(*args, **kwargs)
+            finally:
+                _record(operation, query_count[0], time.perf_counter() - start)
+
+        return wrapper
+
+    return decorator
+
+
+def snapshot():
+    """Return a copy of the per-process totals: (operations dict, config context merge count)."""
+    with _lock:
+        return {operation: dict(totals) for operation, totals in _totals.items()}, _merge_total["merges"]
+
+
+def reset():
+    """Clear the per-process totals."""
+    with _lock:
+        _totals.clear()
+        _merge_total["merges"] = 0
+
+
+def start_request():
+    """Begin collecting a per-request summary on this thread."""
+    _request.summary = {"operations": defaultdict(lambda: dict.fromkeys(OPERATION_FIELDS, 0)), "merges": 0}
+
+
+def finish_request():
+    """Stop collecting and return the per-request summary, or None if none was being collected."""
+    summary = getattr(_request, "summary", None)
+    _request.summary = None
+    return summary
+
+
+def format_summary(summary):
+    """Render a per-request summary as a compact single-line header value."""
+    parts = [
+        f"{operation}={totals['calls']}c/{totals['queries']}q/{totals['seconds'] * 1000:.1f}ms"
+        for operation, totals in sorted(summary["operations"].items())
+    ]
+    parts.append(f"merges={summary['merges']}")
+    return "; ".join(parts)
@@ -0,0 +1,532 @@
+"""Jobs for nautobot_igp_models."""
+
+import json
+
+from nautobot.apps.jobs import (
+    BooleanVar,
+    ChoiceVar,
+    FileVar,
+    IntegerVar,
+    Job,
+    JSONVar,
+    MultiObjectVar,
+    ObjectVar,
+    StringVar,
+    register_jobs,
+)
+from nautobot.extras.models import Status
+
+from nautobot_igp_models.area_scaling import AREA_COLUMNS, analyze_ospf_areas
+from nautobot_igp_models.audit import run_audit
+from nautobot_igp_models.autocost import AUTOCOST_COLUMNS, auto_cost
+from nautobot_igp_models.convergence import ADJACENCY_COLUMNS, DEVICE_COLUMNS, estimate_convergence
+from nautobot_igp_models.failures import LINK_IMPACT_COLUMNS, link_failure_impact
+from nautobot_igp_models.metric_optimizer import (
+    DEFAULT_ITERATIONS,
+    DEFAULT_MAX_METRIC,
+    PROPOSAL_COLUMNS,
+    apply_proposal,
+    load_traffic_model,
+    optimize_metrics,
+    parse_demands,
+    propose_metrics,
+)
+from nautobot_igp_models.models import IGPRoutingInstance, IGPTopologySnapshot
+from nautobot_igp_models.nets import regenerate_nets
+from nautobot_igp_models.provisioning import DEFAULT_AREA, PROVISION_COLUMNS, provision_interface_configs
+from nautobot_igp_models.snapshots import diff_snapshots, take_snapshot
+from nautobot_igp_models.srlg import SRLG_IMPACT_COLUMNS, srlg_failure_impact
+from nautobot_igp_models.timers import MISMATCH_COLUMNS, find_timer_mismatches
+from nautobot_igp_models.utils import render_rows
+
+name = "IGP Models"  # pylint: disable=invalid-name
+
+# Findings beyond this many per check are only available in the stored report
+MAX_LOGGED_FINDINGS = 50
+
+PROTOCOL_CHOICES = (("ISIS", "ISIS"), ("OSPF", "OSPF"))
+
+
+class AuditIGP(Job):
+    """Run set-based IGP consistency checks and store the result as an IGP audit report."""
+
+    save_report = BooleanVar(default=True, description="Store the findings as an IGP audit report.")
+
+    class Meta:
+        """Meta attributes."""
+
+        name = "Audit IGP Consistency"
+        description = (
+            "Find duplicate router IDs and NETs, ISIS area and OSPF area/network-type mismatches across cabled "
+            "links, and interface configurations attached to another device's instance."
+        )
+
+    def run(self, *, save_report):  # pylint: disable=arguments-differ
+        """Run the audit."""
+        report = run_audit(save=save_report)
+        for check, count in report.summary.items():
+            if count:
+                self.logger.warning("%s: %d finding(s)", check, count)
+                for row in report.findings[check][:MAX_LOGGED_FINDINGS]:
+                    self.logger.warning("%s: %s", check, row)
+            else:
+                self.logger.info("%s: no findings", check)
+        return report.summary
+
+
+class CheckIGPTimers(Job):
+    """Compare effective hello/dead timers on both ends of every cabled IGP adjacency."""
+
+    output_format = ChoiceVar(
+        choices=(("csv", "CSV"), ("json", "JSON")),
+        default="csv",
+        description="Format of the mismatch report file.",
+    )
+
+    class Meta:
+        """Meta attributes."""
+
+        name = "Check IGP Timer Mismatches"
+        description = (
+            "Resolve the effective (inherited) hello interval, dead interval and hello multiplier of every cabled "
+            "ISIS and OSPF interface and report adjacencies whose two ends disagree."
+        )
+
+    def run(self, *, output_format):  # pylint: disable=arguments-differ
+        """Find timer mismatches and attach them as a file."""
+        rows = find_timer_mismatches()
+        if rows:
+            self.logger.warning("Found %d timer mismatch(es)", len(rows))
+        else:
+            self.logger.info("No timer mismatches found")
+        self.create_file(f"igp_timer_mismatches.{output_format}", render_rows(rows, MISMATCH_COLUMNS, output_format))
+        return {"mismatches": len(rows)}
+
+
+class EstimateIGPConvergence(Job):
+    """Estimate worst-case failure detection and convergence time of every cabled IGP adjacency."""
+
+    output_format = ChoiceVar(
+        choices=(("csv", "CSV"), ("json", "JSON")),
+        default="csv",
+        description="Format of the adjacency and device report files.",
+    )
+
+    class Meta:
+        """Meta attributes."""
+
+        name = "Estimate IGP Convergence"
+        description = (
+            "Derive worst-case failure detection (BFD or hold time) and convergence time of every cabled ISIS and "
+            "OSPF adjacency from the effective timers, aggregate them per device and flag outliers."
+        )
+
+    def run(self, *, output_format):  # pylint: disable=arguments-differ
+        """Estimate convergence and attach the adjacency and device reports."""
+        estimate = estimate_convergence()
+        outliers = [row for row in estimate["adjacencies"] if row["outlier"]]
+        for row in outliers[:MAX_LOGGED_FINDINGS]:
+            self.logger.warning(
+                "%s %s %s <-> %s %s: %s ms (%s)",
+                row["protocol"],
+                row["a_device"],
+                row["a_interface"],
+                row["b_device"],
+                row["b_interface"],
+                row["convergence_ms"],
+                row["notes"],
+            )
+        self.logger.info("Estimated %d adjacency(ies), %d outlier(s)", len(estimate["adjacencies"]), len(outliers))
+        self.create_file(
+            f"igp_convergence_adjacencies.{output_format}",
+            render_rows(estimate["adjacencies"], ADJACENCY_COLUMNS, output_format),
+        )
+        self.create_file(
+            f"igp_convergence_devices.{output_format}",
+            render_rows(estimate["devices"], DEVICE_COLUMNS, output_format),
+        )
+        return {"adjacencies": len(estimate["adjacencies"]), "outliers": len(outliers)}
+
+
+class LinkFailureImpact(Job):
+    """Rank IGP links by the reachability and path changes their individual failure causes."""
+
+    protocol = ChoiceVar(choices=PROTOCOL_CHOICES, description="IGP whose cabled adjacencies form the graph.")
+    area = StringVar(
+        required=False,
+        description="Only include adjacencies within this area (OSPF area or ISIS area); default: all.",
+    )
+    workers = IntegerVar(
+        required=False, min_value=1, description="Worker processes for the SPF sweep (default: one per CPU)."
+    )
+
+    class Meta:
+        """Meta attributes."""
+
+        name = "Link Failure Impact"
+        description = (
+            "Fail every cabled IGP link in turn and count, over all router pairs, the pairs that lose reachability, "
+            "get a higher cost or move to another equal-cost path. Links are ranked by impact in a CSV file."
+        )
+
+    def run(self, *, protocol, area=None, workers=None):  # pylint: disable=arguments-differ
+        """Run the failure sweep and attach the ranking."""
+        rows = link_failure_impact(protocol, area=area or None, workers=workers)
+        for row in rows[:10]:
+            if row["lost_pairs"] or row["cost_increased_pairs"]:
+                self.logger.warning(
+                    "#%d %s %s <-> %s %s: %d pair(s) lose reachability, %d get a higher cost",
+                    row["rank"],
+                    row["a_device"],
+                    row["a_interface"],
+                    row["b_device"],
+                    row["b_interface"],
+                    row["lost_pairs"],
+                    row["cost_increased_pairs"],
+                )
+        self.logger.info("Evaluated %d link failure(s)", len(rows))
+        self.create_file(f"igp_link_failure_impact_{protocol.lower()}.csv", render_rows(rows, LINK_IMPACT_COLUMNS))
+        return {"links": len(rows), "links_partitioning": sum(1 for row in rows if row["lost_pairs"])}
+
+
+class SharedRiskGroupImpact(Job):
+    """Rank shared risk link groups by the impact of failing all their links at once."""
+
+    protocol = ChoiceVar(choices=PROTOCOL_CHOICES, description="IGP whose cabled adjacencies form the graph.")
+    area = StringVar(
+        required=False,
+        description="Only include adjacencies within this area (OSPF area or ISIS area); default: all.",
+    )
+    workers = IntegerVar(
+        required=False, min_value=1, description="Worker processes for the SPF sweep (default: one per CPU)."
+    )
+    use_cache = BooleanVar(default=True, description="Reuse results computed for an identical topology.")
+
+    class Meta:
+        """Meta attributes."""
+
+        name = "Shared Risk Group Impact"
+        description = (
+            "Fail together the links of every shared risk group (interface configurations tagged srlg:<group>) and "
+            "count the router pairs that lose reachability or change path. Groups are ranked in a CSV file."
+        )
+
+    def run(self, *, protocol, area=None, workers=None, use_cache=True):  # pylint: disable=arguments-differ
+        """Run the shared risk group simulation and attach the ranking."""
+        rows = srlg_failure_impact(protocol, area=area or None, workers=workers, use_cache=use_cache)
+        if not rows:
+            self.logger.info("No %s interface configurations are tagged srlg:<group>", protocol)
+        for row in rows:
+            if row["lost_pairs"]:
+                self.logger.warning(
+                    "SRLG %s (%d links): %d router pair(s) lose reachability",
+                    row["srlg"],
+                    row["link_count"],
+                    row["lost_pairs"],
+                )
+        self.create_file(f"igp_srlg_impact_{protocol.lower()}.csv", render_rows(rows, SRLG_IMPACT_COLUMNS))
+        return {"groups": len(rows), "groups_partitioning": sum(1 for row in rows if row["lost_pairs"])}
+
+
+class TrafficEngineeringOptimizer(Job):
+    """Propose IGP metrics that lower the maximum link utilization for a traffic demand matrix."""
+
+    protocol = ChoiceVar(choices=PROTOCOL_CHOICES, description="IGP whose metrics are optimized.")
+    demands = FileVar(description="CSV file with source, destination and gbps columns (router ID or device name).")
+    area = StringVar(
+        required=False,
+        description="Only include adjacencies within this area (OSPF area or ISIS area); default: all.",
+    )
+    iterations = IntegerVar(
+        default=DEFAULT_ITERATIONS, min_value=1, description="Maximum number of metric changes to make."
+    )
+    max_metric = IntegerVar(default=DEFAULT_MAX_METRIC, min_value=1, description="Highest metric to propose.")
+    workers = IntegerVar(
+        required=False, min_value=1, description="Worker processes evaluating candidate metrics (default: one per CPU)."
+    )
+    apply = BooleanVar(default=False, description="Write the proposed metrics as interface overrides.")
+
+    class Meta:
+        """Meta attributes."""
+
+        name = "Traffic Engineering Metric Optimizer"
+        description = (
+            "Route a demand matrix over the equal-cost shortest paths of the cabled IGP topology, with link capacity "
+            "from the interface speeds, and search for metrics that lower the maximum link utilization. The "
+            "proposed metric changes are attached as a CSV file and optionally applied in one bulk update."
+        )
+
+    def run(  # pylint: disable=arguments-differ
+        self, *, protocol, demands, area=None, iterations, max_metric, workers=None, apply=False
+    ):
+        """Optimize the metrics and attach, and optionally apply, the proposal."""
+        try:
+            demand_rows = parse_demands(demands.read().decode("utf-8-sig"))
+        except (UnicodeDecodeError, ValueError) as error:
+            self.logger.error("Invalid demand file: %s", error)
+            raise
+        model, unmatched = load_traffic_model(protocol, demand_rows, area=area or None)
+        for source, destination, gbps in unmatched:
+            self.logger.warning(
+                "Skipped demand %s -> %s (%s Gbps): endpoint not in the graph", source, destination, gbps
+            )
+
+        weights, initial, final = optimize_metrics(model, iterations=iterations, max_metric=max_metric, workers=workers)
+        rows = propose_metrics(protocol, model, weights)
+        self.logger.info("Maximum utilization %.3f -> %.3f with %d metric change(s)", initial[0], final[0], len(rows))
+        self.create_file(f"igp_metric_proposal_{protocol.lower()}.csv", render_rows(rows, PROPOSAL_COLUMNS))
+        updated = apply_proposal(protocol, rows) if apply else 0
+        if apply:
+            self.logger.info("Updated %d %s interface configuration(s)", updated, protocol)
+        return {
+            "initial_max_utilization": initial[0],
+            "final_max_utilization": final[0],
+            "changes": len(rows),
+            "updated": updated,
+            "unmatched_demands": len(unmatched),
+        }
+
+
+class OSPFAreaScaling(Job):
+    """Estimate LSDB size and SPF load per OSPF area and flag areas over the configured thresholds."""
+
+    output_format = ChoiceVar(
+        choices=(("csv", "CSV"), ("json", "JSON")),
+        default="csv",
+        description="Format of the area report file.",
+    )
+
+    class Meta:
+        """Meta attributes."""
+
+        name = "OSPF Area Scaling"
+        description = (
+            "Count routers, interfaces and adjacencies per OSPF area, estimate the number and size of router and "
+            "network LSAs and the SPF run cost, and report areas exceeding the ospf_area_thresholds setting."
+        )
+
+    def run(self, *, output_format):  # pylint: disable=arguments-differ
+        """Analyze the OSPF areas and attach the report."""
+        rows = analyze_ospf_areas()
+        for row in rows:
+            if row["exceeded"]:
+                self.logger.warning(
+                    "Area %s exceeds %s: %d routers, %d links, %d byte LSDB, ~%d SPF operations",
+                    row["area"],
+                    row["exceeded"],
+                    row["routers"],
+                    row["links"],
+                    row["lsdb_bytes"],
+                    row["spf_operations"],
+                )
+        self.logger.info("Analyzed %d OSPF area(s)", len(rows))
+        self.create_file(f"ospf_area_scaling.{output_format}", render_rows(rows, AREA_COLUMNS, output_format))
+        return {"areas": len(rows), "areas_exceeding_thresholds": sum(1 for row in rows if row["exceeded"])}
+
+
+class ProvisionIGPInterfaces(Job):
+    """Create the interface configurations of routing instances from the cabled interfaces of their devices."""
+
+    instances = MultiObjectVar(model=IGPRoutingInstance, description="Routing instances to provision.")
+    area_rules = JSONVar(
+        required=False,
+        description='OSPF area per interface name regular expression, first match wins, e.g. {"^Ethernet1/": "0.0.0.1"}.',
+    )
+    default_area = StringVar(default=DEFAULT_AREA, description="OSPF area of interfaces no rule matches.")
+    circuit_type = ChoiceVar(
+        choices=(("L1L2", "Level-1-2"), ("L1", "Level-1"), ("L2", "Level-2")),
+        default="L1L2",
+        description="Circuit type of new ISIS interface configurations.",
+    )
+    status = ObjectVar(model=Status, required=False, description="Status of the new interface configurations.")
+    dry_run = BooleanVar(default=False, description="Report what would be created without writing.")
+
+    class Meta:
+        """Meta attributes."""
+
+        name = "Provision IGP Interfaces"
+        description = (
+            "Create an ISIS/OSPF interface configuration for every cabled, enabled, non-management interface of the "
+            "selected routing instances' devices in one bulk insert. Existing configurations are kept, so the Job "
+            "can be rerun after cabling changes."
+        )
+
+    def run(  # pylint: disable=arguments-differ
+        self, *, instances, area_rules=None, default_area, circuit_type, status=None, dry_run
+    ):
+        """Provision the interface configurations and attach the list of new rows."""
+        try:
+            result = provision_interface_configs(
+                instances,
+                area_rules=area_rules,
+                default_area=default_area,
+                circuit_type=circuit_type,
+                status=status,
+                dry_run=dry_run,
+            )
+        except ValueError as error:
+            self.logger.error("%s", error)
+            raise
+        for instance in result["skipped"]:
+            self.logger.warning("%s has no %s configuration; skipped", instance, instance.protocol)
+        self.logger.info(
+            "%s %d interface configuration(s); %d already existed",
+            "Would create" if dry_run else "Created",
+            len(result["rows"]),
+            result["existing"],
+        )
+        self.create_file("igp_provisioned_interfaces.csv", render_rows(result["rows"], PROVISION_COLUMNS))
+        return {"created": len(result["rows"]), "existing": result["existing"], "skipped": len(result["skipped"])}
+
+
+class RegenerateISISNets(Job):
+    """Regenerate ISIS NETs from the router ID and ISIS area of each routing instance."""
+
+    missing_only = BooleanVar(default=False, description="Only fill in ISIS configurations without a NET.")
+    dry_run = BooleanVar(default=True, description="Report what would change without writing.")
+
+    class Meta:
+        """Meta attributes."""
+
+        name = "Regenerate ISIS NETs"
+        description = (
+            "Recompute the NET of every ISIS configuration in one pass and write the changes with a single bulk "
+            "update. NETs that would be shared by more than one configuration are reported and left untouched."
+        )
+
+    def run(self, *, missing_only, dry_run):  # pylint: disable=arguments-differ
+        """Regenerate NETs."""
+        result = regenerate_nets(missing_only=missing_only, dry_run=dry_run)
+        for net, config_pks in result.collisions.items():
+            self.logger.warning("%s would be shared by ISIS configurations %s", net, config_pks)
+        if result.skipped:
+            self.logger.warning("%d ISIS configuration(s) have no router ID or ISIS area", len(result.skipped))
+        self.logger.info(
+            "%s %d NET(s); %d unchanged",
+            "Would update" if dry_run else "Updated",
+            result.updated,
+            result.unchanged,
+        )
+        return {"updated": result.updated, "unchanged": result.unchanged, "collisions": result.collision_count}
+
+
+class AutoCostIGPInterfaces(Job):
+    """Compute ISIS metrics / OSPF costs from interface speeds and a reference bandwidth."""
+
+    protocol = ChoiceVar(choices=PROTOCOL_CHOICES, description="IGP whose interface metrics are computed.")
+    target = ChoiceVar(
+        choices=(("interface", "Interface overrides"), ("default", "Configuration defaults")),
+        default="interface",
+        description=(
+            "Write every cost as an interface override, or set each configuration default to its most common "
+            "cost and override only the interfaces that differ."
+        ),
+    )
+    reference_bandwidth = IntegerVar(
+        required=False,
+        min_value=1,
+        description="Reference bandwidth in Mbps for configurations without their own (default: app setting).",
+    )
+    dry_run = BooleanVar(default=True, description="Report what would change without writing.")
+
+    class Meta:
+        """Meta attributes."""
+
+        name = "Auto-Cost IGP Interfaces"
+        description = (
+            "Divide the reference bandwidth of each ISIS/OSPF configuration by the speed of its interfaces and "
+            "write the resulting metrics with a single bulk update. The changes are attached as a CSV diff."
+        )
+
+    def run(self, *, protocol, target, reference_bandwidth=None, dry_run):  # pylint: disable=arguments-differ
+        """Compute and optionally apply the auto-costs."""
+        result = auto_cost(protocol, target=target, reference_bandwidth=reference_bandwidth, dry_run=dry_run)
+        if result.skipped:
+            self.logger.warning(
+                "%d %s interface configuration(s) have no interface speed or rated type", len(result.skipped), protocol
+            )
+        self.logger.info(
+            "%s %d value(s); %d unchanged",
+            "Would update" if dry_run else "Updated",
+            result.updated,
+            result.unchanged,
+        )
+        self.create_file(f"igp_auto_cost_{protocol.lower()}.csv", render_rows(result.rows, AUTOCOST_COLUMNS))
+        return {"updated": result.updated, "unchanged": result.unchanged, "skipped": len(result.skipped)}
+
+
+class CaptureIGPTopologySnapshot(Job):
+    """Store a snapshot of the IGP topology as a delta against the previous one."""
+
+    class Meta:
+        """Meta attributes."""
+
+        name = "Capture IGP Topology Snapshot"
+        description = (
+            "Capture routing instances, ISIS/OSPF configurations, interface configurations and cabled adjacencies "
+            "with effective metrics. Only rows changed since the previous snapshot are stored, with a periodic full "
+            "checkpoint. Schedule this Job to keep a topology history."
+        )
+
+    def run(self):  # pylint: disable=arguments-differ
+        """Capture and store the snapshot."""
+        snapshot = take_snapshot()
+        self.logger.info(
+            "Stored %s: %d rows, %d changed since the previous snapshot%s",
+            snapshot,
+            snapshot.row_count,
+            snapshot.change_count,
+            " (full checkpoint)" if snapshot.checkpoint else "",
+        )
+        return {"sequence": snapshot.sequence, "rows": snapshot.row_count, "changes": snapshot.change_count}
+
+
+class DiffIGPTopologySnapshots(Job):
+    """Compare the IGP topology captured by two snapshots."""
+
+    old_sequence = IntegerVar(min_value=1, description="Sequence number of the older snapshot.")
+    new_sequence = IntegerVar(
+        min_value=1, required=False, description="Sequence number of the newer snapshot (default: latest)."
+    )
+
+    class Meta:
+        """Meta attributes."""
+
+        name = "Diff IGP Topology Snapshots"
+        description = "Report rows added, removed and changed between two IGP topology snapshots as a JSON file."
+
+    def run(self, *, old_sequence, new_sequence=None):  # pylint: disable=arguments-differ
+        """Reconstruct both snapshots and attach their differences."""
+        old_snapshot = IGPTopologySnapshot.objects.get(sequence=old_sequence)
+        if new_sequence:
+            new_snapshot = IGPTopologySnapshot.objects.get(sequence=new_sequence)
+        else:
+            new_snapshot = IGPTopologySnapshot.objects.order_by("-sequence").first()
+
+        diff = diff_snapshots(old_snapshot, new_snapshot)
+        counts = {table: {kind: len(rows) for kind, rows in table_diff.items()} for table, table_diff in diff.items()}
+        for table, table_counts in counts.items():
+            self.logger.info("%s: %s", table, table_counts)
+        if not diff:
+            self.logger.info("No differences between %s and %s", old_snapshot, new_snapshot)
+        self.create_file(
+            f"igp_topology_diff_{old_snapshot.sequence}_{new_snapshot.sequence}.json", json.dumps(diff, indent=2)
+        )
+        return counts
+
+
+jobs = [
+    AuditIGP,
+    AutoCostIGPInterfaces,
+    CaptureIGPTopologySnapshot,
+    CheckIGPTimers,
+    DiffIGPTopologySnapshots,
+    EstimateIGPConvergence,
+    LinkFailureImpact,
+    OSPFAreaScaling,
+    ProvisionIGPInterfaces,
+    RegenerateISISNets,
+    SharedRiskGroupImpact,
+    TrafficEngineeringOptimizer,
+]
+register_jobs(*jobs)
@@ -0,0 +1,47 @@
+"""Management command to audit the IGP dataset for consistency problems."""
+
+from django.core.management.base import BaseCommand
+
+from nautobot_igp_models.audit import AUDIT_CHECKS, run_audit
+
+
+class Command(BaseCommand):
+    """Run set-based IGP consistency checks and store the result as an IGP audit report."""
+
+    help = "Audit IGP instances, configurations and interface configurations for consistency problems"
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            "--check",
+            action="append",
+            choices=list(AUDIT_CHECKS),
+            help="Run only this check (may be given multiple times; default: all checks)",
+        )
+        parser.add_argument(
+            "--no-save",
+            action="store_true",
+            help="Print the findings without storing an IGP audit report",
+        )
+
+    def handle(self, *args, **options):
+        """Execute the command."""
+        self.stdout.write("\n" + "=" * 70)
+        self.stdout.write(self.style.SUCCESS("IGP Consistency Audit"))
+        self.stdout.write("=" * 70 + "\n")
+
+        report = run_audit(checks=options["check"], save=not options["no_save"])
+
+        for name, rows in report.findings.items():
+            if rows:
+                self.stdout.write(self.style.WARNING(f"\n{name}: {len(rows)} finding(s)"))
+                for row in rows:
+                    self.stdout.write("  ✗ " + ", ".join(f"{key}={value}" for key, value in row.items()))
+            else:
+                self.stdout.write(self.style.SUCCESS(f"\n{name}: ✓ no findings"))
+
+        self.stdout.write("\n" + "=" * 70)
+        if report.present_in_database:
+            self.stdout.write(f"Report saved: {report.pk}")
+        self.stdout.write(f"Total findings: {report.total_findings}")
+        self.stdout.write("=" * 70 + "\n")
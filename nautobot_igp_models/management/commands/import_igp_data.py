@@ -0,0 +1,60 @@
+"""Management command to bulk import IGP objects from YAML, JSON or CSV files."""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from nautobot_igp_models.importers import DEFAULT_BATCH_SIZE, SECTIONS, IGPBulkImporter, load_import_file
+
+
+class Command(BaseCommand):
+    """Bulk import IGP routing instances, configurations and interface configurations."""
+
+    help = "Bulk import IGP objects from a YAML, JSON or CSV file"
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument("path", help="Path to the YAML, JSON or CSV file to import")
+        parser.add_argument(
+            "--section",
+            choices=SECTIONS,
+            help="Section to import (required for CSV files, optional filter for YAML/JSON files)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help=f"Number of rows written per bulk_create batch (default: {DEFAULT_BATCH_SIZE})",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Validate the file and report errors without writing anything",
+        )
+
+    def handle(self, *args, **options):
+        """Execute the command."""
+        try:
+            data = load_import_file(options["path"], section=options["section"])
+        except (OSError, ValueError) as e:
+            raise CommandError(str(e)) from e
+
+        self.stdout.write("\n" + "=" * 70)
+        self.stdout.write(self.style.SUCCESS("Importing IGP Data"))
+        self.stdout.write("=" * 70 + "\n")
+
+        result = IGPBulkImporter(batch_size=options["batch_size"]).run(data, dry_run=options["dry_run"])
+
+        for section in SECTIONS:
+            if data.get(section):
+                self.stdout.write(f"  {section}: {result.created[section]}/{len(data[section])} rows valid")
+
+        for error in result.errors:
+            self.stdout.write(self.style.ERROR(f"  ✗ {error}"))
+
+        self.stdout.write("\n" + "=" * 70)
+        if options["dry_run"]:
+            self.stdout.write(self.style.WARNING("\nℹ  This was a dry-run. No objects were written."))
+        else:
+            self.stdout.write(self.style.SUCCESS(f"\n✓ Created {result.total_created} objects"))
+        if result.errors:
+            self.stdout.write(self.style.WARNING(f"⊘ {len(result.errors)} rows skipped due to errors"))
+        self.stdout.write("=" * 70 + "\n")
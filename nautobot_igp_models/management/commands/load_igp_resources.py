@@ -1,14 +1,99 @@
 """Management command to load IGP config context schemas and export templates."""
 
+import hashlib
 import json
 import os
 
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.core.management.base import BaseCommand
-
+from django.db import transaction
 from nautobot.extras.models import ConfigContextSchema, ExportTemplate
 
-from nautobot_igp_models.models import ISISConfiguration, OSPFConfiguration
+from nautobot_igp_models.models import IGPResourceFingerprint, ISISConfiguration, OSPFConfiguration
+
+# Name of the IGPResourceFingerprint row holding the fingerprint of the last successfully loaded resource set
+FINGERPRINT_NAME = "load_igp_resources"
+# Cache key fronting that row, so that unchanged runs do not read it
+FINGERPRINT_CACHE_KEY = "nautobot_igp_models:load_igp_resources:fingerprint"
+
+SCHEMA_DEFINITIONS = [
+    {
+        "name": "IGP ISIS Configuration",
+        "description": "JSON Schema for ISIS config context parameters",
+        "file": "config_context_isis.json",
+    },
+    {
+        "name": "IGP OSPF Configuration",
+        "description": "JSON Schema for OSPF config context parameters",
+        "file": "config_context_ospf.json",
+    },
+]
+
+TEMPLATE_DEFINITIONS = [
+    # Cisco IOS Templates
+    {
+        "name": "ISIS Configuration (Cisco IOS)",
+        "model": ISISConfiguration,
+        "description": "Generate Cisco IOS ISIS configuration",
+        "file": "cisco_ios_isis.j2",
+        "mime_type": "text/plain",
+        "file_extension": "txt",
+    },
+    {
+        "name": "OSPF Configuration (Cisco IOS)",
+        "model": OSPFConfiguration,
+        "description": "Generate Cisco IOS OSPF configuration",
+        "file": "cisco_ios_ospf.j2",
+        "mime_type": "text/plain",
+        "file_extension": "txt",
+    },
+    # Cisco IOS XR Templates
+    {
+        "name": "ISIS Configuration (Cisco IOS XR)",
+        "model": ISISConfiguration,
+        "description": "Generate Cisco IOS XR ISIS configuration",
+        "file": "cisco_iosxr_isis.j2",
+        "mime_type": "text/plain",
+        "file_extension": "txt",
+    },
+    {
+        "name": "OSPF Configuration (Cisco IOS XR)",
+        "model": OSPFConfiguration,
+        "description": "Generate Cisco IOS XR OSPF configuration",
+        "file": "cisco_iosxr_ospf.j2",
+        "mime_type": "text/plain",
+        "file_extension": "txt",
+    },
+    # Juniper JunOS Templates
+    {
+        "name": "ISIS Configuration (Juniper JunOS)",
+        "model": ISISConfiguration,
+        "description": "Generate Juniper JunOS ISIS configuration",
+        "file": "juniper_isis.j2",
+        "mime_type": "text/plain",
+        "file_extension": "txt",
+    },
+    # Arista EOS Templates
+    {
+        "name": "ISIS Configuration (Arista EOS)",
+        "model": ISISConfiguration,
+        "description": "Generate Arista EOS ISIS configuration",
+        "file": "arista_eos_isis.j2",
+        "mime_type": "text/plain",
+        "file_extension": "txt",
+    },
+    {
+        "name": "OSPF Configuration (Arista EOS)",
+        "model": OSPFConfiguration,
+        "description": "Generate Arista EOS OSPF configuration",
+        "file": "arista_eos_ospf.j2",
+        "mime_type": "text/plain",
+        "file_extension": "txt",
+    },
+]
+
+TEMPLATE_FIELDS = ["description", "template_code", "mime_type", "file_extension"]
 
 
 class Command(BaseCommand):
@@ -35,36 +120,77 @@ class Command(BaseCommand):
         # Get the base directory for the app
         base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-        # Load Config Context Schemas
-        self.load_config_context_schemas(base_dir, force)
+        schemas = self.read_config_context_schemas(base_dir)
+        templates = self.read_export_templates(base_dir)
+        fingerprint = self.fingerprint(schemas, templates)
+
+        # Fast path: bundled resources are unchanged since the last load and are still in the database
+        if not force and self.stored_fingerprint() == fingerprint and self.resources_present(schemas, templates):
+            self.stdout.write(self.style.SUCCESS("  ✓ Resources unchanged since last load, nothing to do"))
+            return
 
-        # Load Export Templates
-        self.load_export_templates(base_dir, force)
+        with transaction.atomic():
+            # Load Config Context Schemas
+            self.load_config_context_schemas(schemas, force)
+
+            # Load Export Templates
+            self.load_export_templates(templates, force)
+
+            IGPResourceFingerprint.objects.update_or_create(
+                name=FINGERPRINT_NAME, defaults={"fingerprint": fingerprint}
+            )
+        cache.set(FINGERPRINT_CACHE_KEY, fingerprint, timeout=None)
 
         self.stdout.write("\n" + "=" * 70)
         self.stdout.write(self.style.SUCCESS("✓ IGP resources loaded successfully"))
         self.stdout.write("=" * 70 + "\n")
 
-    def load_config_context_schemas(self, base_dir, force=False):
-        """Load config context schemas from JSON files."""
-        self.stdout.write("\n" + self.style.SUCCESS("Config Context Schemas:"))
-        self.stdout.write("-" * 70)
-
+    @staticmethod
+    def fingerprint(schemas, templates):
+        """Return a content fingerprint of the bundled schemas and (wrapped) export templates."""
+        digest = hashlib.sha256()
+        for schema in schemas:
+            digest.update(
+                json.dumps([schema["name"], schema["description"], schema["data_schema"]], sort_keys=True).encode()
+            )
+        for template in templates:
+            digest.update(
+                json.dumps(
+                    [template["content_type"].pk, template["name"]] + [template[f] for f in TEMPLATE_FIELDS]
+                ).encode()
+            )
+        return digest.hexdigest()
+
+    @staticmethod
+    def stored_fingerprint():
+        """Return the fingerprint of the last loaded resource set, read from the cache or else the database."""
+        fingerprint = cache.get(FINGERPRINT_CACHE_KEY)
+        if fingerprint is None:
+            fingerprint = (
+                IGPResourceFingerprint.objects.filter(name=FINGERPRINT_NAME)
+                .values_list("fingerprint", flat=True)
+                .first()
+            )
+            if fingerprint is not None:
+                cache.set(FINGERPRINT_CACHE_KEY, fingerprint, timeout=None)
+        return fingerprint
+
+    @staticmethod
+    def resources_present(schemas, templates):
+        """Check that every bundled resource exists in the database (e.g. the database was not reset)."""
+        schema_count = ConfigContextSchema.objects.filter(name__in=[schema["name"] for schema in schemas]).count()
+        template_count = ExportTemplate.objects.filter(
+            content_type__in={template["content_type"] for template in templates},
+            name__in=[template["name"] for template in templates],
+        ).count()
+        return schema_count == len(schemas) and template_count == len(templates)
+
+    def read_config_context_schemas(self, base_dir):
+        """Read config context schemas from JSON files."""
         schemas_dir = os.path.join(base_dir, "schemas")
-        schemas = [
-            {
-                "name": "IGP ISIS Configuration",
-                "description": "JSON Schema for ISIS config context parameters",
-                "file": "config_context_isis.json",
-            },
-            {
-                "name": "IGP OSPF Configuration",
-                "description": "JSON Schema for OSPF config context parameters",
-                "file": "config_context_ospf.json",
-            },
-        ]
+        schemas = []
 
-        for schema_def in schemas:
+        for schema_def in SCHEMA_DEFINITIONS:
             schema_file = os.path.join(schemas_dir, schema_def["file"])
 
             if not os.path.exists(schema_file):
@@ -73,113 +199,16 @@ class Command(BaseCommand):
 
             # Load schema content
             with open(schema_file, "r", encoding="utf-8") as f:
-                schema_data = json.load(f)
-
-            # Check if schema exists
-            existing = ConfigContextSchema.objects.filter(name=schema_def["name"]).first()
-
-            if existing and not force:
-                self.stdout.write(
-                    self.style.WARNING(f"  ⊘ Schema already exists: {schema_def['name']} (use --force to update)")
-                )
-                continue
-
-            # Create or update schema
-            schema, created = ConfigContextSchema.objects.update_or_create(
-                name=schema_def["name"],
-                defaults={
-                    "description": schema_def["description"],
-                    "data_schema": schema_data,
-                },
-            )
-
-            if created:
-                self.stdout.write(self.style.SUCCESS(f"  ✓ Created: {schema_def['name']}"))
-            else:
-                self.stdout.write(self.style.SUCCESS(f"  ✓ Updated: {schema_def['name']}"))
+                schemas.append({**schema_def, "data_schema": json.load(f)})
 
-    def load_export_templates(self, base_dir, force=False):
-        """Load export templates from Jinja2 files."""
-        self.stdout.write("\n" + self.style.SUCCESS("Export Templates:"))
-        self.stdout.write("-" * 70)
+        return schemas
 
+    def read_export_templates(self, base_dir):
+        """Read export templates from Jinja2 files and wrap them for the export template context."""
         templates_dir = os.path.join(base_dir, "templates", "config_templates")
+        templates = []
 
-        # Get content types
-        isis_ct = ContentType.objects.get_for_model(ISISConfiguration)
-        ospf_ct = ContentType.objects.get_for_model(OSPFConfiguration)
-
-        templates = [
-            # Cisco IOS Templates
-            {
-                "name": "ISIS Configuration (Cisco IOS)",
-                "content_type": isis_ct,
-                "description": "Generate Cisco IOS ISIS configuration",
-                "file": "cisco_ios_isis.j2",
-                "template_code": None,  # Will be loaded from file
-                "mime_type": "text/plain",
-                "file_extension": "txt",
-            },
-            {
-                "name": "OSPF Configuration (Cisco IOS)",
-                "content_type": ospf_ct,
-                "description": "Generate Cisco IOS OSPF configuration",
-                "file": "cisco_ios_ospf.j2",
-                "template_code": None,
-                "mime_type": "text/plain",
-                "file_extension": "txt",
-            },
-            # Cisco IOS XR Templates
-            {
-                "name": "ISIS Configuration (Cisco IOS XR)",
-                "content_type": isis_ct,
-                "description": "Generate Cisco IOS XR ISIS configuration",
-                "file": "cisco_iosxr_isis.j2",
-                "template_code": None,
-                "mime_type": "text/plain",
-                "file_extension": "txt",
-            },
-            {
-                "name": "OSPF Configuration (Cisco IOS XR)",
-                "content_type": ospf_ct,
-                "description": "Generate Cisco IOS XR OSPF configuration",
-                "file": "cisco_iosxr_ospf.j2",
-                "template_code": None,
-                "mime_type": "text/plain",
-                "file_extension": "txt",
-            },
-            # Juniper JunOS Templates
-            {
-                "name": "ISIS Configuration (Juniper JunOS)",
-                "content_type": isis_ct,
-                "description": "Generate Juniper JunOS ISIS configuration",
-                "file": "juniper_isis.j2",
-                "template_code": None,
-                "mime_type": "text/plain",
-                "file_extension": "txt",
-            },
-            # Arista EOS Templates
-            {
-                "name": "ISIS Configuration (Arista EOS)",
-                "content_type": isis_ct,
-                "description": "Generate Arista EOS ISIS configuration",
-                "file": "arista_eos_isis.j2",
-                "template_code": None,
-                "mime_type": "text/plain",
-                "file_extension": "txt",
-            },
-            {
-                "name": "OSPF Configuration (Arista EOS)",
-                "content_type": ospf_ct,
-                "description": "Generate Arista EOS OSPF configuration",
-                "file": "arista_eos_ospf.j2",
-                "template_code": None,
-                "mime_type": "text/plain",
-                "file_extension": "txt",
-            },
-        ]
-
-        for template_def in templates:
+        for template_def in TEMPLATE_DEFINITIONS:
             template_file = os.path.join(templates_dir, template_def["file"])
 
             if not os.path.exists(template_file):
@@ -190,42 +219,97 @@ class Command(BaseCommand):
             with open(template_file, "r", encoding="utf-8") as f:
                 template_code = f.read()
 
-            # Prepare template for ISIS Configuration
             # Need to wrap it to work with export template context
-            if template_def["content_type"] == isis_ct:
+            if template_def["model"] is ISISConfiguration:
                 template_code = self._wrap_isis_template(template_code)
-            elif template_def["content_type"] == ospf_ct:
+            else:
                 template_code = self._wrap_ospf_template(template_code)
 
-            # Check if template exists
-            existing = ExportTemplate.objects.filter(
-                content_type=template_def["content_type"],
-                name=template_def["name"],
-            ).first()
+            templates.append(
+                {
+                    **template_def,
+                    "content_type": ContentType.objects.get_for_model(template_def["model"]),
+                    "template_code": template_code,
+                }
+            )
+
+        return templates
+
+    def load_config_context_schemas(self, schemas, force=False):
+        """Create missing config context schemas (and update existing ones with --force) in bulk."""
+        self.stdout.write("\n" + self.style.SUCCESS("Config Context Schemas:"))
+        self.stdout.write("-" * 70)
+
+        existing = {
+            schema.name: schema
+            for schema in ConfigContextSchema.objects.filter(name__in=[schema["name"] for schema in schemas])
+        }
+        to_create, to_update = [], []
 
-            if existing and not force:
+        for schema_def in schemas:
+            schema = existing.get(schema_def["name"])
+
+            if schema is None:
+                to_create.append(
+                    ConfigContextSchema(
+                        name=schema_def["name"],
+                        description=schema_def["description"],
+                        data_schema=schema_def["data_schema"],
+                    )
+                )
+                self.stdout.write(self.style.SUCCESS(f"  ✓ Created: {schema_def['name']}"))
+            elif not force:
                 self.stdout.write(
-                    self.style.WARNING(f"  ⊘ Template already exists: {template_def['name']} (use --force to update)")
+                    self.style.WARNING(f"  ⊘ Schema already exists: {schema_def['name']} (use --force to update)")
                 )
-                continue
+            else:
+                schema.description = schema_def["description"]
+                schema.data_schema = schema_def["data_schema"]
+                to_update.append(schema)
+                self.stdout.write(self.style.SUCCESS(f"  ✓ Updated: {schema_def['name']}"))
 
-            # Create or update template
-            template, created = ExportTemplate.objects.update_or_create(
-                content_type=template_def["content_type"],
-                name=template_def["name"],
-                defaults={
-                    "description": template_def["description"],
-                    "template_code": template_code,
-                    "mime_type": template_def["mime_type"],
-                    "file_extension": template_def["file_extension"],
-                },
+        ConfigContextSchema.objects.bulk_create(to_create)
+        ConfigContextSchema.objects.bulk_update(to_update, ["description", "data_schema"])
+
+    def load_export_templates(self, templates, force=False):
+        """Create missing export templates (and update existing ones with --force) in bulk."""
+        self.stdout.write("\n" + self.style.SUCCESS("Export Templates:"))
+        self.stdout.write("-" * 70)
+
+        existing = {
+            (template.content_type_id, template.name): template
+            for template in ExportTemplate.objects.filter(
+                content_type__in={template["content_type"] for template in templates},
+                name__in=[template["name"] for template in templates],
             )
+        }
+        to_create, to_update = [], []
 
-            if created:
+        for template_def in templates:
+            template = existing.get((template_def["content_type"].pk, template_def["name"]))
+
+            if template is None:
+                to_create.append(
+                    ExportTemplate(
+                        content_type=template_def["content_type"],
+                        name=template_def["name"],
+                        **{field: template_def[field] for field in TEMPLATE_FIELDS},
+                    )
+                )
                 self.stdout.write(self.style.SUCCESS(f"  ✓ Created: {template_def['name']}"))
+            elif not force:
+                self.stdout.write(
+                    self.style.WARNING(f"  ⊘ Template already exists: {template_def['name']} (use --force to update)")
+                )
             else:
+                for field in TEMPLATE_FIELDS:
+                    setattr(template, field, template_def[field])
+                to_update.append(template)
                 self.stdout.write(self.style.SUCCESS(f"  ✓ Updated: {template_def['name']}"))
 
+        ExportTemplate.objects.bulk_create(to_create)
+        ExportTemplate.objects.bulk_update(to_update, TEMPLATE_FIELDS)
+
     def _wrap_isis_template(self, template_code):
         """Wrap ISIS template for export template context."""
         # Export templates can be called from detail page (single object) or list page (queryset)
@@ -0,0 +1,73 @@
+"""Management command to profile an ISIS/OSPF export template render."""
+
+import os
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand, CommandError
+from nautobot.extras.models import ExportTemplate
+
+from nautobot_igp_models.models import ISISConfiguration, OSPFConfiguration
+from nautobot_igp_models.profiling import DEFAULT_TOP_QUERIES, profile_call
+
+MODELS = {"isis": ISISConfiguration, "ospf": OSPFConfiguration}
+
+
+class Command(BaseCommand):
+    """Render an export template under cProfile and write a collapsed-stack file and a slowest-SQL report."""
+
+    help = "Profile an ISIS/OSPF export template render (collapsed stacks and slowest SQL statements)"
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument("protocol", choices=sorted(MODELS), help="Configuration model the template renders")
+        parser.add_argument("template", help="Export template name, e.g. 'Cisco IOS'")
+        parser.add_argument(
+            "--pk",
+            action="append",
+            dest="pks",
+            help="Only render these configurations (repeatable; default: all)",
+        )
+        parser.add_argument(
+            "--top",
+            type=int,
+            default=DEFAULT_TOP_QUERIES,
+            help=f"Number of slowest SQL statements to report (default: {DEFAULT_TOP_QUERIES})",
+        )
+        parser.add_argument(
+            "--output-dir",
+            default=".",
+            help="Directory to write the report files to (default: current directory)",
+        )
+
+    def handle(self, *args, **options):
+        """Execute the command."""
+        model = MODELS[options["protocol"]]
+        try:
+            export_template = ExportTemplate.objects.get(
+                content_type=ContentType.objects.get_for_model(model), name=options["template"]
+            )
+        except ExportTemplate.DoesNotExist as error:
+            raise CommandError(
+                f"No export template named {options['template']!r} for {model._meta.verbose_name}"
+            ) from error
+
+        queryset = model.objects.all()
+        if options["pks"]:
+            queryset = queryset.filter(pk__in=options["pks"])
+
+        profile = profile_call(export_template.render, queryset)
+
+        name = f"{options['protocol']}-{export_template.name}".lower().replace(" ", "-")
+        os.makedirs(options["output_dir"], exist_ok=True)
+        for filename, text in profile.files(name, options["top"]).items():
+            path = os.path.join(options["output_dir"], filename)
+            with open(path, "w", encoding="utf-8") as report_file:
+                report_file.write(text)
+            self.stdout.write(f"  Wrote {path}")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rendered {len(profile.result)} characters in {profile.elapsed * 1000:.1f} ms; "
+                f"{len(profile.queries)} SQL statement(s) took {profile.query_seconds * 1000:.1f} ms"
+            )
+        )
@@ -0,0 +1,55 @@
+"""Management command to regenerate ISIS NETs from router IDs and ISIS areas in bulk."""
+
+from django.core.management.base import BaseCommand
+
+from nautobot_igp_models.nets import DEFAULT_BATCH_SIZE, regenerate_nets
+
+
+class Command(BaseCommand):
+    """Regenerate the NET of every ISIS configuration with a single bulk update."""
+
+    help = "Regenerate ISIS NETs from the router ID and ISIS area of each routing instance"
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            "--missing-only",
+            action="store_true",
+            help="Only fill in ISIS configurations without a NET",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report what would change without writing",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help=f"Rows per bulk update statement (default: {DEFAULT_BATCH_SIZE})",
+        )
+
+    def handle(self, *args, **options):
+        """Execute the command."""
+        result = regenerate_nets(
+            missing_only=options["missing_only"],
+            dry_run=options["dry_run"],
+            batch_size=options["batch_size"],
+        )
+
+        for net, config_pks in result.collisions.items():
+            self.stdout.write(
+                self.style.WARNING(f"  ✗ {net} would be shared by {len(config_pks)} ISIS configurations: {config_pks}")
+            )
+        if result.skipped:
+            self.stdout.write(
+                self.style.WARNING(f"  ! {len(result.skipped)} ISIS configuration(s) have no router ID or ISIS area")
+            )
+
+        verb = "Would update" if options["dry_run"] else "Updated"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{verb} {result.updated} NET(s); {result.unchanged} unchanged, "
+                f"{result.collision_count} left untouched because of collisions"
+            )
+        )
@@ -0,0 +1,53 @@
+"""Management command to capture and compare IGP topology snapshots."""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from nautobot_igp_models.models import IGPTopologySnapshot
+from nautobot_igp_models.snapshots import diff_snapshots, take_snapshot
+
+
+class Command(BaseCommand):
+    """Capture an IGP topology snapshot, or compare two stored snapshots."""
+
+    help = "Capture an IGP topology snapshot (stored as a delta), or compare two snapshots with --diff"
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            "--diff",
+            nargs=2,
+            type=int,
+            metavar=("OLD", "NEW"),
+            help="Compare the snapshots with these sequence numbers instead of capturing one",
+        )
+
+    def handle(self, *args, **options):
+        """Execute the command."""
+        if not options["diff"]:
+            snapshot = take_snapshot()
+            kind = "checkpoint" if snapshot.checkpoint else "delta"
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Stored {snapshot} as a {kind}: {snapshot.row_count} rows, {snapshot.change_count} changed"
+                )
+            )
+            return
+
+        snapshots = IGPTopologySnapshot.objects.in_bulk(options["diff"], field_name="sequence")
+        missing = [sequence for sequence in options["diff"] if sequence not in snapshots]
+        if missing:
+            raise CommandError(f"No IGP topology snapshot with sequence {missing[0]}")
+
+        old_sequence, new_sequence = options["diff"]
+        diff = diff_snapshots(snapshots[old_sequence], snapshots[new_sequence])
+        if not diff:
+            self.stdout.write(self.style.SUCCESS("No differences"))
+        for table, table_diff in diff.items():
+            self.stdout.write(f"{table}:")
+            for key, row in table_diff["added"].items():
+                self.stdout.write(self.style.SUCCESS(f"  + {key} {row}"))
+            for key, row in table_diff["removed"].items():
+                self.stdout.write(self.style.ERROR(f"  - {key} {row}"))
+            for key, columns in table_diff["changed"].items():
+                changes = ", ".join(f"{column}: {old!r} -> {new!r}" for column, (old, new) in columns.items())
+                self.stdout.write(self.style.WARNING(f"  ~ {key} {changes}"))
@@ -0,0 +1,364 @@
+"""Traffic engineering metric optimization.
+
+Finds ISIS metrics / OSPF costs that lower the maximum link utilization for a demand matrix. The compiled graph is
+loaded into NumPy arrays of directed arcs, one per link direction, each carrying the effective metric of the sending
+interface and the capacity of the slower end. Each candidate metric vector is evaluated vectorized:
+
+- all-pairs shortest distances with a Floyd-Warshall pass over an n x n matrix;
+- for all destinations at once, the arcs on a shortest path and their equal-cost split ratios, then the traffic
+  through every node towards each destination, settling the farthest nodes first.
+
+A local search raises the metrics of the most utilized arcs and lowers those of the other arcs leaving the same
+routers, keeping the best move of each round, until no move lowers the objective (maximum utilization, then the sum
+of squared utilizations). The moves of a round are evaluated across a process pool. The result is a change set of
+interface metric overrides that ``apply_proposal()`` writes with one ``bulk_update``.
+
+``numpy`` is an optional dependency, installed with the ``optimizer`` extra.
+"""
+
+import csv
+import io
+import logging
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
+from django.utils import timezone
+
+from nautobot_igp_models import cache
+from nautobot_igp_models.failures import default_workers, worker_pool
+from nautobot_igp_models.graph import compile_graph
+from nautobot_igp_models.models import IGPRoutingInstance
+from nautobot_igp_models.topology import PROTOCOL_MODELS
+
+logger = logging.getLogger(__name__)
+
+DEMAND_COLUMNS = ("source", "destination", "gbps")
+
+PROPOSAL_COLUMNS = [
+    "protocol",
+    "device",
+    "interface",
+    "neighbor",
+    "config_id",
+    "current_metric",
+    "proposed_metric",
+    "capacity_gbps",
+    "current_load_gbps",
+    "proposed_load_gbps",
+    "current_utilization",
+    "proposed_utilization",
+]
+
+# Interface configuration field holding the metric of each protocol
+METRIC_FIELDS = {"ISIS": "metric", "OSPF": "cost"}
+
+DEFAULT_ITERATIONS = 50
+DEFAULT_MAX_METRIC = 65535
+DEFAULT_BATCH_SIZE = 1000
+
+# Most utilized arcs whose metrics are changed in each round
+HOT_ARCS = 4
+
+# Below this many nodes an evaluation is too cheap for a process pool to pay off
+MIN_PARALLEL_NODES = 50
+
+KBPS_PER_GBPS = 1_000_000
+
+_worker_state = {}
+
+
+def import_numpy():
+    """Return the ``numpy`` module, or raise ImproperlyConfigured if it is not installed."""
+    try:
+        import numpy  # pylint: disable=import-outside-toplevel
+    except ImportError as error:
+        raise ImproperlyConfigured(
+            "Metric optimization requires numpy; install nautobot-igp-models[optimizer]"
+        ) from error
+    return numpy
+
+
+class TrafficModel:
+    """Directed arcs and demand matrix of a network, as NumPy arrays.
+
+    Attributes:
+        node_count (int): Number of nodes.
+        tails, heads (ndarray): Node index each arc leaves from and goes to.
+        metrics (ndarray): Current metric per arc.
+        capacity (ndarray): Capacity per arc in Gbps; ``inf`` when unknown, so the arc never counts as utilized.
+        demand (ndarray): node_count x node_count matrix of Gbps from source (row) to destination (column).
+        out_arcs, in_arcs (ndarray): Per node, the indexes of the arcs leaving / entering it, padded with
+            ``len(tails)``.
+        arcs (list): Per arc, a dict describing it (``config_id``, ``device``, ``interface``, ``neighbor``).
+    """
+
+    def __init__(self, node_count, tails, heads, metrics, capacity, demand, arcs=None):
+        """Build the model from per-arc sequences and a demand matrix."""
+        np = import_numpy()
+        self.node_count = node_count
+        self.tails = np.asarray(tails, dtype=np.int64)
+        self.heads = np.asarray(heads, dtype=np.int64)
+        self.metrics = np.asarray(metrics, dtype=np.float64)
+        self.capacity = np.asarray(capacity, dtype=np.float64)
+        self.demand = np.asarray(demand, dtype=np.float64)
+        self.arcs = arcs or [{} for _ in range(len(self.tails))]
+        self.out_arcs = _padded_arcs(np, node_count, self.tails)
+        self.in_arcs = _padded_arcs(np, node_count, self.heads)
+
+
+def _padded_arcs(np, node_count, endpoints):
+    """Return per node the indexes of the arcs with that endpoint, padded with the arc count."""
+    degree = np.bincount(endpoints, minlength=node_count)
+    padded = np.full((node_count, max(int(degree.max(initial=0)), 1)), len(endpoints), dtype=np.int64)
+    filled = np.zeros(node_count, dtype=np.int64)
+    for arc, node in enumerate(endpoints):
+        padded[node, filled[node]] = arc
+        filled[node] += 1
+    return padded
+
+
+def shortest_distances(model, weights):
+    """Return the node_count x node_count matrix of shortest distances under ``weights`` (``inf`` if unreachable)."""
+    np = import_numpy()
+    distance = np.full((model.node_count, model.node_count), np.inf)
+    np.fill_diagonal(distance, 0.0)
+    np.minimum.at(distance, (model.tails, model.heads), weights)
+    for via in range(model.node_count):
+        np.minimum(distance, distance[:, via, None] + distance[None, via, :], out=distance)
+    return distance
+
+
+def arc_loads(model, weights):
+    """Route the demand matrix over the shortest paths under ``weights``, splitting evenly over equal-cost paths.
+
+    Returns:
+        ndarray: Gbps carried per arc.
+    """
+    np = import_numpy()
+    node_count, arc_count = model.node_count, len(model.tails)
+    distance = shortest_distances(model, weights)
+    # on_path[arc, destination]: the arc starts a shortest path from its tail to the destination
+    on_path = np.isfinite(distance[model.heads]) & (distance[model.tails] == weights[:, None] + distance[model.heads])
+    # The extra row is the padding arc of out_arcs/in_arcs, which is on no path and carries nothing
+    on_path = np.vstack([on_path, np.zeros((1, node_count), dtype=bool)])
+    tails = np.append(model.tails, 0)
+    next_hops = on_path[model.out_arcs].sum(axis=1)
+    split = np.zeros((arc_count + 1, node_count))
+    np.divide(on_path, next_hops[tails], out=split, where=on_path)
+
+    # flow[node, destination]: traffic through the node towards the destination. A node's next hops are strictly
+    # closer to the destination, so settling nodes farthest first lets each one pull from finished predecessors.
+    flow = model.demand.copy()
+    destinations = np.arange(node_count)
+    columns = destinations[:, None]
+    order = np.argsort(-distance, axis=0, kind="stable")
+    for position in range(node_count):
+        nodes = order[position]
+        arcs = model.in_arcs[nodes]
+        flow[nodes, destinations] += (flow[tails[arcs], columns] * split[arcs, columns]).sum(axis=1)
+    return (flow[model.tails] * split[:arc_count]).sum(axis=1)
+
+
+def utilization(model, load):
+    """Return the utilization of every arc carrying ``load`` (0 for arcs of unknown capacity)."""
+    return load / model.capacity
+
+
+def objective(model, weights):
+    """Return (maximum utilization, sum of squared utilizations) under ``weights``; lower is better."""
+    arc_utilization = utilization(model, arc_loads(model, weights))
+    return float(arc_utilization.max(initial=0.0)), float((arc_utilization**2).sum())
+
+
+def candidate_moves(model, weights, arc_utilization, max_metric, hot_arcs=HOT_ARCS):
+    """Return (arc, new metric) moves for the next local search round.
+
+    For each of the ``hot_arcs`` most utilized arcs, its metric is raised, and the metrics of the less utilized arcs
+    leaving the same router are lowered, to shift traffic towards them.
+    """
+    np = import_numpy()
+    arc_count = len(model.tails)
+    moves = set()
+    for arc in np.argsort(-arc_utilization, kind="stable")[:hot_arcs]:
+        if arc_utilization[arc] <= 0:
+            break
+        metric = int(weights[arc])
+        for new_metric in (metric + 1, -(-metric * 3 // 2), metric * 2):
+            moves.add((int(arc), min(new_metric, max_metric)))
+        for other in model.out_arcs[model.tails[arc]]:
+            if other < arc_count and other != arc and arc_utilization[other] < arc_utilization[arc]:
+                metric = int(weights[other])
+                for new_metric in (metric - 1, metric // 2):
+                    moves.add((int(other), max(new_metric, 1)))
+    return sorted(move for move in moves if move[1] != weights[move[0]])
+
+
+def _init_worker(model):
+    _worker_state["model"] = model
+
+
+def _evaluate_moves(task):
+    weights, moves = task
+    model = _worker_state["model"]
+    results = []
+    for arc, new_metric in moves:
+        candidate = weights.copy()
+        candidate[arc] = new_metric
+        results.append(objective(model, candidate))
+    return results
+
+
+def optimize_metrics(model, iterations=DEFAULT_ITERATIONS, max_metric=DEFAULT_MAX_METRIC, workers=None):
+    """Search for arc metrics that lower the maximum utilization of ``model``.
+
+    Args:
+        model: TrafficModel.
+        iterations: Maximum number of accepted moves.
+        max_metric: Highest metric a move may set.
+        workers: Worker processes evaluating the moves of a round (default: one per CPU). Runs in-process for 1
+            worker, small networks, or in a daemonic process (see failures.worker_pool()).
+
+    Returns:
+        tuple: (metrics per arc, objective before, objective after)
+    """
+    workers = workers or default_workers()
+    weights = model.metrics.copy()
+    initial = current = objective(model, weights)
+    with worker_pool(workers if model.node_count >= MIN_PARALLEL_NODES else 1, _init_worker, (model,)) as pool:
+        if pool is None:
+            _init_worker(model)
+        for _ in range(iterations):
+            arc_utilization = utilization(model, arc_loads(model, weights))
+            moves = candidate_moves(model, weights, arc_utilization, max_metric)
+            if not moves:
+                break
+            if pool is None:
+                results = _evaluate_moves((weights, moves))
+            else:
+                chunks = [moves[start::workers] for start in range(workers)]
+                chunk_results = list(pool.map(_evaluate_moves, [(weights, chunk) for chunk in chunks]))
+                results = [None] * len(moves)
+                for start, chunk_result in enumerate(chunk_results):
+                    results[start::workers] = chunk_result
+            best = min(range(len(moves)), key=results.__getitem__)
+            if results[best] >= current:
+                break
+            arc, new_metric = moves[best]
+            weights[arc] = new_metric
+            current = results[best]
+            logger.debug("Metric %s -> %d: max utilization %.3f", model.arcs[arc], new_metric, current[0])
+    return weights, initial, current
+
+
+def parse_demands(text):
+    """Parse a demand CSV with DEMAND_COLUMNS headers into (source, destination, Gbps) tuples.
+
+    Raises:
+        ValueError: If a column is missing or a demand is not a non-negative number.
+    """
+    reader = csv.DictReader(io.StringIO(text))
+    missing = set(DEMAND_COLUMNS) - set(reader.fieldnames or ())
+    if missing:
+        raise ValueError(f"Demand file is missing column(s): {', '.join(sorted(missing))}")
+    demands = []
+    for line, row in enumerate(reader, start=2):
+        try:
+            gbps = float(row["gbps"])
+        except (TypeError, ValueError):
+            raise ValueError(f"Line {line}: invalid demand {row['gbps']!r}") from None
+        if gbps < 0:
+            raise ValueError(f"Line {line}: negative demand {gbps}")
+        demands.append((row["source"].strip(), row["destination"].strip(), gbps))
+    return demands
+
+
+def load_traffic_model(protocol, demands, area=None):
+    """Load the cabled topology of ``protocol`` with effective metrics and interface speeds, and the demands.
+
+    Demand endpoints are matched to routing instances by router ID, or else by device name.
+
+    Returns:
+        tuple: (TrafficModel, list of the demands whose endpoints are not in the graph)
+    """
+    np = import_numpy()
+    graph = compile_graph(protocol, area=area)
+    speeds = {str(pk): speed for pk, speed in PROTOCOL_MODELS[protocol].objects.values_list("pk", "interface__speed")}
+    tails, heads, metrics, capacity, arcs = [], [], [], [], []
+    for link, row in enumerate(graph.links):
+        node_a, node_b = graph.link_endpoints(link)
+        speed = min(
+            (speed for speed in (speeds.get(row["a_config_id"]), speeds.get(row["b_config_id"])) if speed),
+            default=None,
+        )
+        for side, tail, head, neighbor in (("a", node_a, node_b, "b"), ("b", node_b, node_a, "a")):
+            tails.append(tail)
+            heads.append(head)
+            metrics.append(row[f"{side}_metric"])
+            capacity.append(speed / KBPS_PER_GBPS if speed else np.inf)
+            arcs.append(
+                {
+                    "config_id": row[f"{side}_config_id"],
+                    "device": row[f"{side}_device"],
+                    "interface": row[f"{side}_interface"],
+                    "neighbor": row[f"{neighbor}_device"],
+                }
+            )
+
+    endpoints = {}
+    instances = IGPRoutingInstance.objects.filter(pk__in=graph.nodes).values_list(
+        "pk", "router_id__host", "device__name"
+    )
+    for pk, router_id, device_name in instances:
+        node = graph.node_index[str(pk)]
+        endpoints.setdefault(device_name, node)
+        if router_id:
+            endpoints[str(router_id)] = node
+    demand = np.zeros((len(graph), len(graph)))
+    unmatched = []
+    for source, destination, gbps in demands:
+        if source in endpoints and destination in endpoints:
+            demand[endpoints[source], endpoints[destination]] += gbps
+        else:
+            unmatched.append((source, destination, gbps))
+    return TrafficModel(len(graph), tails, heads, metrics, capacity, demand, arcs), unmatched
+
+
+def propose_metrics(protocol, model, weights):
+    """Return one PROPOSAL_COLUMNS row per arc whose metric differs between ``model`` and ``weights``."""
+    current_load, proposed_load = arc_loads(model, model.metrics), arc_loads(model, weights)
+    rows = []
+    for arc in (weights != model.metrics).nonzero()[0]:
+        capacity = model.capacity[arc]
+        rows.append(
+            {
+                "protocol": protocol,
+                **model.arcs[arc],
+                "current_metric": int(model.metrics[arc]),
+                "proposed_metric": int(weights[arc]),
+                "capacity_gbps": float(capacity) if capacity != float("inf") else None,
+                "current_load_gbps": round(float(current_load[arc]), 3),
+                "proposed_load_gbps": round(float(proposed_load[arc]), 3),
+                "current_utilization": round(float(current_load[arc] / capacity), 4),
+                "proposed_utilization": round(float(proposed_load[arc] / capacity), 4),
+            }
+        )
+    return rows
+
+
+def apply_proposal(protocol, rows, batch_size=DEFAULT_BATCH_SIZE):
+    """Write the proposed metrics as interface overrides with a single ``bulk_update``.
+
+    Cached effective configurations of the updated interface configurations and whole-topology analyses are
+    invalidated, as ``bulk_update()`` sends no signals.
+
+    Returns:
+        int: Number of interface configurations updated.
+    """
+    model, field = PROTOCOL_MODELS[protocol], METRIC_FIELDS[protocol]
+    now = timezone.now()
+    to_update = [model(pk=row["config_id"], last_updated=now, **{field: row["proposed_metric"]}) for row in rows]
+    if to_update:
+        with transaction.atomic():
+            model.objects.bulk_update(to_update, [field, "last_updated"], batch_size=batch_size)
+        cache.bump_objects(model, [interface_config.pk for interface_config in to_update])
+    return len(to_update)
@@ -0,0 +1,41 @@
+"""Prometheus metrics for nautobot_igp_models, exposed through Nautobot's /metrics endpoint."""
+
+from prometheus_client.core import CounterMetricFamily
+
+from nautobot_igp_models.instrumentation import snapshot
+
+
+def metric_effective_config_instrumentation():
+    """Yield the effective configuration instrumentation totals of this process.
+
+    All counters are zero unless the ``instrumentation_enabled`` app setting is true.
+    """
+    operations, merges = snapshot()
+    families = {
+        "calls": CounterMetricFamily(
+            "nautobot_igp_models_operation_calls", "Instrumented IGP operation calls", labels=["operation"]
+        ),
+        "queries": CounterMetricFamily(
+            "nautobot_igp_models_operation_queries",
+            "Database queries issued by instrumented IGP operations",
+            labels=["operation"],
+        ),
+        "seconds": CounterMetricFamily(
+            "nautobot_igp_models_operation_seconds",
+            "Wall time spent in instrumented IGP operations",
+            labels=["operation"],
+        ),
+    }
+    for operation, totals in sorted(operations.items()):
+        for field, family in families.items():
+            family.add_metric([operation], totals[field])
+    yield from families.values()
+
+    merge_counter = CounterMetricFamily(
+        "nautobot_igp_models_config_context_merges", "Device config contexts rendered for IGP resolution"
+    )
+    merge_counter.add_metric([], merges)
+    yield merge_counter
+
+
+metrics = [metric_effective_config_instrumentation]
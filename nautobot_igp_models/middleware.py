@@ -0,0 +1,29 @@
+"""Middleware for nautobot_igp_models."""
+
+from django.conf import settings
+
+from nautobot_igp_models import instrumentation
+
+SUMMARY_HEADER = "X-IGP-Instrumentation"
+
+
+class InstrumentationSummaryMiddleware:
+    """Add a per-request summary of instrumented IGP operations as a response header in DEBUG mode."""
+
+    def __init__(self, get_response):
+        """Store the next handler in the chain."""
+        self.get_response = get_response
+
+    def __call__(self, request):
+        """Collect instrumentation for the request and report it in the response."""
+        if not (settings.DEBUG and instrumentation.instrumentation_enabled()):
+            return self.get_response(request)
+
+        instrumentation.start_request()
+        try:
+            response = self.get_response(request)
+        finally:
+            summary = instrumentation.finish_request()
+        if summary["operations"] or summary["merges"]:
+            response[SUMMARY_HEADER] = instrumentation.format_summary(summary)
+        return response
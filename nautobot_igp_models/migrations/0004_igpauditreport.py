@@ -0,0 +1,49 @@
+# Generated manually
+
+import uuid
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_igp_models", "0003_ospfinterfaceconfiguration_network_type"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IGPAuditReport",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True
+                    ),
+                ),
+                ("created", models.DateTimeField(auto_now_add=True)),
+                ("total_findings", models.PositiveIntegerField(default=0)),
+                (
+                    "summary",
+                    models.JSONField(
+                        default=dict,
+                        encoder=django.core.serializers.json.DjangoJSONEncoder,
+                        help_text="Number of findings per check.",
+                    ),
+                ),
+                (
+                    "findings",
+                    models.JSONField(
+                        default=dict,
+                        encoder=django.core.serializers.json.DjangoJSONEncoder,
+                        help_text="Findings per check.",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "IGP Audit Report",
+                "verbose_name_plural": "IGP Audit Reports",
+                "ordering": ["-created"],
+            },
+        ),
+    ]
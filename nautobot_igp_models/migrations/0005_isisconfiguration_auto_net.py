@@ -0,0 +1,21 @@
+# Generated manually
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_igp_models", "0004_igpauditreport"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="isisconfiguration",
+            name="auto_net",
+            field=models.BooleanField(
+                default=False,
+                help_text="Keep the NET derived from the instance's router ID and ISIS area when either changes",
+                verbose_name="Auto NET",
+            ),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated manually
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_igp_models", "0005_isisconfiguration_auto_net"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="igproutinginstance",
+            index=models.Index(fields=["protocol", "isis_area"], name="igp_instance_proto_area_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="isisconfiguration",
+            index=models.Index(fields=["system_id"], name="igp_isis_system_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="isisinterfaceconfiguration",
+            index=models.Index(fields=["isis_config", "circuit_type"], name="igp_isisif_cfg_circuit_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="ospfinterfaceconfiguration",
+            index=models.Index(fields=["ospf_config", "area"], name="igp_ospfif_cfg_area_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="ospfinterfaceconfiguration",
+            index=models.Index(fields=["area", "network_type"], name="igp_ospfif_area_nettype_idx"),
+        ),
+    ]
@@ -0,0 +1,69 @@
+# Generated manually
+
+from django.db import migrations, models
+
+import nautobot_igp_models.models
+
+
+def ospf_area_to_int(area):
+    """Frozen copy of nautobot_igp_models.utils.ospf_area_to_int for use in this migration."""
+    parts = str(area).strip().split(".")
+    try:
+        octets = [int(part) for part in parts]
+    except ValueError:
+        return None
+    if len(octets) == 1:
+        return octets[0] if 0 <= octets[0] <= 0xFFFFFFFF else None
+    if len(octets) != 4 or any(not 0 <= octet <= 255 for octet in octets):
+        return None
+    return (octets[0] << 24) | (octets[1] << 16) | (octets[2] << 8) | octets[3]
+
+
+def populate_area_number(apps, schema_editor):
+    """Backfill area_number from area for existing OSPF interface configurations."""
+    OSPFInterfaceConfiguration = apps.get_model("nautobot_igp_models", "OSPFInterfaceConfiguration")
+    to_update = []
+    for obj in OSPFInterfaceConfiguration.objects.only("pk", "area").iterator():
+        obj.area_number = ospf_area_to_int(obj.area)
+        to_update.append(obj)
+    OSPFInterfaceConfiguration.objects.bulk_update(to_update, ["area_number"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_igp_models", "0006_filter_indexes"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="ospfinterfaceconfiguration",
+            name="igp_ospfif_cfg_area_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="ospfinterfaceconfiguration",
+            name="igp_ospfif_area_nettype_idx",
+        ),
+        migrations.AddField(
+            model_name="ospfinterfaceconfiguration",
+            name="area_number",
+            field=models.PositiveBigIntegerField(blank=True, editable=False, null=True, verbose_name="Area (integer)"),
+        ),
+        migrations.AlterField(
+            model_name="ospfinterfaceconfiguration",
+            name="area",
+            field=models.CharField(
+                help_text="OSPF Area for this interface (e.g., 0.0.0.0)",
+                max_length=15,
+                validators=[nautobot_igp_models.models.validate_ospf_area],
+            ),
+        ),
+        migrations.RunPython(populate_area_number, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="ospfinterfaceconfiguration",
+            index=models.Index(fields=["ospf_config", "area_number"], name="igp_ospfif_cfg_areanum_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="ospfinterfaceconfiguration",
+            index=models.Index(fields=["area_number", "network_type"], name="igp_ospfif_areanum_nettype_idx"),
+        ),
+    ]
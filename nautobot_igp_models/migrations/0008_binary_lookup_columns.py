@@ -0,0 +1,89 @@
+# Generated manually
+
+from django.db import migrations, models
+
+
+def _system_id_to_int(system_id):
+    parts = system_id.split(".")
+    if len(parts) != 3 or any(len(part) != 4 for part in parts):
+        raise ValueError(system_id)
+    return int("".join(parts), 16)
+
+
+def _net_columns(net):
+    """Frozen copy of nautobot_igp_models.utils.net_columns for use in this migration."""
+    parts = (net or "").strip().split(".")
+    try:
+        if len(parts) == 3:
+            return _system_id_to_int(net.strip()), ""
+        if len(parts) >= 5:
+            area_hex = "".join(parts[:-4]).lower()
+            int(area_hex, 16)
+            return _system_id_to_int(".".join(parts[-4:-1])), area_hex
+    except ValueError:
+        pass
+    return None, ""
+
+
+def _ipv4_to_int(address):
+    octets = str(address).split("/")[0].split(".")
+    try:
+        values = [int(octet) for octet in octets]
+    except ValueError:
+        return None
+    if len(values) != 4 or any(not 0 <= value <= 255 for value in values):
+        return None
+    return (values[0] << 24) | (values[1] << 16) | (values[2] << 8) | values[3]
+
+
+def populate_lookup_columns(apps, schema_editor):
+    """Backfill the integer router ID and NET lookup columns."""
+    IGPRoutingInstance = apps.get_model("nautobot_igp_models", "IGPRoutingInstance")
+    ISISConfiguration = apps.get_model("nautobot_igp_models", "ISISConfiguration")
+
+    instances = []
+    for instance in IGPRoutingInstance.objects.filter(router_id__isnull=False).select_related("router_id"):
+        instance.router_id_number = _ipv4_to_int(instance.router_id.host)
+        instances.append(instance)
+    IGPRoutingInstance.objects.bulk_update(instances, ["router_id_number"], batch_size=1000)
+
+    configs = []
+    for config in ISISConfiguration.objects.only("pk", "system_id").iterator():
+        config.system_id_number, config.isis_area_hex = _net_columns(config.system_id)
+        configs.append(config)
+    ISISConfiguration.objects.bulk_update(configs, ["system_id_number", "isis_area_hex"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_igp_models", "0007_ospfinterfaceconfiguration_area_number"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="igproutinginstance",
+            name="router_id_number",
+            field=models.PositiveBigIntegerField(
+                blank=True, db_index=True, editable=False, null=True, verbose_name="Router ID (integer)"
+            ),
+        ),
+        migrations.AddField(
+            model_name="isisconfiguration",
+            name="system_id_number",
+            field=models.PositiveBigIntegerField(
+                blank=True, db_index=True, editable=False, null=True, verbose_name="System ID (integer)"
+            ),
+        ),
+        migrations.AddField(
+            model_name="isisconfiguration",
+            name="isis_area_hex",
+            field=models.CharField(
+                blank=True, default="", editable=False, max_length=26, verbose_name="Area (hex digits)"
+            ),
+        ),
+        migrations.RunPython(populate_lookup_columns, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="isisconfiguration",
+            index=models.Index(fields=["isis_area_hex", "system_id_number"], name="igp_isis_area_sysid_idx"),
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated manually
+
+import uuid
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_igp_models", "0008_binary_lookup_columns"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IGPTopologySnapshot",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True
+                    ),
+                ),
+                ("created", models.DateTimeField(auto_now_add=True)),
+                ("sequence", models.PositiveIntegerField(unique=True)),
+                (
+                    "checkpoint",
+                    models.BooleanField(default=False, help_text="Whether this snapshot holds the full topology."),
+                ),
+                (
+                    "row_count",
+                    models.PositiveIntegerField(default=0, help_text="Number of rows in the captured topology."),
+                ),
+                (
+                    "change_count",
+                    models.PositiveIntegerField(
+                        default=0, help_text="Number of rows added, changed or removed since the previous snapshot."
+                    ),
+                ),
+                (
+                    "summary",
+                    models.JSONField(
+                        default=dict,
+                        encoder=django.core.serializers.json.DjangoJSONEncoder,
+                        help_text="Number of rows per table.",
+                    ),
+                ),
+                ("data", models.BinaryField(help_text="zlib-compressed JSON of the full topology or of the delta.")),
+            ],
+            options={
+                "verbose_name": "IGP Topology Snapshot",
+                "verbose_name_plural": "IGP Topology Snapshots",
+                "ordering": ["-sequence"],
+            },
+        ),
+    ]
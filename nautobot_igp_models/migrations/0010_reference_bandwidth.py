@@ -0,0 +1,32 @@
+# Generated manually
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_igp_models", "0009_igptopologysnapshot"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="isisconfiguration",
+            name="reference_bandwidth",
+            field=models.PositiveIntegerField(
+                blank=True,
+                help_text="Bandwidth that auto-cost divides by the interface speed to compute metrics",
+                null=True,
+                verbose_name="Reference bandwidth (Mbps)",
+            ),
+        ),
+        migrations.AddField(
+            model_name="ospfconfiguration",
+            name="reference_bandwidth",
+            field=models.PositiveIntegerField(
+                blank=True,
+                help_text="Bandwidth that auto-cost divides by the interface speed to compute costs",
+                null=True,
+                verbose_name="Reference bandwidth (Mbps)",
+            ),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated manually
+
+import uuid
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_igp_models", "0010_reference_bandwidth"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IGPResourceFingerprint",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True
+                    ),
+                ),
+                ("name", models.CharField(max_length=100, unique=True)),
+                ("fingerprint", models.CharField(max_length=64)),
+                ("last_updated", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "IGP Resource Fingerprint",
+                "verbose_name_plural": "IGP Resource Fingerprints",
+            },
+        ),
+    ]
@@ -3,17 +3,22 @@
 import logging
 
 from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
 from django.core.validators import RegexValidator
 
 # Django imports
 from django.db import models
+from django.db.models import Count, F
 
 # Nautobot imports
-from nautobot.apps.models import PrimaryModel
+from nautobot.apps.models import BaseManager, BaseModel, PrimaryModel, RestrictedQuerySet
 from nautobot.dcim.models import Interface
 from nautobot.extras.models import StatusField
 from nautobot.extras.utils import extras_features
 
+from nautobot_igp_models.instrumentation import instrumented
+from nautobot_igp_models.utils import build_net, ipv4_to_int, net_columns, ospf_area_to_int, parse_lsp_id
+
 logger = logging.getLogger(__name__)
 
 # Validator for ISIS Area format (e.g., 49, 49.0001, 49.0000.0001)
@@ -34,6 +39,52 @@ def validate_isis_area(value):
             raise ValidationError("ISIS Area cannot exceed 13 bytes.")
 
 
+def validate_ospf_area(value):
+    """Ensure the OSPF area is a dotted-decimal or decimal 32-bit area ID."""
+    try:
+        ospf_area_to_int(value)
+    except ValueError as e:
+        raise ValidationError(str(e)) from e
+
+
+class IGPRoutingInstanceQuerySet(RestrictedQuerySet):
+    """QuerySet for IGPRoutingInstance with indexed router ID lookups."""
+
+    def for_router_id(self, router_id):
+        """Filter to instances whose router ID is the given IPv4 address."""
+        return self.filter(router_id_number=ipv4_to_int(router_id))
+
+
+class ISISConfigurationQuerySet(RestrictedQuerySet):
+    """QuerySet for ISISConfiguration with indexed System ID lookups."""
+
+    def for_system_id(self, system_id):
+        """Filter to configurations with the System ID of ``system_id``, given as System ID, LAN ID or LSP ID."""
+        return self.filter(system_id_number=parse_lsp_id(system_id))
+
+    def resolve_system_ids(self, system_ids, chunk_size=5000):
+        """Map many System IDs, LAN IDs or LSP IDs to their ISIS configuration with chunked index lookups.
+
+        Unparseable and unknown IDs are left out of the result.
+
+        Returns:
+            dict: Input ID -> ISISConfiguration
+        """
+        by_number = {}
+        for system_id in system_ids:
+            try:
+                by_number.setdefault(parse_lsp_id(system_id), []).append(system_id)
+            except ValueError:
+                continue
+        numbers = list(by_number)
+        resolved = {}
+        for start in range(0, len(numbers), chunk_size):
+            for config in self.filter(system_id_number__in=numbers[start : start + chunk_size]):
+                for system_id in by_number[config.system_id_number]:
+                    resolved[system_id] = config
+        return resolved
+
+
 @extras_features(
     "custom_fields",
     "custom_links",
@@ -85,11 +136,27 @@ class IGPRoutingInstance(PrimaryModel):  # pylint: disable=too-many-ancestors
         help_text="ISIS Area (e.g., 49.0001) - required only for ISIS protocol.",
     )
 
+    # 32-bit form of the router ID host, kept in sync on save for index lookups
+    router_id_number = models.PositiveBigIntegerField(
+        null=True, blank=True, editable=False, db_index=True, verbose_name="Router ID (integer)"
+    )
+
     status = StatusField(null=True)
 
+    objects = BaseManager.from_queryset(IGPRoutingInstanceQuerySet)()
+
     def __str__(self):
         return f"{self.protocol} on {self.device}"
 
+    def save(self, *args, **kwargs):
+        """Save the IGP routing instance, keeping the integer router ID in sync."""
+        self.sync_router_id_number()
+        super().save(*args, **kwargs)
+
+    def sync_router_id_number(self):
+        """Set ``router_id_number`` from the router ID; IPv6 or missing router IDs leave it empty."""
+        self.router_id_number = ipv4_to_int(self.router_id.host) if self.router_id_id else None
+
     class Meta:
         """Meta class."""
 
@@ -97,6 +164,10 @@ class IGPRoutingInstance(PrimaryModel):  # pylint: disable=too-many-ancestors
         verbose_name = "IGP Routing Instance"
         verbose_name_plural = "IGP Routing Instances"
         unique_together = ["device", "protocol", "vrf"]
+        # (device, protocol) lookups are served by the unique_together index prefix
+        indexes = [
+            models.Index(fields=["protocol", "isis_area"], name="igp_instance_proto_area_idx"),
+        ]
 
     def clean(self):
         """Ensure isis_area is populated only for ISIS and required when ISIS is selected."""
@@ -125,6 +196,18 @@ class ISISConfiguration(PrimaryModel):
     name = models.CharField(max_length=100)
     instance = models.ForeignKey("IGPRoutingInstance", on_delete=models.CASCADE)
     system_id = models.CharField(max_length=50, blank=True)
+    # Fixed-width forms of the NET, kept in sync on save for index lookups
+    system_id_number = models.PositiveBigIntegerField(
+        null=True, blank=True, editable=False, db_index=True, verbose_name="System ID (integer)"
+    )
+    isis_area_hex = models.CharField(
+        max_length=26, blank=True, default="", editable=False, verbose_name="Area (hex digits)"
+    )
+    auto_net = models.BooleanField(
+        default=False,
+        verbose_name="Auto NET",
+        help_text="Keep the NET derived from the instance's router ID and ISIS area when either changes",
+    )
     status = StatusField(null=True)
 
     # Default values for interface inheritance (hybrid approach)
@@ -133,6 +216,12 @@ class ISISConfiguration(PrimaryModel):
         null=True,
         help_text="Default ISIS metric for interfaces (overridable at interface level)",
     )
+    reference_bandwidth = models.PositiveIntegerField(
+        blank=True,
+        null=True,
+        verbose_name="Reference bandwidth (Mbps)",
+        help_text="Bandwidth that auto-cost divides by the interface speed to compute metrics",
+    )
     default_hello_interval = models.PositiveIntegerField(
         blank=True,
         null=True,
@@ -149,20 +238,37 @@ class ISISConfiguration(PrimaryModel):
         help_text="Default DIS priority (can be overridden by config context)",
     )
 
+    objects = BaseManager.from_queryset(ISISConfigurationQuerySet)()
+
     class Meta:
         unique_together = ["instance", "name"]
+        indexes = [
+            models.Index(fields=["system_id"], name="igp_isis_system_id_idx"),
+            models.Index(fields=["isis_area_hex", "system_id_number"], name="igp_isis_area_sysid_idx"),
+        ]
 
     def save(self, *args, **kwargs):
-        """Save the ISIS configuration and auto-generate NET if system_id is empty."""
-        if not self.system_id:  # Only generate if system_id is empty
+        """Save the ISIS configuration and auto-generate NET if system_id is empty or auto_net is set."""
+        self.derive_net()
+        super().save(*args, **kwargs)
+
+    def derive_net(self):
+        """Generate the NET if system_id is empty or auto_net is set, and sync the NET lookup columns."""
+        if self.auto_net or not self.system_id:
             try:
                 self.system_id = self.generate_full_net()
                 logger.debug(f"Auto-generated full NET during save: {self.system_id}")
             except ValueError as e:
                 logger.error(f"Error generating full NET during save: {str(e)}")
                 self.system_id = ""  # Leave blank if generation fails
-        super().save(*args, **kwargs)
+        self.sync_net_columns()
+
+    def sync_net_columns(self):
+        """Set ``system_id_number`` and ``isis_area_hex`` from ``system_id``."""
+        for field, value in net_columns(self.system_id).items():
+            setattr(self, field, value)
 
+    @instrumented("generate_full_net")
     def generate_full_net(self):
         """Generate the full NET (Area ID + System ID + NSEL).
 
@@ -171,42 +277,7 @@ class ISISConfiguration(PrimaryModel):
         if not self.instance or not self.instance.router_id or not self.instance.isis_area:
             raise ValueError("Cannot generate NET: No instance, router_id, or isis_area available.")
 
-        router_id = self.instance.router_id
-        isis_area = self.instance.isis_area
-        logger.debug(f"Router ID string in generate_full_net: {str(router_id)}")
-        logger.debug(f"ISIS Area in generate_full_net: {isis_area}")
-
-        # Step 1: Get the Area Identifier (e.g., "49.0001")
-        area_id = isis_area  # Use the isis_area directly (e.g., "49.0001")
-        logger.debug(f"Area Identifier: {area_id}")
-
-        # Step 2: Generate the System ID based on router_id
-        router_id_str = str(router_id).split("/")[0]  # Get "192.168.3.2"
-        logger.debug(f"Router ID string after stripping subnet: {router_id_str}")
-
-        # Split into octets
-        octets = router_id_str.split(".")
-        if len(octets) != 4:
-            raise ValueError("Router ID format invalid; expected IPv4 address.")
-
-        # Convert octets to integers
-        octet_values = [int(octet) for octet in octets]
-        logger.debug(f"Octet values in generate_full_net: {octet_values}")
-
-        # Map octets to three 4-digit segments for System ID
-        first_segment = f"{octet_values[0]:04d}"[-4:]  # e.g., "0192"
-        second_segment = f"{octet_values[1]:04d}"[-4:]  # e.g., "0168"
-        third_segment = f"{octet_values[2]:02d}{octet_values[3]:02d}"[-4:]  # e.g., "0302"
-
-        logger.debug(f"System ID segments in generate_full_net: {first_segment}, {second_segment}, {third_segment}")
-
-        # Combine System ID
-        system_id = f"{first_segment}.{second_segment}.{third_segment}"
-
-        # Step 3: Combine Area ID, System ID, and NSEL
-        nsel = "00"  # Fixed NSEL for IS-IS routing
-        full_net = f"{area_id}.{system_id}.{nsel}"
-        return full_net
+        return build_net(self.instance.isis_area, self.instance.router_id)
 
     def __str__(self):
         return self.name or str(self.id)
@@ -266,6 +337,9 @@ class ISISInterfaceConfiguration(PrimaryModel):
 
     class Meta:
         unique_together = ("isis_config", "interface")
+        indexes = [
+            models.Index(fields=["isis_config", "circuit_type"], name="igp_isisif_cfg_circuit_idx"),
+        ]
         verbose_name = "ISIS Interface Configuration"
         verbose_name_plural = "ISIS Interface Configurations"
 
@@ -277,6 +351,7 @@ class ISISInterfaceConfiguration(PrimaryModel):
             return self.isis_config.default_metric
         return 10  # Global default for ISIS
 
+    @instrumented("get_effective_config")
     def get_effective_config(self):
         """
         Get effective configuration with full inheritance chain.
@@ -326,6 +401,7 @@ class ISISInterfaceConfiguration(PrimaryModel):
 
         return config
 
+    @instrumented("get_vendor_config")
     def get_vendor_config(self, vendor=None):
         """
         Get vendor-specific configuration from config context.
@@ -386,6 +462,12 @@ class OSPFConfiguration(PrimaryModel):
         null=True,
         help_text="Default OSPF cost for interfaces (overridable at interface level)",
     )
+    reference_bandwidth = models.PositiveIntegerField(
+        blank=True,
+        null=True,
+        verbose_name="Reference bandwidth (Mbps)",
+        help_text="Bandwidth that auto-cost divides by the interface speed to compute costs",
+    )
     default_hello_interval = models.PositiveIntegerField(
         blank=True,
         null=True,
@@ -411,6 +493,31 @@ class OSPFConfiguration(PrimaryModel):
         return f"OSPF {self.process_id} on {self.instance.device}"
 
 
+class OSPFInterfaceConfigurationQuerySet(RestrictedQuerySet):
+    """QuerySet for OSPFInterfaceConfiguration with area lookups on the normalized integer area."""
+
+    def in_area(self, area):
+        """Filter to one area, given in any notation accepted by ``ospf_area_to_int()``."""
+        return self.filter(area_number=ospf_area_to_int(area))
+
+    def in_area_range(self, minimum=None, maximum=None):
+        """Filter to areas within an inclusive range; either bound may be omitted."""
+        queryset = self
+        if minimum is not None:
+            queryset = queryset.filter(area_number__gte=ospf_area_to_int(minimum))
+        if maximum is not None:
+            queryset = queryset.filter(area_number__lte=ospf_area_to_int(maximum))
+        return queryset
+
+    def areas_per_device(self):
+        """Return one row per device with the number of distinct OSPF areas its interfaces are in."""
+        return (
+            self.values(device=F("interface__device__name"))
+            .annotate(area_count=Count("area_number", distinct=True))
+            .order_by("device")
+        )
+
+
 @extras_features(
     "custom_fields",
     "custom_links",
@@ -437,7 +544,11 @@ class OSPFInterfaceConfiguration(PrimaryModel):
         OSPFConfiguration, on_delete=models.CASCADE, related_name="interface_configurations"
     )
     interface = models.ForeignKey(Interface, on_delete=models.CASCADE, related_name="ospf_configurations")
-    area = models.CharField(max_length=15, help_text="OSPF Area for this interface (e.g., 0.0.0.0)")
+    area = models.CharField(
+        max_length=15, validators=[validate_ospf_area], help_text="OSPF Area for this interface (e.g., 0.0.0.0)"
+    )
+    # Normalized 32-bit form of `area`, kept in sync on save; used for area filters, ordering and aggregates
+    area_number = models.PositiveBigIntegerField(null=True, blank=True, editable=False, verbose_name="Area (integer)")
     network_type = models.CharField(
         max_length=20,
         choices=NETWORK_TYPE_CHOICES,
@@ -452,11 +563,29 @@ class OSPFInterfaceConfiguration(PrimaryModel):
     )
     status = StatusField(null=True)
 
+    objects = BaseManager.from_queryset(OSPFInterfaceConfigurationQuerySet)()
+
     class Meta:
         unique_together = ("ospf_config", "interface")
+        indexes = [
+            models.Index(fields=["ospf_config", "area_number"], name="igp_ospfif_cfg_areanum_idx"),
+            models.Index(fields=["area_number", "network_type"], name="igp_ospfif_areanum_nettype_idx"),
+        ]
         verbose_name = "OSPF Interface Configuration"
         verbose_name_plural = "OSPF Interface Configurations"
 
+    def save(self, *args, **kwargs):
+        """Save the OSPF interface configuration, keeping the normalized area in sync."""
+        self.sync_area_number()
+        super().save(*args, **kwargs)
+
+    def sync_area_number(self):
+        """Set ``area_number`` from ``area``; unparseable areas leave it empty."""
+        try:
+            self.area_number = ospf_area_to_int(self.area)
+        except ValueError:
+            self.area_number = None
+
     def get_effective_cost(self):
         """Get effective cost with inheritance: interface > ospf_config default > global default."""
         if self.cost is not None:
@@ -465,6 +594,7 @@ class OSPFInterfaceConfiguration(PrimaryModel):
             return self.ospf_config.default_cost
         return 1  # Global default for OSPF
 
+    @instrumented("get_effective_config")
     def get_effective_config(self):
         """
         Get effective configuration with full inheritance chain.
@@ -515,6 +645,7 @@ class OSPFInterfaceConfiguration(PrimaryModel):
 
         return config
 
+    @instrumented("get_vendor_config")
     def get_vendor_config(self, vendor=None):
         """
         Get vendor-specific configuration from config context.
@@ -544,3 +675,61 @@ class OSPFInterfaceConfiguration(PrimaryModel):
 
     def __str__(self):
         return f"OSPF Area {self.area} on {self.interface}"
+
+
+class IGPAuditReport(BaseModel):
+    """Stored result of an IGP consistency audit run."""
+
+    created = models.DateTimeField(auto_now_add=True)
+    total_findings = models.PositiveIntegerField(default=0)
+    summary = models.JSONField(default=dict, encoder=DjangoJSONEncoder, help_text="Number of findings per check.")
+    findings = models.JSONField(default=dict, encoder=DjangoJSONEncoder, help_text="Findings per check.")
+
+    class Meta:
+        ordering = ["-created"]
+        verbose_name = "IGP Audit Report"
+        verbose_name_plural = "IGP Audit Reports"
+
+    def __str__(self):
+        return f"IGP audit {self.created:%Y-%m-%d %H:%M} ({self.total_findings} findings)"
+
+
+class IGPTopologySnapshot(BaseModel):
+    """Point-in-time capture of the IGP topology, stored as a compressed full checkpoint or a delta.
+
+    A checkpoint holds every row; any other snapshot holds only the rows added, changed or removed since the
+    snapshot with the previous sequence number. See ``nautobot_igp_models.snapshots``.
+    """
+
+    created = models.DateTimeField(auto_now_add=True)
+    sequence = models.PositiveIntegerField(unique=True)
+    checkpoint = models.BooleanField(default=False, help_text="Whether this snapshot holds the full topology.")
+    row_count = models.PositiveIntegerField(default=0, help_text="Number of rows in the captured topology.")
+    change_count = models.PositiveIntegerField(
+        default=0, help_text="Number of rows added, changed or removed since the previous snapshot."
+    )
+    summary = models.JSONField(default=dict, encoder=DjangoJSONEncoder, help_text="Number of rows per table.")
+    data = models.BinaryField(help_text="zlib-compressed JSON of the full topology or of the delta.")
+
+    class Meta:
+        ordering = ["-sequence"]
+        verbose_name = "IGP Topology Snapshot"
+        verbose_name_plural = "IGP Topology Snapshots"
+
+    def __str__(self):
+        return f"IGP topology snapshot #{self.sequence} ({self.created:%Y-%m-%d %H:%M})"
+
+
+class IGPResourceFingerprint(BaseModel):
+    """Content fingerprint of the bundled resources last loaded by ``load_igp_resources``."""
+
+    name = models.CharField(max_length=100, unique=True)
+    fingerprint = models.CharField(max_length=64)
+    last_updated = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "IGP Resource Fingerprint"
+        verbose_name_plural = "IGP Resource Fingerprints"
+
+    def __str__(self):
+        return self.name
@@ -0,0 +1,119 @@
+"""Bulk (re)generation of ISIS NETs from router IDs and ISIS areas."""
+
+import logging
+from collections import defaultdict
+
+from django.db import transaction
+from django.utils import timezone
+
+from nautobot_igp_models.models import ISISConfiguration
+from nautobot_igp_models.utils import build_net, net_columns
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 500
+
+NET_UPDATE_FIELDS = ["system_id", "system_id_number", "isis_area_hex", "last_updated"]
+
+
+class NetRegenerationResult:
+    """Outcome of a NET regeneration run."""
+
+    def __init__(self):
+        """Initialize empty counters."""
+        self.updated = 0
+        self.unchanged = 0
+        self.skipped = []
+        self.collisions = {}
+
+    @property
+    def collision_count(self):
+        """Number of ISIS configurations left untouched because their NET would not be unique."""
+        return sum(len(config_pks) for config_pks in self.collisions.values())
+
+
+def net_rows(queryset):
+    """Return (pk, current NET, ISIS area, router ID host) tuples for ``queryset`` in one query."""
+    return list(queryset.values_list("pk", "system_id", "instance__isis_area", "instance__router_id__host"))
+
+
+def compute_nets(rows):
+    """Compute the NET for every (pk, current NET, ISIS area, router ID host) row.
+
+    Rows without an ISIS area or router ID map to ``None``.
+
+    Returns:
+        dict: ISIS configuration pk -> NET or None
+    """
+    return {pk: build_net(isis_area, host) if isis_area and host else None for pk, _, isis_area, host in rows}
+
+
+def find_net_collisions(new_nets):
+    """Find NETs that would be shared by more than one ISIS configuration.
+
+    Existing NETs of configurations outside ``new_nets`` are taken into account, so that a regenerated NET cannot
+    collide with one that is already assigned. The ``[-4:]`` truncation in System ID derivation means that distinct
+    router IDs can map to the same NET.
+
+    Returns:
+        dict: NET -> sorted list of colliding ISIS configuration pks
+    """
+    owners = defaultdict(set)
+    for pk, net in new_nets.items():
+        if net:
+            owners[net].add(pk)
+    existing = ISISConfiguration.objects.filter(system_id__in=owners)
+    for pk, net in existing.exclude(pk__in=new_nets).values_list("pk", "system_id"):
+        owners[net].add(pk)
+    return {net: sorted(pks, key=str) for net, pks in owners.items() if len(pks) > 1}
+
+
+def regenerate_nets(queryset=None, missing_only=False, dry_run=False, batch_size=DEFAULT_BATCH_SIZE):
+    """Regenerate the NET of every ISIS configuration in ``queryset`` with a single ``bulk_update``.
+
+    Args:
+        queryset: ISIS configurations to regenerate (default: all).
+        missing_only: Only fill in configurations without a NET.
+        dry_run: Compute and report without writing.
+        batch_size: Rows per ``bulk_update`` statement.
+
+    Returns:
+        NetRegenerationResult
+    """
+    if queryset is None:
+        queryset = ISISConfiguration.objects.all()
+    if missing_only:
+        queryset = queryset.filter(system_id="")
+
+    rows = net_rows(queryset)
+    new_nets = compute_nets(rows)
+    result = NetRegenerationResult()
+    result.collisions = find_net_collisions(new_nets)
+    colliding = {pk for config_pks in result.collisions.values() for pk in config_pks}
+
+    now = timezone.now()
+    to_update = []
+    for pk, current_net, _, _ in rows:
+        net = new_nets[pk]
+        if net is None:
+            result.skipped.append(pk)
+        elif pk in colliding:
+            continue
+        elif net == current_net:
+            result.unchanged += 1
+        else:
+            to_update.append(ISISConfiguration(pk=pk, system_id=net, last_updated=now, **net_columns(net)))
+
+    result.updated = len(to_update)
+    if to_update and not dry_run:
+        with transaction.atomic():
+            ISISConfiguration.objects.bulk_update(to_update, NET_UPDATE_FIELDS, batch_size=batch_size)
+    logger.info(
+        "NET regeneration: %d updated, %d unchanged, %d skipped, %d colliding%s",
+        result.updated,
+        result.unchanged,
+        len(result.skipped),
+        result.collision_count,
+        " (dry run)" if dry_run else "",
+    )
+    return result
@@ -0,0 +1,153 @@
+"""Profiling of export template renders: cProfile call stacks and SQL statement timings.
+
+``profile_call()`` runs a callable under ``cProfile`` while timing every SQL statement it issues, and returns a
+``RenderProfile`` from which a collapsed-stack file (the input format of ``flamegraph.pl``, speedscope and similar
+tools) and a report of the slowest SQL statements are produced. It backs the ``profile_igp_render`` management command
+and the ``?profile=1`` switch of the ISIS/OSPF configuration export views.
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import time
+import zipfile
+from collections import defaultdict
+
+from django.db import connection
+
+DEFAULT_TOP_QUERIES = 20
+
+# Stacks deeper than this are truncated; recursion in templates and the ORM can otherwise explode the output
+MAX_STACK_DEPTH = 128
+
+# Paths whose time share falls below this many microseconds are dropped from the collapsed stacks
+MIN_STACK_MICROSECONDS = 1
+
+
+class RenderProfile:
+    """Outcome of a profiled call."""
+
+    def __init__(self, result, elapsed, stats, queries):
+        """Store the call result, wall time, ``pstats.Stats`` and (seconds, SQL) tuples in execution order."""
+        self.result = result
+        self.elapsed = elapsed
+        self.stats = stats
+        self.queries = queries
+
+    @property
+    def query_seconds(self):
+        """Total time spent executing SQL statements."""
+        return sum(seconds for seconds, _ in self.queries)
+
+    def slowest_queries(self, top=DEFAULT_TOP_QUERIES):
+        """Return the ``top`` slowest (seconds, SQL) statements, slowest first."""
+        return sorted(self.queries, key=lambda query: query[0], reverse=True)[:top]
+
+    def collapsed_stacks(self):
+        """Return the profile as collapsed stacks: one ``frame;frame;frame microseconds`` line per call path."""
+        return collapsed_stacks(self.stats)
+
+    def sql_report(self, top=DEFAULT_TOP_QUERIES):
+        """Return a text report of the ``top`` slowest SQL statements."""
+        lines = [
+            f"Render time: {self.elapsed * 1000:.1f} ms",
+            f"SQL: {len(self.queries)} statement(s), {self.query_seconds * 1000:.1f} ms",
+            "",
+        ]
+        for rank, (seconds, sql) in enumerate(self.slowest_queries(top), start=1):
+            lines.append(f"#{rank} {seconds * 1000:.2f} ms")
+            lines.append(sql)
+            lines.append("")
+        return "\n".join(lines)
+
+    def files(self, name, top=DEFAULT_TOP_QUERIES):
+        """Return the report files of this profile as a {filename: text} dict."""
+        return {
+            f"{name}.collapsed": self.collapsed_stacks(),
+            f"{name}.sql.txt": self.sql_report(top),
+        }
+
+    def zip_archive(self, name, top=DEFAULT_TOP_QUERIES, extra_files=None):
+        """Return the report files of this profile, and any ``extra_files``, as an in-memory ZIP archive."""
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            for filename, text in {**self.files(name, top), **(extra_files or {})}.items():
+                archive.writestr(filename, text)
+        return buffer.getvalue()
+
+
+def profile_call(func, *args, **kwargs):
+    """Call ``func(*args, **kwargs)`` under cProfile, timing each SQL statement it issues.
+
+    Returns:
+        RenderProfile
+    """
+    queries = []
+
+    def time_query(execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            queries.append((time.perf_counter() - start, sql))
+
+    profiler = cProfile.Profile()
+    start = time.perf_counter()
+    with connection.execute_wrapper(time_query):
+        profiler.enable()
+        try:
+            result = func(*args, **kwargs)
+        finally:
+            profiler.disable()
+    elapsed = time.perf_counter() - start
+    return RenderProfile(result, elapsed, pstats.Stats(profiler), queries)
+
+
+def _frame_label(func):
+    filename, lineno, name = func
+    if filename == "~":
+        # Built-in functions have no source location
+        label = name
+    else:
+        label = f"{name} ({os.path.basename(filename)}:{lineno})"
+    return label.replace(";", ",")
+
+
+def collapsed_stacks(stats):
+    """Convert ``pstats.Stats`` into collapsed stacks.
+
+    cProfile records caller -> callee edges rather than complete stacks, so stacks are reconstructed by walking the
+    call graph from its roots, attributing each callee's time to a calling path in proportion to the cumulative time
+    recorded for that caller -> callee edge. Recursive calls are cut at the first repetition.
+    """
+    callees = defaultdict(dict)
+    for func, (_, _, _, _, callers) in stats.stats.items():
+        for caller, edge in callers.items():
+            callees[caller][func] = edge[3]
+
+    samples = defaultdict(float)
+
+    def walk(func, path, on_path, share):
+        _, _, self_time, cumulative, _ = stats.stats[func]
+        path = (*path, _frame_label(func))
+        samples[";".join(path)] += self_time * share
+        if len(path) >= MAX_STACK_DEPTH:
+            return
+        for callee, edge_cumulative in callees[func].items():
+            callee_cumulative = stats.stats[callee][3]
+            if callee in on_path or not callee_cumulative:
+                continue
+            callee_share = share * edge_cumulative / callee_cumulative
+            if callee_share * callee_cumulative * 1e6 < MIN_STACK_MICROSECONDS:
+                continue
+            walk(callee, path, on_path | {callee}, callee_share)
+
+    for func, (_, _, _, _, callers) in stats.stats.items():
+        if not callers and not func[2].startswith("<method 'disable' of '_lsprof.Profiler'"):
+            walk(func, (), {func}, 1.0)
+
+    lines = [
+        f"{stack} {round(seconds * 1e6)}" for stack, seconds in sorted(samples.items()) if round(seconds * 1e6) > 0
+    ]
+    return "\n".join(lines) + "\n" if lines else ""
@@ -0,0 +1,197 @@
+"""Bulk provisioning of ISIS/OSPF interface configurations from cabled device interfaces.
+
+For each selected routing instance, every cabled, enabled, non-management interface of its device gets an interface
+configuration under the instance's ISIS configuration (first by name) or OSPF configuration (lowest process ID):
+
+- names are deterministic, ``<protocol>-<device>-<interface>``, so reruns produce the same rows;
+- the OSPF area of an interface is the area of the first rule whose regular expression matches the interface name,
+  else the default area;
+- metrics and costs are left unset, so that they inherit the configuration defaults.
+
+Interfaces are read with one query for all devices, existing interface configurations with one query per protocol,
+and the new rows written with ``bulk_create(ignore_conflicts=True)``, so concurrent or repeated runs never fail on
+the ``(config, interface)`` uniqueness.
+"""
+
+import logging
+import re
+
+from django.db import transaction
+from nautobot.dcim.models import Interface
+
+from nautobot_igp_models import cache
+from nautobot_igp_models.models import (
+    ISISConfiguration,
+    ISISInterfaceConfiguration,
+    OSPFConfiguration,
+    OSPFInterfaceConfiguration,
+)
+from nautobot_igp_models.utils import ospf_area_to_int
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_AREA = "0.0.0.0"  # noqa: S104 (OSPF backbone area, not a bind address)
+DEFAULT_BATCH_SIZE = 1000
+
+PROVISION_COLUMNS = ["protocol", "instance", "device", "interface", "name", "area", "circuit_type"]
+
+NAME_MAX_LENGTH = 100
+
+
+def compile_area_rules(rules):
+    """Validate ``{interface name regex: OSPF area}`` rules and return them as (compiled regex, area) pairs.
+
+    Raises:
+        ValueError: If a regular expression or an area is invalid.
+    """
+    compiled = []
+    for pattern, area in (rules or {}).items():
+        try:
+            regex = re.compile(pattern)
+        except re.error as error:
+            raise ValueError(f"Invalid interface pattern {pattern!r}: {error}") from None
+        ospf_area_to_int(area)
+        compiled.append((regex, area))
+    return compiled
+
+
+def area_for_interface(area_rules, interface_name, default=DEFAULT_AREA):
+    """Return the area of the first rule matching ``interface_name``, or ``default``."""
+    for regex, area in area_rules:
+        if regex.search(interface_name):
+            return area
+    return default
+
+
+def interface_config_name(protocol, device_name, interface_name):
+    """Return the deterministic name of a provisioned interface configuration."""
+    return f"{protocol}-{device_name}-{interface_name}"[:NAME_MAX_LENGTH]
+
+
+def eligible_interfaces(device_pks):
+    """Return the cabled, enabled, non-management interfaces of the devices.
+
+    Returns:
+        dict: Device pk -> list of (interface pk, device name, interface name), ordered by interface name.
+    """
+    interfaces = {}
+    rows = (
+        Interface.objects.filter(device__in=device_pks, cable__isnull=False, enabled=True, mgmt_only=False)
+        .values_list("device_id", "pk", "device__name", "name")
+        .order_by("device_id", "name")
+    )
+    for device_pk, pk, device_name, name in rows:
+        interfaces.setdefault(device_pk, []).append((pk, device_name, name))
+    return interfaces
+
+
+def _protocol_configs(instances):
+    """Return {instance pk: ISIS/OSPF configuration} for the instances that have one."""
+    configs = {}
+    isis_configs = ISISConfiguration.objects.filter(instance__in=[i for i in instances if i.protocol == "ISIS"])
+    for config in isis_configs.order_by("instance", "name"):
+        configs.setdefault(config.instance_id, config)
+    ospf_configs = OSPFConfiguration.objects.filter(instance__in=[i for i in instances if i.protocol == "OSPF"])
+    for config in ospf_configs.order_by("instance", "process_id"):
+        configs.setdefault(config.instance_id, config)
+    return configs
+
+
+def provision_interface_configs(
+    instances,
+    area_rules=None,
+    default_area=DEFAULT_AREA,
+    circuit_type="L1L2",
+    status=None,
+    dry_run=False,
+    batch_size=DEFAULT_BATCH_SIZE,
+):
+    """Create the missing interface configurations of ``instances``.
+
+    Args:
+        instances: IGPRoutingInstance objects.
+        area_rules: ``{interface name regex: OSPF area}``, tried in order.
+        default_area: OSPF area of interfaces no rule matches.
+        circuit_type: Circuit type of new ISIS interface configurations.
+        status: Status of the new interface configurations.
+        dry_run: Report the rows without creating them.
+        batch_size: Rows per ``bulk_create`` statement.
+
+    Returns:
+        dict: ``rows`` (one PROVISION_COLUMNS dict per new interface configuration), ``existing`` (interfaces that
+        already had one) and ``skipped`` (instances without an ISIS/OSPF configuration).
+
+    Raises:
+        ValueError: If an area rule or the default area is invalid.
+    """
+    compiled_rules = compile_area_rules(area_rules)
+    ospf_area_to_int(default_area)
+    instances = list(instances)
+    configs = _protocol_configs(instances)
+    interfaces = eligible_interfaces({instance.device_id for instance in instances})
+    isis_config_pks = [config.pk for config in configs.values() if isinstance(config, ISISConfiguration)]
+    ospf_config_pks = [config.pk for config in configs.values() if isinstance(config, OSPFConfiguration)]
+    existing = set(
+        ISISInterfaceConfiguration.objects.filter(isis_config__in=isis_config_pks).values_list(
+            "isis_config_id", "interface_id"
+        )
+    ) | set(
+        OSPFInterfaceConfiguration.objects.filter(ospf_config__in=ospf_config_pks).values_list(
+            "ospf_config_id", "interface_id"
+        )
+    )
+
+    result = {"rows": [], "existing": 0, "skipped": []}
+    new_configs = {ISISInterfaceConfiguration: [], OSPFInterfaceConfiguration: []}
+    for instance in instances:
+        config = configs.get(instance.pk)
+        if config is None:
+            result["skipped"].append(instance)
+            continue
+        for interface_pk, device_name, interface_name in interfaces.get(instance.device_id, []):
+            if (config.pk, interface_pk) in existing:
+                result["existing"] += 1
+                continue
+            existing.add((config.pk, interface_pk))
+            name = interface_config_name(instance.protocol, device_name, interface_name)
+            row = {
+                "protocol": instance.protocol,
+                "instance": instance.name,
+                "device": device_name,
+                "interface": interface_name,
+                "name": name,
+                "area": "",
+                "circuit_type": "",
+            }
+            if instance.protocol == "ISIS":
+                row["circuit_type"] = circuit_type
+                interface_config = ISISInterfaceConfiguration(
+                    name=name,
+                    isis_config=config,
+                    device_id=instance.device_id,
+                    interface_id=interface_pk,
+                    circuit_type=circuit_type,
+                    status=status,
+                )
+            else:
+                row["area"] = area_for_interface(compiled_rules, interface_name, default_area)
+                interface_config = OSPFInterfaceConfiguration(
+                    name=name, ospf_config=config, interface_id=interface_pk, area=row["area"], status=status
+                )
+                interface_config.sync_area_number()
+            new_configs[type(interface_config)].append(interface_config)
+            result["rows"].append(row)
+
+    if not dry_run and result["rows"]:
+        with transaction.atomic():
+            for model, objs in new_configs.items():
+                model.objects.bulk_create(objs, batch_size=batch_size, ignore_conflicts=True)
+        cache.bump(cache.TOPOLOGY_SCOPE)
+    logger.info(
+        "Interface configuration provisioning: %d new, %d existing, %d instance(s) without configuration%s",
+        len(result["rows"]),
+        result["existing"],
+        len(result["skipped"]),
+        " (dry run)" if dry_run else "",
+    )
+    return result
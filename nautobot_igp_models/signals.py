@@ -2,15 +2,20 @@
 
 import logging
 import os
+import threading
 
 from django.apps import apps as global_apps
 from django.conf import settings
 from django.core.management import call_command
+from django.db import transaction
 
 logger = logging.getLogger(__name__)
 
 PLUGIN_SETTINGS = settings.PLUGINS_CONFIG["nautobot_igp_models"]
 
+# IGP routing instance pks whose NET inputs changed, re-derived in bulk once the transaction commits
+_pending_net_updates = threading.local()
+
 
 def post_migrate_create_statuses(sender, *, apps=global_apps, **kwargs):
     """Callback function for post_migrate() -- create default Statuses."""
@@ -52,3 +57,130 @@ def post_migrate_load_resources(sender, *, apps=global_apps, **kwargs):
         logger.warning(f"Unable to load IGP resources: {e}")
         # Don't fail the migration if resource loading fails
         pass
+
+
+def queue_net_rederivation(instance_pks):
+    """Queue a bulk NET re-derivation of the auto-NET ISIS configurations of ``instance_pks`` on commit.
+
+    All instances queued within one transaction are handled by a single ``regenerate_nets()`` call.
+    """
+    pending = getattr(_pending_net_updates, "instance_pks", None)
+    if pending is None:
+        pending = _pending_net_updates.instance_pks = set()
+    pending.update(instance_pks)
+    transaction.on_commit(_flush_net_rederivation)
+
+
+def _flush_net_rederivation():
+    """Re-derive the NETs of all queued instances with one bulk update."""
+    from nautobot_igp_models.models import ISISConfiguration  # pylint: disable=import-outside-toplevel
+    from nautobot_igp_models.nets import regenerate_nets  # pylint: disable=import-outside-toplevel
+
+    instance_pks = getattr(_pending_net_updates, "instance_pks", None)
+    if not instance_pks:
+        return
+    _pending_net_updates.instance_pks = set()
+    regenerate_nets(ISISConfiguration.objects.filter(instance__in=instance_pks, auto_net=True))
+
+
+def igp_routing_instance_pre_save(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Callback function for pre_save() -- note whether the router ID or ISIS area is about to change."""
+    if (
+        raw
+        or instance._state.adding
+        or (update_fields is not None and not {"router_id", "isis_area"} & set(update_fields))
+    ):
+        instance._net_inputs_changed = False
+        return
+    previous = sender.objects.filter(pk=instance.pk).values_list("router_id", "isis_area").first()
+    instance._net_inputs_changed = previous != (instance.router_id_id, instance.isis_area)
+
+
+def igp_routing_instance_post_save(sender, instance, created=False, raw=False, **kwargs):
+    """Callback function for post_save() -- re-derive child NETs when the router ID or ISIS area changed."""
+    if getattr(instance, "_net_inputs_changed", False):
+        instance._net_inputs_changed = False
+        queue_net_rederivation([instance.pk])
+
+
+def ip_address_post_save(sender, instance, created=False, raw=False, **kwargs):
+    """Callback function for post_save() -- resync instances and re-derive NETs using a renumbered router ID."""
+    from nautobot_igp_models.models import IGPRoutingInstance  # pylint: disable=import-outside-toplevel
+    from nautobot_igp_models.utils import ipv4_to_int  # pylint: disable=import-outside-toplevel
+
+    if created or raw:
+        return
+    router_id_number = ipv4_to_int(instance.host)
+    IGPRoutingInstance.objects.filter(router_id=instance).exclude(router_id_number=router_id_number).update(
+        router_id_number=router_id_number
+    )
+    instance_pks = list(
+        IGPRoutingInstance.objects.filter(
+            router_id=instance, protocol="ISIS", isisconfiguration__auto_net=True
+        ).values_list("pk", flat=True)
+    )
+    if instance_pks:
+        queue_net_rederivation(instance_pks)
+
+
+# Config contexts matching more devices than this invalidate the whole effective configuration cache instead
+MAX_DEVICE_INVALIDATIONS = 1000
+
+
+def invalidate_effective_config_object(sender, instance, raw=False, **kwargs):
+    """Callback function for post_save()/post_delete() -- evict cached effective configs depending on ``instance``.
+
+    Connected for the interface configuration models and for ISIS/OSPF configurations, whose defaults they inherit.
+    """
+    from nautobot_igp_models import cache  # pylint: disable=import-outside-toplevel
+
+    cache.bump(cache.object_scope(instance))
+
+
+def invalidate_topology(sender, instance, raw=False, **kwargs):
+    """Callback function for post_save()/post_delete() -- evict cached whole-topology analyses.
+
+    Connected for routing instances, ISIS/OSPF (interface) configurations, cables and devices.
+    """
+    from nautobot_igp_models import cache  # pylint: disable=import-outside-toplevel
+
+    cache.bump(cache.TOPOLOGY_SCOPE)
+
+
+def invalidate_effective_config_device(sender, instance, raw=False, **kwargs):
+    """Callback function for Device post_save()/post_delete() -- evict the device's cached config context."""
+    from nautobot_igp_models import cache  # pylint: disable=import-outside-toplevel
+
+    cache.bump(cache.device_scope(instance.pk))
+
+
+def invalidate_effective_config_context(sender, instance, raw=False, **kwargs):
+    """Callback function for ConfigContext post_save()/post_delete() -- evict the devices it applies to."""
+    from nautobot_igp_models import cache  # pylint: disable=import-outside-toplevel
+    from nautobot_igp_models.inheritance import config_context_devices  # pylint: disable=import-outside-toplevel
+
+    if raw:
+        return
+    devices = config_context_devices(instance)
+    device_pks = None if devices is None else list(devices.values_list("pk", flat=True)[: MAX_DEVICE_INVALIDATIONS + 1])
+    if device_pks is None or len(device_pks) > MAX_DEVICE_INVALIDATIONS:
+        cache.bump_all()
+    else:
+        # Effective metrics, areas and circuit types feed the whole-topology analyses
+        cache.bump(*(cache.device_scope(device_pk) for device_pk in device_pks), cache.TOPOLOGY_SCOPE)
+
+
+def invalidate_effective_config_context_scope(sender, instance, action, reverse=False, **kwargs):
+    """Callback function for m2m_changed() on ConfigContext scope relations.
+
+    Devices are evicted both before a removal and after an addition, so devices leaving and entering the scope
+    are covered.
+    """
+    from nautobot_igp_models import cache  # pylint: disable=import-outside-toplevel
+
+    if action not in ("pre_remove", "pre_clear", "post_add", "post_remove"):
+        return
+    if reverse:
+        cache.bump_all()
+    else:
+        invalidate_effective_config_context(sender, instance)
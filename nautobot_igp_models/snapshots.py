@@ -0,0 +1,287 @@
+"""Versioned IGP topology snapshots stored as row-level deltas with periodic full checkpoints.
+
+A snapshot captures every table in SNAPSHOT_TABLES plus the cabled adjacencies (with effective metrics) as
+``{table: {key: row}}``. Each stored snapshot holds either the full state (a checkpoint) or only the rows set or
+deleted since the previous snapshot, serialized as zlib-compressed JSON. Reconstructing a snapshot replays at most
+``snapshot_checkpoint_interval - 1`` deltas on top of the nearest preceding checkpoint.
+"""
+
+import json
+import logging
+import zlib
+from uuid import UUID
+
+from django.conf import settings
+from django.db import transaction
+
+from nautobot_igp_models.models import (
+    IGPRoutingInstance,
+    IGPTopologySnapshot,
+    ISISConfiguration,
+    ISISInterfaceConfiguration,
+    OSPFConfiguration,
+    OSPFInterfaceConfiguration,
+)
+from nautobot_igp_models.topology import iter_edge_batches
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHECKPOINT_INTERVAL = 24
+
+# Table name -> (model, {column: lookup path})
+SNAPSHOT_TABLES = {
+    "instances": (
+        IGPRoutingInstance,
+        {
+            "name": "name",
+            "device": "device__name",
+            "protocol": "protocol",
+            "router_id": "router_id__host",
+            "vrf": "vrf__name",
+            "isis_area": "isis_area",
+            "status": "status__name",
+        },
+    ),
+    "isis_configurations": (
+        ISISConfiguration,
+        {
+            "name": "name",
+            "instance": "instance_id",
+            "system_id": "system_id",
+            "auto_net": "auto_net",
+            "default_metric": "default_metric",
+            "default_hello_interval": "default_hello_interval",
+            "default_hello_multiplier": "default_hello_multiplier",
+            "default_priority": "default_priority",
+            "status": "status__name",
+        },
+    ),
+    "isis_interface_configurations": (
+        ISISInterfaceConfiguration,
+        {
+            "name": "name",
+            "isis_config": "isis_config_id",
+            "device": "device__name",
+            "interface": "interface__name",
+            "circuit_type": "circuit_type",
+            "network_type": "network_type",
+            "metric": "metric",
+            "status": "status__name",
+        },
+    ),
+    "ospf_configurations": (
+        OSPFConfiguration,
+        {
+            "name": "name",
+            "instance": "instance_id",
+            "process_id": "process_id",
+            "default_cost": "default_cost",
+            "default_hello_interval": "default_hello_interval",
+            "default_dead_interval": "default_dead_interval",
+            "default_priority": "default_priority",
+            "status": "status__name",
+        },
+    ),
+    "ospf_interface_configurations": (
+        OSPFInterfaceConfiguration,
+        {
+            "name": "name",
+            "ospf_config": "ospf_config_id",
+            "device": "interface__device__name",
+            "interface": "interface__name",
+            "area": "area",
+            "network_type": "network_type",
+            "cost": "cost",
+            "status": "status__name",
+        },
+    ),
+}
+
+ADJACENCY_TABLE = "adjacencies"
+
+TABLES = [*SNAPSHOT_TABLES, ADJACENCY_TABLE]
+
+
+def checkpoint_interval():
+    """Return how many snapshots are stored per full checkpoint (the checkpoint included)."""
+    return max(
+        1,
+        settings.PLUGINS_CONFIG.get("nautobot_igp_models", {}).get(
+            "snapshot_checkpoint_interval", DEFAULT_CHECKPOINT_INTERVAL
+        ),
+    )
+
+
+def _json_value(value):
+    return str(value) if isinstance(value, UUID) else value
+
+
+def adjacency_key(row):
+    """Return the state key of an edge row: ``<protocol>:<cable id>:<a config id>:<b config id>``.
+
+    Both interface configuration ids are part of the key, as several IGP instances (OSPF processes, VRFs) can form
+    adjacencies over the same cable.
+    """
+    return f"{row['protocol']}:{row['cable_id']}:{row['a_config_id']}:{row['b_config_id']}"
+
+
+def capture_state():
+    """Read the current IGP topology.
+
+    Returns:
+        dict: Table name -> {row key: row dict}. Keys are primary keys, or ``adjacency_key()`` for adjacencies.
+    """
+    state = {}
+    for table, (model, columns) in SNAPSHOT_TABLES.items():
+        rows = model.objects.values_list("pk", *columns.values())
+        state[table] = {
+            str(pk): dict(zip(columns, map(_json_value, values), strict=True)) for pk, *values in rows.iterator()
+        }
+    state[ADJACENCY_TABLE] = {}
+    for model in (ISISInterfaceConfiguration, OSPFInterfaceConfiguration):
+        for batch in iter_edge_batches(model.objects.all()):
+            state[ADJACENCY_TABLE].update({adjacency_key(row): row for row in batch})
+    return state
+
+
+def compute_delta(old_state, new_state):
+    """Return the rows set or deleted between two states as ``{table: {"set": {key: row}, "delete": [keys]}}``."""
+    delta = {}
+    for table in TABLES:
+        old_rows, new_rows = old_state.get(table, {}), new_state.get(table, {})
+        changes = {
+            "set": {key: row for key, row in new_rows.items() if old_rows.get(key) != row},
+            "delete": sorted(set(old_rows) - set(new_rows)),
+        }
+        if changes["set"] or changes["delete"]:
+            delta[table] = changes
+    return delta
+
+
+def apply_delta(state, delta):
+    """Apply a delta from ``compute_delta()`` to ``state`` in place and return it."""
+    for table, changes in delta.items():
+        rows = state.setdefault(table, {})
+        rows.update(changes["set"])
+        for key in changes["delete"]:
+            rows.pop(key, None)
+    return state
+
+
+def delta_size(delta):
+    """Number of rows set or deleted by a delta."""
+    return sum(len(changes["set"]) + len(changes["delete"]) for changes in delta.values())
+
+
+def encode(payload):
+    """Serialize a state or delta to compressed JSON."""
+    return zlib.compress(json.dumps(payload, separators=(",", ":"), sort_keys=True).encode(), 6)
+
+
+def decode(data):
+    """Deserialize a state or delta stored by ``encode()``."""
+    return json.loads(zlib.decompress(bytes(data)))
+
+
+def reconstruct(snapshot):
+    """Return the full topology state captured by ``snapshot``.
+
+    Loads the nearest checkpoint at or before the snapshot and replays the deltas up to it, so the cost is bounded by
+    the checkpoint interval rather than by the snapshot history.
+    """
+    checkpoint = (
+        IGPTopologySnapshot.objects.filter(checkpoint=True, sequence__lte=snapshot.sequence)
+        .order_by("-sequence")
+        .first()
+    )
+    if checkpoint is None:
+        raise ValueError(f"No checkpoint precedes {snapshot}; its history has been pruned")
+    state = decode(checkpoint.data)
+    deltas = (
+        IGPTopologySnapshot.objects.filter(sequence__gt=checkpoint.sequence, sequence__lte=snapshot.sequence)
+        .order_by("sequence")
+        .values_list("sequence", "data")
+    )
+    expected = checkpoint.sequence + 1
+    for sequence, data in deltas.iterator():
+        if sequence != expected:
+            raise ValueError(f"Snapshot #{expected} is missing; cannot reconstruct {snapshot}")
+        apply_delta(state, decode(data))
+        expected += 1
+    return state
+
+
+def take_snapshot(state=None):
+    """Capture the topology and store it as a delta against the latest snapshot, or as a checkpoint when due.
+
+    Returns:
+        IGPTopologySnapshot
+    """
+    if state is None:
+        state = capture_state()
+    summary = {table: len(state.get(table, {})) for table in TABLES}
+    with transaction.atomic():
+        latest = IGPTopologySnapshot.objects.select_for_update().order_by("-sequence").first()
+        snapshot = IGPTopologySnapshot(sequence=1, checkpoint=True, row_count=sum(summary.values()), summary=summary)
+        snapshot.change_count = snapshot.row_count
+        if latest is not None:
+            snapshot.sequence = latest.sequence + 1
+            try:
+                delta = compute_delta(reconstruct(latest), state)
+            except ValueError as error:
+                # Pruned or damaged history: start over from a checkpoint
+                logger.warning("%s; storing a full checkpoint", error)
+            else:
+                last_checkpoint_sequence = (
+                    IGPTopologySnapshot.objects.filter(checkpoint=True)
+                    .order_by("-sequence")
+                    .values_list("sequence", flat=True)
+                    .first()
+                )
+                snapshot.change_count = delta_size(delta)
+                snapshot.checkpoint = snapshot.sequence - last_checkpoint_sequence >= checkpoint_interval()
+        snapshot.data = encode(state if snapshot.checkpoint else delta)
+        snapshot.save()
+
+    logger.info(
+        "Stored %s: %d rows, %d changes%s",
+        snapshot,
+        snapshot.row_count,
+        snapshot.change_count,
+        " (checkpoint)" if snapshot.checkpoint else "",
+    )
+    return snapshot
+
+
+def diff_states(old_state, new_state):
+    """Compare two states.
+
+    Returns:
+        dict: Table -> {"added": {key: row}, "removed": {key: row}, "changed": {key: {column: [old, new]}}}, only
+        for tables with differences.
+    """
+    diff = {}
+    for table in TABLES:
+        old_rows, new_rows = old_state.get(table, {}), new_state.get(table, {})
+        changed = {}
+        for key in old_rows.keys() & new_rows.keys():
+            old_row, new_row = old_rows[key], new_rows[key]
+            if old_row != new_row:
+                changed[key] = {
+                    column: [old_row.get(column), new_row.get(column)]
+                    for column in sorted(old_row.keys() | new_row.keys())
+                    if old_row.get(column) != new_row.get(column)
+                }
+        table_diff = {
+            "added": {key: new_rows[key] for key in sorted(new_rows.keys() - old_rows.keys())},
+            "removed": {key: old_rows[key] for key in sorted(old_rows.keys() - new_rows.keys())},
+            "changed": dict(sorted(changed.items())),
+        }
+        if any(table_diff.values()):
+            diff[table] = table_diff
+    return diff
+
+
+def diff_snapshots(old_snapshot, new_snapshot):
+    """Compare the topology captured by two snapshots (see ``diff_states()``)."""
+    return diff_states(reconstruct(old_snapshot), reconstruct(new_snapshot))
@@ -0,0 +1,93 @@
+"""Shared risk link group (SRLG) failure simulation.
+
+Interface configurations are placed in a shared risk group by tagging them ``srlg:<group>`` (for example
+``srlg:conduit-17``). A cabled link belongs to every group either of its interface configurations is tagged with,
+and all links of a group are failed together. The impacts are cached under a digest of the compiled graph (links,
+endpoints and effective metrics, config contexts included) and of the links of each group, so reruns after edits
+that change neither, such as renaming a device, skip the simulation; the rows are rendered from the current graph.
+"""
+
+import hashlib
+import logging
+
+from django.contrib.contenttypes.models import ContentType
+from nautobot.extras.models import TaggedItem
+
+from nautobot_igp_models import cache
+from nautobot_igp_models.failures import IMPACT_FIELDS, impact_sort_key, simulate_failures
+from nautobot_igp_models.graph import compile_graph
+from nautobot_igp_models.topology import PROTOCOL_MODELS
+
+logger = logging.getLogger(__name__)
+
+SRLG_TAG_PREFIX = "srlg:"
+
+SRLG_IMPACT_COLUMNS = ["rank", "protocol", "srlg", "link_count", "links", *IMPACT_FIELDS]
+
+
+def srlg_membership(model):
+    """Return {interface configuration id: set of SRLG names} for the ``srlg:`` tagged configurations of ``model``."""
+    membership = {}
+    tagged_items = TaggedItem.objects.filter(
+        content_type=ContentType.objects.get_for_model(model), tag__name__startswith=SRLG_TAG_PREFIX
+    ).values_list("object_id", "tag__name")
+    for object_id, tag_name in tagged_items:
+        membership.setdefault(str(object_id), set()).add(tag_name[len(SRLG_TAG_PREFIX) :])
+    return membership
+
+
+def srlg_link_groups(graph, membership):
+    """Map each SRLG to the sorted link indexes of ``graph`` whose interface configurations carry it."""
+    groups = {}
+    for link, row in enumerate(graph.links):
+        for group in membership.get(row["a_config_id"], set()) | membership.get(row["b_config_id"], set()):
+            groups.setdefault(group, []).append(link)
+    return dict(sorted(groups.items()))
+
+
+def _cache_key(protocol, area, graph, groups):
+    digest = hashlib.sha256(graph.fingerprint().encode())
+    for group, links in groups.items():
+        digest.update(repr((group, sorted(graph.links[link]["cable_id"] for link in links))).encode())
+    return f"{cache.KEY_PREFIX}:srlg:{protocol}:{area or ''}:{digest.hexdigest()}"
+
+
+def srlg_failure_impact(protocol, area=None, workers=None, use_cache=None):
+    """Rank the shared risk groups of ``protocol`` by the impact of failing all their links at once.
+
+    Results are cached unless ``use_cache`` is False or the effective configuration cache is disabled.
+
+    Returns:
+        list: One dict per group with the SRLG_IMPACT_COLUMNS keys, most impactful first.
+    """
+    if use_cache is None:
+        use_cache = cache.cache_enabled()
+    graph = compile_graph(protocol, area=area)
+    groups = srlg_link_groups(graph, srlg_membership(PROTOCOL_MODELS[protocol]))
+    key = _cache_key(protocol, area, graph, groups)
+    impacts = cache.get_many([key]).get(key) if use_cache else None
+    if impacts is not None:
+        logger.info("SRLG impact for %s served from cache (graph unchanged)", protocol)
+    else:
+        impacts = simulate_failures(graph, list(groups.values()), workers=workers)
+        if use_cache:
+            cache.set_many({key: impacts})
+    rows = []
+    for (group, links), impact in zip(groups.items(), impacts, strict=True):
+        rows.append(
+            {
+                "protocol": protocol,
+                "srlg": group,
+                "link_count": len(links),
+                "links": "; ".join(
+                    f"{graph.links[link]['a_device']} {graph.links[link]['a_interface']} <-> "
+                    f"{graph.links[link]['b_device']} {graph.links[link]['b_interface']}"
+                    for link in links
+                ),
+                **impact,
+            }
+        )
+    rows.sort(key=impact_sort_key)
+    for rank, row in enumerate(rows, start=1):
+        row["rank"] = rank
+    return rows
@@ -109,7 +109,7 @@ class OSPFInterfaceConfigurationTable(StatusTableMixin, BaseTable):
     pk = ToggleColumn()
     ospf_config = tables.LinkColumn()
     interface = tables.LinkColumn()
-    area = tables.Column()
+    area = tables.Column(order_by=("area_number",))
     network_type = tables.Column(verbose_name="Network Type")
     cost = tables.Column()
     actions = ButtonsColumn(
@@ -1,6 +1,6 @@
 """Create fixtures for tests."""
 
-from nautobot.dcim.models import Device, DeviceType, Interface, Location, LocationType, Manufacturer
+from nautobot.dcim.models import Cable, Device, DeviceType, Interface, Location, LocationType, Manufacturer
 from nautobot.extras.models import Role, Status
 from nautobot.ipam.models import VRF, IPAddress, Namespace, Prefix
 
@@ -33,6 +33,7 @@ def create_statuses():
 
     # Get content types for all models that use Status
     ct_device = ContentType.objects.get_for_model(Device)
+    ct_cable = ContentType.objects.get_for_model(Cable)
     ct_interface = ContentType.objects.get_for_model(Interface)
     ct_ipaddress = ContentType.objects.get_for_model(IPAddress)
     ct_prefix = ContentType.objects.get_for_model(Prefix)
@@ -45,6 +46,7 @@ def create_statuses():
     for status in [status_active, status_planned, status_decommissioned]:
         status.content_types.add(
             ct_device,
+            ct_cable,
             ct_interface,
             ct_ipaddress,
             ct_prefix,
@@ -571,6 +573,25 @@ def create_ospf_interface_configurations():
     }
 
 
+def create_cables():
+    """Cable router1 <-> router2 and router2 <-> router3 so that interface configurations form adjacencies."""
+    interfaces = create_interfaces()
+    statuses = create_statuses()
+    cables = {}
+
+    for key, (side_a, side_b) in {
+        "router1_router2": (interfaces["router1"]["ge1"], interfaces["router2"]["ge1"]),
+        "router2_router3": (interfaces["router2"]["ge2"], interfaces["router3"]["ge1"]),
+    }.items():
+        side_a.refresh_from_db()
+        if side_a.cable is None:
+            Cable.objects.create(termination_a=side_a, termination_b=side_b, status=statuses["active"])
+            side_a.refresh_from_db()
+        cables[key] = side_a.cable
+
+    return cables
+
+
 def create_all_fixtures():
     """
     Create all fixtures in proper dependency order.
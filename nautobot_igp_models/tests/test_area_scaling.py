@@ -0,0 +1,71 @@
+"""Tests for the OSPF area scaling analyzer."""
+
+from django.test import TestCase
+
+from nautobot_igp_models.area_scaling import analyze_ospf_areas, estimate_area
+from nautobot_igp_models.models import OSPFInterfaceConfiguration
+from nautobot_igp_models.tests.fixtures import create_all_fixtures, create_cables
+
+
+class EstimateAreaTestCase(TestCase):
+    """Test cases for estimate_area()."""
+
+    def test_point_to_point_links(self):
+        """Test that point-to-point adjacencies add router LSA links and no network LSAs."""
+        estimate = estimate_area(routers=2, interfaces=2, point_to_point_links=1, transit_links=0)
+
+        self.assertEqual(estimate["router_lsa_bytes"], 2 * 24 + 12 * 4)
+        self.assertEqual(estimate["network_lsas"], 0)
+        self.assertEqual(estimate["lsdb_bytes"], estimate["router_lsa_bytes"])
+        self.assertEqual(estimate["spf_operations"], 4)
+
+    def test_transit_links(self):
+        """Test that broadcast adjacencies add one network LSA each."""
+        estimate = estimate_area(routers=2, interfaces=2, point_to_point_links=0, transit_links=1)
+
+        self.assertEqual(estimate["router_lsa_bytes"], 2 * 24 + 12 * 2)
+        self.assertEqual(estimate["network_lsas"], 1)
+        self.assertEqual(estimate["network_lsa_bytes"], 32)
+
+
+class AnalyzeOSPFAreasTestCase(TestCase):
+    """Test cases for analyze_ospf_areas()."""
+
+    def setUp(self):
+        self.fixtures = create_all_fixtures()
+        create_cables()
+
+    def test_backbone(self):
+        """Test the router, interface and link counts of the fixture backbone area."""
+        rows = analyze_ospf_areas()
+
+        self.assertEqual([row["area"] for row in rows], ["0.0.0.0"])
+        self.assertEqual(rows[0]["routers"], 3)
+        self.assertEqual(rows[0]["interfaces"], 3)
+        self.assertEqual(rows[0]["transit_links"], 1)
+        self.assertEqual(rows[0]["point_to_point_links"], 0)
+        self.assertEqual(rows[0]["lsdb_bytes"], 3 * 24 + 12 * 3 + 32)
+        self.assertEqual(rows[0]["exceeded"], "")
+
+    def test_point_to_point_network_type(self):
+        """Test that a point-to-point network type turns the adjacency into a point-to-point link."""
+        OSPFInterfaceConfiguration.objects.filter(
+            pk__in=[
+                self.fixtures["ospf_interface_configurations"]["router1_ge1"].pk,
+                self.fixtures["ospf_interface_configurations"]["router2_ge1"].pk,
+            ]
+        ).update(network_type="point-to-point")
+
+        row = analyze_ospf_areas()[0]
+
+        self.assertEqual((row["point_to_point_links"], row["transit_links"]), (1, 0))
+        self.assertEqual(row["network_lsas"], 0)
+
+    def test_thresholds(self):
+        """Test that areas over a threshold are reported."""
+        with self.settings(PLUGINS_CONFIG={"nautobot_igp_models": {"ospf_area_thresholds": {"routers": 2}}}):
+            rows = analyze_ospf_areas()
+        self.assertEqual(rows[0]["exceeded"], "routers")
+
+        rows = analyze_ospf_areas(thresholds={"routers": 10, "lsdb_bytes": 100})
+        self.assertEqual(rows[0]["exceeded"], "lsdb_bytes")
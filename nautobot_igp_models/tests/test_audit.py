@@ -0,0 +1,112 @@
+"""Tests for the IGP consistency audit."""
+
+from django.test import TestCase
+
+from nautobot_igp_models.audit import run_audit
+from nautobot_igp_models.models import (
+    IGPAuditReport,
+    IGPRoutingInstance,
+    ISISConfiguration,
+    ISISInterfaceConfiguration,
+    OSPFInterfaceConfiguration,
+)
+from nautobot_igp_models.tests.fixtures import (
+    create_all_fixtures,
+    create_cables,
+)
+
+
+class IGPAuditTestCase(TestCase):
+    """Test cases for run_audit()."""
+
+    def setUp(self):
+        self.fixtures = create_all_fixtures()
+        create_cables()
+
+    def test_clean_dataset_has_no_findings(self):
+        """Test that the default fixtures produce an empty, saved report."""
+        report = run_audit()
+
+        self.assertEqual(report.total_findings, 0)
+        self.assertTrue(IGPAuditReport.objects.filter(pk=report.pk).exists())
+
+    def test_duplicate_router_id(self):
+        """Test that one router ID on two devices in the same VRF is reported."""
+        for device in ("router2", "router3"):
+            IGPRoutingInstance.objects.create(
+                name=f"Dup-RID-{device}",
+                device=self.fixtures["devices"][device],
+                protocol="OSPF",
+                router_id=self.fixtures["ip_addresses"]["router1"],
+                status=self.fixtures["statuses"]["active"],
+            )
+
+        report = run_audit(checks=["duplicate_router_ids"], save=False)
+
+        self.assertEqual(report.summary["duplicate_router_ids"], 1)
+        self.assertEqual(report.findings["duplicate_router_ids"][0]["device_count"], 2)
+
+    def test_duplicate_system_id(self):
+        """Test that a NET shared by two ISIS configurations is reported."""
+        isis_configs = self.fixtures["isis_configurations"]
+        ISISConfiguration.objects.filter(pk=isis_configs["router2"].pk).update(
+            system_id=isis_configs["router1"].system_id
+        )
+
+        report = run_audit(checks=["duplicate_system_ids"], save=False)
+
+        self.assertEqual(
+            report.findings["duplicate_system_ids"],
+            [{"system_id": isis_configs["router1"].system_id, "config_count": 2}],
+        )
+
+    def test_isis_area_mismatch(self):
+        """Test that a Level-1 capable adjacency between different areas is reported once."""
+        ISISInterfaceConfiguration.objects.update(circuit_type="L1L2")
+        IGPRoutingInstance.objects.filter(pk=self.fixtures["igp_instances"]["isis_router2"].pk).update(
+            isis_area="49.0002"
+        )
+
+        report = run_audit(checks=["isis_area_mismatches"], save=False)
+
+        self.assertEqual(report.summary["isis_area_mismatches"], 1)
+        finding = report.findings["isis_area_mismatches"][0]
+        self.assertEqual({finding["local_isis_area"], finding["peer_isis_area"]}, {"49.0001", "49.0002"})
+
+    def test_isis_area_mismatch_ignores_level2(self):
+        """Test that Level-2-only adjacencies may cross area boundaries."""
+        IGPRoutingInstance.objects.filter(pk=self.fixtures["igp_instances"]["isis_router2"].pk).update(
+            isis_area="49.0002"
+        )
+
+        report = run_audit(checks=["isis_area_mismatches"], save=False)
+
+        self.assertEqual(report.summary["isis_area_mismatches"], 0)
+
+    def test_ospf_link_mismatch(self):
+        """Test that an OSPF link with different areas on each end is reported."""
+        OSPFInterfaceConfiguration.objects.filter(
+            pk=self.fixtures["ospf_interface_configurations"]["router2_ge1"].pk
+        ).update(area="0.0.0.1", area_number=1)
+
+        with self.assertNumQueries(1):
+            report = run_audit(checks=["ospf_link_mismatches"], save=False)
+
+        self.assertEqual(report.summary["ospf_link_mismatches"], 1)
+        finding = report.findings["ospf_link_mismatches"][0]
+        self.assertEqual({finding["local_area"], finding["peer_area"]}, {"0.0.0.0", "0.0.0.1"})
+
+    def test_device_mismatch(self):
+        """Test that interface configurations on another device's instance are reported."""
+        ISISInterfaceConfiguration.objects.create(
+            name="Wrong-Device",
+            isis_config=self.fixtures["isis_configurations"]["router1"],
+            device=self.fixtures["devices"]["router2"],
+            interface=self.fixtures["interfaces"]["router2"]["ge2"],
+            status=self.fixtures["statuses"]["active"],
+        )
+
+        report = run_audit(checks=["isis_device_mismatches", "ospf_device_mismatches"], save=False)
+
+        self.assertEqual(report.summary, {"isis_device_mismatches": 1, "ospf_device_mismatches": 0})
+        self.assertEqual(report.findings["isis_device_mismatches"][0]["name"], "Wrong-Device")
@@ -0,0 +1,118 @@
+"""Tests for reference bandwidth auto-cost."""
+
+from django.test import TestCase, override_settings
+from nautobot.dcim.models import Interface
+
+from nautobot_igp_models import cache
+from nautobot_igp_models.autocost import auto_cost, compute_cost, interface_speed_kbps
+from nautobot_igp_models.models import ISISInterfaceConfiguration, OSPFConfiguration, OSPFInterfaceConfiguration
+from nautobot_igp_models.tests.fixtures import create_all_fixtures
+
+
+class ComputeCostTestCase(TestCase):
+    """Test cases for the speed and cost helpers."""
+
+    def test_interface_speed(self):
+        """Test that the speed field wins and the rate in the interface type is the fallback."""
+        self.assertEqual(interface_speed_kbps(25_000_000, "1000base-t"), 25_000_000)
+        self.assertEqual(interface_speed_kbps(None, "1000base-t"), 1_000_000)
+        self.assertEqual(interface_speed_kbps(None, "10gbase-x-sfpp"), 10_000_000)
+        self.assertEqual(interface_speed_kbps(None, "2.5gbase-t"), 2_500_000)
+        self.assertIsNone(interface_speed_kbps(None, "virtual"))
+
+    def test_compute_cost(self):
+        """Test rounding down and clamping to the metric range."""
+        self.assertEqual(compute_cost(100_000, 1_000_000, 65535), 100)
+        self.assertEqual(compute_cost(100_000, 400_000_000, 65535), 1)
+        self.assertEqual(compute_cost(100_000, 1_544, 65535), 65535)
+
+
+@override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+class AutoCostTestCase(TestCase):
+    """Test cases for auto_cost()."""
+
+    def setUp(self):
+        self.fixtures = create_all_fixtures()
+        self.isis_interface_configs = self.fixtures["isis_interface_configurations"]
+        self.ospf_configs = self.fixtures["ospf_configurations"]
+
+    def test_dry_run(self):
+        """Test that a dry run reports the diff without writing."""
+        result = auto_cost("ISIS", dry_run=True)
+
+        self.assertEqual(result.updated, 3)
+        self.assertEqual({(row["current"], row["proposed"]) for row in result.rows}, {(10, 100)})
+        self.assertEqual(result.rows[0]["speed_mbps"], 1000)
+        self.assertFalse(ISISInterfaceConfiguration.objects.exclude(metric=10).exists())
+
+    def test_interface_overrides(self):
+        """Test that costs are written as overrides, with a per-configuration reference bandwidth."""
+        isis_config = self.fixtures["isis_configurations"]["router1"]
+        isis_config.reference_bandwidth = 10_000
+        isis_config.save()
+        interface_config = self.isis_interface_configs["router2_ge1"]
+        scope = cache.object_scope(interface_config)
+        before = cache.get_generations([scope])[scope]
+
+        result = auto_cost("ISIS", reference_bandwidth=1_000_000)
+
+        self.assertEqual((result.updated, result.unchanged), (2, 1))
+        interface_config.refresh_from_db()
+        self.assertEqual(interface_config.metric, 1000)
+        self.assertEqual(
+            ISISInterfaceConfiguration.objects.get(pk=self.isis_interface_configs["router1_ge1"].pk).metric, 10
+        )
+        self.assertNotEqual(cache.get_generations([scope])[scope], before)
+
+    def test_configuration_defaults(self):
+        """Test that defaults take the most common cost and only differing interfaces keep an override."""
+        Interface.objects.filter(device__name="router1", name="GigabitEthernet2").update(type="other")
+        unrated = OSPFInterfaceConfiguration.objects.create(
+            name="OSPF-R1-GE2",
+            ospf_config=self.ospf_configs["router1"],
+            interface=self.fixtures["interfaces"]["router1"]["ge2"],
+            area="0.0.0.0",
+        )
+
+        result = auto_cost("OSPF", target="default")
+
+        self.assertEqual(result.skipped, [unrated.pk])
+        self.ospf_configs["router1"].refresh_from_db()
+        self.assertEqual(self.ospf_configs["router1"].default_cost, 100)
+        interface_config = self.fixtures["ospf_interface_configurations"]["router1_ge1"]
+        interface_config.refresh_from_db()
+        self.assertIsNone(interface_config.cost)
+        self.assertEqual(interface_config.get_effective_cost(), 100)
+        # The interface of unknown speed keeps its previous effective cost
+        unrated.refresh_from_db()
+        self.assertEqual(unrated.cost, 1)
+
+    def test_configuration_defaults_config_context(self):
+        """Test that an interface of unknown speed keeps the cost inherited from the device config context."""
+        device = self.fixtures["devices"]["router1"]
+        device.local_config_context_data = {"igp": {"ospf": {"cost": 20}}}
+        device.save()
+        Interface.objects.filter(device__name="router1", name="GigabitEthernet2").update(type="other")
+        unrated = OSPFInterfaceConfiguration.objects.create(
+            name="OSPF-R1-GE2",
+            ospf_config=self.ospf_configs["router1"],
+            interface=self.fixtures["interfaces"]["router1"]["ge2"],
+            area="0.0.0.0",
+        )
+
+        auto_cost("OSPF", target="default")
+
+        unrated.refresh_from_db()
+        self.assertEqual(unrated.cost, 20)
+        self.assertEqual(unrated.get_effective_cost(), 20)
+
+    def test_scoped_queryset(self):
+        """Test limiting the run to some configurations."""
+        result = auto_cost("OSPF", queryset=OSPFConfiguration.objects.filter(pk=self.ospf_configs["router2"].pk))
+
+        self.assertEqual([row["device"] for row in result.rows], ["router2"])
+
+    def test_invalid_target(self):
+        """Test that an unknown target is rejected."""
+        with self.assertRaises(ValueError):
+            auto_cost("OSPF", target="everywhere")
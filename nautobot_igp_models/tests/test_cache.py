@@ -0,0 +1,76 @@
+"""Tests for the effective configuration cache."""
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from nautobot.extras.models import ConfigContext
+
+from nautobot_igp_models.inheritance import resolve_effective_configs, with_inheritance_related
+from nautobot_igp_models.models import ISISInterfaceConfiguration
+from nautobot_igp_models.tests.fixtures import create_all_fixtures
+
+
+@override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+class EffectiveConfigCacheTestCase(TestCase):
+    """Test cases for cached effective configuration resolution and its invalidation."""
+
+    def setUp(self):
+        cache.clear()
+        self.fixtures = create_all_fixtures()
+        self.interface_config = self.fixtures["isis_interface_configurations"]["router1_ge1"]
+
+    def _resolve(self):
+        interface_configs = list(
+            with_inheritance_related(ISISInterfaceConfiguration.objects.filter(pk=self.interface_config.pk))
+        )
+        return resolve_effective_configs(interface_configs)[self.interface_config.pk]
+
+    def test_cache_hit_issues_no_queries(self):
+        """Test that a warm cache resolves without touching the database."""
+        interface_configs = list(with_inheritance_related(ISISInterfaceConfiguration.objects.all()))
+        expected = resolve_effective_configs(interface_configs)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(resolve_effective_configs(interface_configs), expected)
+
+    def test_interface_config_save_evicts(self):
+        """Test that saving the interface configuration evicts its entry."""
+        self._resolve()
+        self.interface_config.metric = 25
+        self.interface_config.save()
+
+        self.assertEqual(self._resolve()["metric"], 25)
+
+    def test_protocol_config_save_evicts(self):
+        """Test that saving the ISIS configuration evicts the interfaces inheriting its defaults."""
+        self._resolve()
+        isis_config = self.fixtures["isis_configurations"]["router1"]
+        isis_config.default_hello_interval = 3
+        isis_config.save()
+
+        self.assertEqual(self._resolve()["hello_interval"], 3)
+
+    def test_device_save_evicts(self):
+        """Test that changing the device's local config context evicts its interfaces."""
+        self._resolve()
+        device = self.fixtures["devices"]["router1"]
+        device.local_config_context_data = {"igp": {"isis": {"priority": 100}}}
+        device.save()
+
+        self.assertEqual(self._resolve()["priority"], 100)
+
+    def test_config_context_changes_evict(self):
+        """Test that creating, scoping and editing a config context evict the devices it applies to."""
+        self._resolve()
+        config_context = ConfigContext.objects.create(
+            name="IGP timers", data={"igp": {"isis": {"hello_multiplier": 5}}}
+        )
+        self.assertEqual(self._resolve()["hello_multiplier"], 5)
+
+        config_context.roles.add(self.fixtures["devices"]["router2"].role)
+        config_context.device_types.add(self.fixtures["devices"]["router1"].device_type)
+        config_context.data = {"igp": {"isis": {"hello_multiplier": 6}}}
+        config_context.save()
+        self.assertEqual(self._resolve()["hello_multiplier"], 6)
+
+        config_context.delete()
+        self.assertEqual(self._resolve()["hello_multiplier"], 3)
@@ -0,0 +1,140 @@
+"""Tests for the convergence time estimator."""
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from nautobot.users.models import Token
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from nautobot_igp_models.convergence import bfd_detection_ms, estimate_convergence, hold_time_ms
+from nautobot_igp_models.tests.fixtures import create_all_fixtures, create_cables
+
+User = get_user_model()
+
+CISCO_BFD = {"cisco": {"bfd": {"enabled": True, "interval": 50, "multiplier": 3}}}
+
+
+class DetectionTimeTestCase(TestCase):
+    """Test cases for hold and BFD detection times of an effective configuration."""
+
+    def test_hold_time(self):
+        """Test the ISIS hold time is hello interval times multiplier and the OSPF one the dead interval."""
+        self.assertEqual(hold_time_ms("ISIS", {"hello_interval": 10, "hello_multiplier": 3}), 30000)
+        self.assertEqual(hold_time_ms("OSPF", {"hello_interval": 10, "dead_interval": 40}), 40000)
+        self.assertIsNone(hold_time_ms("ISIS", {"hello_interval": 10}))
+
+    def test_bfd_vendor_blocks(self):
+        """Test BFD detection time for each vendor block."""
+        self.assertEqual(bfd_detection_ms(CISCO_BFD), 150)
+        self.assertEqual(
+            bfd_detection_ms(
+                {"juniper": {"bfd_liveness_detection": {"minimum_interval": 100, "minimum_receive_interval": 300}}}
+            ),
+            900,
+        )
+        self.assertEqual(bfd_detection_ms({"nokia": {"bfd": {"enabled": True, "interval": 10, "multiplier": 5}}}), 50)
+        self.assertEqual(bfd_detection_ms({"arista": {"bfd": True}}), 900)
+
+    def test_bfd_disabled(self):
+        """Test that disabled or absent BFD yields no detection time."""
+        self.assertIsNone(bfd_detection_ms({"hello_interval": 10}))
+        self.assertIsNone(bfd_detection_ms({"cisco": {"bfd": {"enabled": False, "interval": 50}}}))
+        self.assertIsNone(bfd_detection_ms({"arista": {"bfd": False}}))
+
+
+class EstimateConvergenceTestCase(TestCase):
+    """Test cases for estimate_convergence()."""
+
+    def setUp(self):
+        self.fixtures = create_all_fixtures()
+        create_cables()
+
+    def _set_isis_context(self, device_name, data):
+        device = self.fixtures["devices"][device_name]
+        device.local_config_context_data = {"igp": {"isis": data}}
+        device.save()
+
+    def _isis_row(self, estimate):
+        return next(row for row in estimate["adjacencies"] if row["protocol"] == "ISIS")
+
+    def test_hold_time_detection(self):
+        """Test that adjacencies without BFD are detected by the inherited hold time."""
+        with self.settings(PLUGINS_CONFIG={"nautobot_igp_models": {"convergence_allowance_ms": 500}}):
+            estimate = estimate_convergence()
+
+        rows = {row["protocol"]: row for row in estimate["adjacencies"]}
+        self.assertEqual(set(rows), {"ISIS", "OSPF"})
+        self.assertEqual(rows["ISIS"]["detection"], "hold")
+        self.assertEqual(rows["ISIS"]["detection_ms"], 30000)
+        self.assertEqual(rows["ISIS"]["convergence_ms"], 30500)
+        self.assertEqual(rows["OSPF"]["detection_ms"], 40000)
+        self.assertFalse(any(row["outlier"] for row in estimate["adjacencies"]))
+
+    def test_bfd_on_both_ends(self):
+        """Test that BFD from the device config context is used when both ends enable it."""
+        self._set_isis_context("router1", CISCO_BFD)
+        self._set_isis_context("router2", {"cisco": {"bfd": {"enabled": True, "interval": 100}}})
+
+        row = self._isis_row(estimate_convergence(protocols=["ISIS"]))
+
+        self.assertEqual(row["detection"], "bfd")
+        self.assertEqual(row["detection_ms"], 300)
+
+    def test_one_sided_bfd_is_outlier(self):
+        """Test that BFD on only one end falls back to the hold time and is flagged."""
+        self._set_isis_context("router1", CISCO_BFD)
+
+        estimate = estimate_convergence(protocols=["ISIS"])
+        row = self._isis_row(estimate)
+
+        self.assertEqual(row["detection"], "hold")
+        self.assertTrue(row["outlier"])
+        self.assertIn("one end", row["notes"])
+        self.assertEqual(
+            {device["device"]: device["outliers"] for device in estimate["devices"]}, {"router1": 1, "router2": 1}
+        )
+
+    def test_device_aggregates(self):
+        """Test per-device aggregation of adjacency estimates."""
+        estimate = estimate_convergence(protocols=["OSPF"])
+
+        devices = {device["device"]: device for device in estimate["devices"]}
+        self.assertEqual(set(devices), {"router1", "router2"})
+        self.assertEqual(devices["router1"]["adjacencies"], 1)
+        self.assertEqual(devices["router1"]["bfd_adjacencies"], 0)
+        self.assertEqual(devices["router1"]["worst_detection_ms"], 40000)
+
+
+class ConvergenceAPITestCase(TestCase):
+    """Test the convergence API action."""
+
+    def setUp(self):
+        create_all_fixtures()
+        create_cables()
+        self.user = User.objects.create(username="testuser", is_superuser=True)
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {Token.objects.create(user=self.user).key}")
+        self.url = reverse("plugins-api:nautobot_igp_models-api:igproutinginstance-convergence")
+
+    def test_convergence(self):
+        """Test that adjacency and device estimates are returned."""
+        response = self.client.get(self.url, {"protocol": "OSPF"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([row["protocol"] for row in response.data["adjacencies"]], ["OSPF"])
+        self.assertEqual(len(response.data["devices"]), 2)
+
+    def test_outliers_only(self):
+        """Test filtering to outliers with a custom outlier factor."""
+        response = self.client.get(self.url, {"outliers": "true"})
+        self.assertEqual(response.data, {"adjacencies": [], "devices": []})
+
+        response = self.client.get(self.url, {"outliers": "true", "outlier_factor": "0.5"})
+        self.assertEqual(len(response.data["adjacencies"]), 2)
+        self.assertTrue(all(row["outlier"] for row in response.data["adjacencies"]))
+
+    def test_invalid_protocol(self):
+        """Test that an unknown protocol is rejected."""
+        response = self.client.get(self.url, {"protocol": "RIP"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
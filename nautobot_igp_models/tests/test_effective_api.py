@@ -0,0 +1,110 @@
+"""Tests for the effective configuration fields of the interface configuration API endpoints."""
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from nautobot.users.models import Token
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from nautobot_igp_models import instrumentation
+from nautobot_igp_models.tests.fixtures import create_all_fixtures
+
+User = get_user_model()
+
+UNCACHED = {"nautobot_igp_models": {"instrumentation_enabled": True, "effective_config_cache_timeout": 0}}
+
+
+@override_settings(PLUGINS_CONFIG=UNCACHED)
+class EffectiveConfigAPITestCase(TestCase):
+    """Test the effective configuration opt-in fields."""
+
+    def setUp(self):
+        self.fixtures = create_all_fixtures()
+        self.user = User.objects.create(username="testuser", is_superuser=True)
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {Token.objects.create(user=self.user).key}")
+        self.isis_url = reverse("plugins-api:nautobot_igp_models-api:isisinterfaceconfiguration-list")
+        self.ospf_url = reverse("plugins-api:nautobot_igp_models-api:ospfinterfaceconfiguration-list")
+
+    def test_not_rendered_by_default(self):
+        """Test that the effective fields are opt-in."""
+        response = self.client.get(self.isis_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("effective_metric", response.data["results"][0])
+        self.assertNotIn("effective_config", response.data["results"][0])
+
+    def test_effective_fields(self):
+        """Test that the effective values follow the inheritance chain, config contexts included."""
+        device = self.fixtures["devices"]["router1"]
+        device.local_config_context_data = {"igp": {"ospf": {"hello_interval": 5}}}
+        device.save()
+        ospf_config = self.fixtures["ospf_configurations"]["router1"]
+        ospf_config.default_cost = 50
+        ospf_config.save()
+        interface_config = self.fixtures["ospf_interface_configurations"]["router1_ge1"]
+        interface_config.cost = None
+        interface_config.save()
+
+        response = self.client.get(f"{self.ospf_url}?include=effective_cost,effective_config")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        result = {result["id"]: result for result in response.data["results"]}[interface_config.pk]
+        self.assertEqual(result["effective_cost"], 50)
+        self.assertEqual(result["effective_config"]["hello_interval"], 5)
+
+    def test_context_only_cost(self):
+        """Test that a cost set only in the device config context is the effective cost."""
+        device = self.fixtures["devices"]["router1"]
+        device.local_config_context_data = {"igp": {"ospf": {"cost": 20}}}
+        device.save()
+        interface_config = self.fixtures["ospf_interface_configurations"]["router1_ge1"]
+        interface_config.cost = None
+        interface_config.save()
+
+        response = self.client.get(f"{self.ospf_url}?include=effective_cost,effective_config")
+
+        result = {result["id"]: result for result in response.data["results"]}[interface_config.pk]
+        self.assertEqual(result["effective_cost"], 20)
+        self.assertEqual(result["effective_config"]["cost"], 20)
+
+    def test_detail(self):
+        """Test the effective fields of a single object."""
+        interface_config = self.fixtures["isis_interface_configurations"]["router1_ge1"]
+        url = reverse(
+            "plugins-api:nautobot_igp_models-api:isisinterfaceconfiguration-detail", kwargs={"pk": interface_config.pk}
+        )
+
+        response = self.client.get(f"{url}?include=effective_metric&include=effective_config")
+
+        self.assertEqual(response.data["effective_metric"], interface_config.get_effective_metric())
+        self.assertEqual(response.data["effective_config"]["circuit_type"], interface_config.circuit_type)
+
+    def test_single_field(self):
+        """Test that each effective field is opted in separately."""
+        response = self.client.get(f"{self.isis_url}?include=effective_metric")
+
+        self.assertIn("effective_metric", response.data["results"][0])
+        self.assertNotIn("effective_config", response.data["results"][0])
+
+    def test_combined_with_sparse_fields(self):
+        """Test selecting only the effective metric."""
+        response = self.client.get(f"{self.isis_url}?include=effective_metric&fields=effective_metric")
+
+        self.assertEqual(set(response.data["results"][0]), {"id", "effective_metric"})
+
+    def test_constant_queries_and_merges(self):
+        """Test that a page issues the same queries whatever its size, with one context merge per device."""
+        with CaptureQueriesContext(connection) as single:
+            self.client.get(f"{self.isis_url}?include=effective_metric,effective_config&limit=1")
+        instrumentation.reset()
+        with CaptureQueriesContext(connection) as full:
+            response = self.client.get(f"{self.isis_url}?include=effective_metric,effective_config")
+
+        self.assertEqual(response.data["count"], 3)
+        self.assertEqual(len(full.captured_queries), len(single.captured_queries))
+        devices = {result["device"]["id"] for result in response.data["results"]}
+        self.assertEqual(instrumentation.snapshot()[1], len(devices))
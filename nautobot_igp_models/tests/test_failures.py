@@ -0,0 +1,99 @@
+"""Tests for the link failure impact sweep."""
+
+from unittest import mock
+
+from django.test import SimpleTestCase, TestCase
+
+from nautobot_igp_models import failures
+from nautobot_igp_models.failures import MIN_PARALLEL_NODES, link_failure_impact, simulate_failures
+from nautobot_igp_models.graph import IGPGraph, shortest_paths
+from nautobot_igp_models.tests.fixtures import create_all_fixtures, create_cables
+
+
+def build_graph(links):
+    """Build an IGPGraph from (a, b, metric) tuples with symmetric metrics."""
+    graph = IGPGraph()
+    for node_a, node_b, metric in links:
+        graph.add_link(
+            {
+                "a_instance_id": node_a,
+                "b_instance_id": node_b,
+                "a_device": node_a,
+                "b_device": node_b,
+                "a_metric": metric,
+                "b_metric": metric,
+            }
+        )
+    return graph
+
+
+class SimulateFailuresTestCase(SimpleTestCase):
+    """Test cases for simulate_failures() on synthetic graphs."""
+
+    def setUp(self):
+        # Square r1-r2-r3-r4-r1 where r1->r3 has two equal-cost paths, plus a stub r5 behind r4
+        self.graph = build_graph(
+            [("r1", "r2", 10), ("r2", "r3", 10), ("r3", "r4", 10), ("r4", "r1", 10), ("r4", "r5", 10)]
+        )
+
+    def test_shortest_paths_ecmp(self):
+        """Test that equal-cost predecessors are all recorded."""
+        distance, predecessors, _ = shortest_paths(self.graph, self.graph.node_index["r1"])
+
+        self.assertEqual(distance[self.graph.node_index["r3"]], 20)
+        self.assertEqual(len(predecessors[self.graph.node_index["r3"]]), 2)
+
+    def test_single_link_failures(self):
+        """Test lost, cost-increased and rerouted pair counts."""
+        impacts = simulate_failures(self.graph, [(link,) for link in range(len(self.graph.links))], workers=1)
+
+        stub = impacts[4]
+        self.assertEqual(stub["lost_pairs"], 8)  # r5 <-> each of the four other routers
+        self.assertEqual(stub["cost_increased_pairs"], 0)
+        r1_r2 = impacts[0]
+        self.assertEqual(r1_r2["lost_pairs"], 0)
+        self.assertEqual(r1_r2["cost_increased_pairs"], 2)  # r1 <-> r2 now go the long way round
+        self.assertGreater(r1_r2["rerouted_pairs"], 0)  # r1 <-> r3 keep their cost over the other side
+
+    def test_group_failure(self):
+        """Test that links failing together are evaluated as one failure."""
+        impacts = simulate_failures(self.graph, [(0, 3)], workers=1)
+
+        self.assertEqual(impacts[0]["lost_pairs"], 8)  # r1 is isolated from the other four routers
+
+
+class WorkerPoolTestCase(SimpleTestCase):
+    """Test cases for the process pool of simulate_failures()."""
+
+    def test_in_process_when_daemonic(self):
+        """Test that a daemonic process (e.g. a Celery prefork child) runs in-process, with the same results."""
+        nodes = [f"r{index}" for index in range(MIN_PARALLEL_NODES)]
+        graph = build_graph([(node, nodes[index - 1], 10) for index, node in enumerate(nodes)])
+        failures_to_simulate = [(0,), (1, 2)]
+        expected = simulate_failures(graph, failures_to_simulate, workers=1)
+
+        with (
+            mock.patch.object(failures.multiprocessing, "current_process", return_value=mock.Mock(daemon=True)),
+            mock.patch.object(failures, "ProcessPoolExecutor") as executor,
+        ):
+            impacts = simulate_failures(graph, failures_to_simulate, workers=2)
+
+        executor.assert_not_called()
+        self.assertEqual(impacts, expected)
+
+
+class LinkFailureImpactTestCase(TestCase):
+    """Test cases for link_failure_impact() on the fixture topology."""
+
+    def setUp(self):
+        create_all_fixtures()
+        create_cables()
+
+    def test_isis_ranking(self):
+        """Test that the single cabled ISIS link partitions its two routers."""
+        rows = link_failure_impact("ISIS", workers=1)
+
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["rank"], 1)
+        self.assertEqual(rows[0]["lost_pairs"], 2)
+        self.assertEqual({rows[0]["a_device"], rows[0]["b_device"]}, {"router1", "router2"})
@@ -147,3 +147,39 @@ class OSPFInterfaceConfigurationFilterTestCase(TestCase):
 
         self.assertTrue(filterset.is_valid())
         self.assertEqual(filterset.qs.count(), OSPFInterfaceConfiguration.objects.count())
+
+    def test_filter_by_area_is_numeric(self):
+        """Test that the area filter matches equivalent notations."""
+        create_ospf_interface_configurations()
+
+        for area in ("0", "00.0.0.0"):
+            filterset = OSPFInterfaceConfigurationFilterSet(
+                data={"area": area},
+                queryset=OSPFInterfaceConfiguration.objects.all(),
+            )
+            self.assertEqual(filterset.qs.count(), 3)
+
+    def test_filter_by_area_range(self):
+        """Test filtering by an inclusive area range."""
+        ospf_int_configs = create_ospf_interface_configurations()
+        OSPFInterfaceConfiguration.objects.filter(pk=ospf_int_configs["router3_ge1"].pk).update(
+            area="0.0.0.10", area_number=10
+        )
+
+        filterset = OSPFInterfaceConfigurationFilterSet(
+            data={"area_min": "1", "area_max": "0.0.0.20"},
+            queryset=OSPFInterfaceConfiguration.objects.all(),
+        )
+
+        self.assertEqual(list(filterset.qs), [ospf_int_configs["router3_ge1"]])
+
+    def test_filter_by_invalid_area(self):
+        """Test that an unparseable area matches nothing."""
+        create_ospf_interface_configurations()
+
+        filterset = OSPFInterfaceConfigurationFilterSet(
+            data={"area": "backbone"},
+            queryset=OSPFInterfaceConfiguration.objects.all(),
+        )
+
+        self.assertEqual(filterset.qs.count(), 0)
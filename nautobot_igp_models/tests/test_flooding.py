@@ -0,0 +1,113 @@
+"""Tests for the ISIS flooding domain analysis."""
+
+from django.test import TestCase, override_settings
+
+from nautobot_igp_models.flooding import (
+    UnionFind,
+    analyze_flooding_domains,
+    instance_flooding_domains,
+    lsp_size,
+)
+from nautobot_igp_models.models import ISISInterfaceConfiguration
+from nautobot_igp_models.tests.fixtures import create_all_fixtures, create_cables
+
+
+class UnionFindTestCase(TestCase):
+    """Test cases for UnionFind."""
+
+    def test_union(self):
+        """Test that unions merge sets transitively."""
+        union_find = UnionFind(5)
+        union_find.union(0, 1)
+        union_find.union(3, 1)
+
+        self.assertEqual(union_find.find(0), union_find.find(3))
+        self.assertNotEqual(union_find.find(0), union_find.find(2))
+        self.assertEqual(union_find.size[union_find.find(0)], 3)
+
+
+class LSPSizeTestCase(TestCase):
+    """Test cases for lsp_size()."""
+
+    def test_lsp_size(self):
+        """Test the TLV accounting of an LSP."""
+        # Header, area TLV (3 byte area), hostname TLV, one IS reach TLV and one IP reach TLV
+        self.assertEqual(lsp_size("49.0001", "router1", 2, 3), 27 + 2 + 1 + 3 + 2 + 7 + (2 + 22) + (2 + 27))
+
+    def test_tlv_split(self):
+        """Test that neighbors beyond one TLV's capacity add another TLV header."""
+        self.assertEqual(lsp_size("49.0001", "r", 24, 0) - lsp_size("49.0001", "r", 23, 0), 11 + 2)
+
+
+@override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+class FloodingDomainTestCase(TestCase):
+    """Test cases for analyze_flooding_domains()."""
+
+    def setUp(self):
+        self.fixtures = create_all_fixtures()
+        create_cables()
+        self.instances = self.fixtures["igp_instances"]
+
+    def _set_circuit_type(self, circuit_type, *keys):
+        for key in keys:
+            interface_config = self.fixtures["isis_interface_configurations"][key]
+            interface_config.circuit_type = circuit_type
+            interface_config.save()
+
+    def _domains(self, level):
+        return [domain for domain in analyze_flooding_domains()["domains"] if domain["level"] == level]
+
+    def test_level2_domains(self):
+        """Test that the cabled L2 routers share a domain and the uncabled one is alone."""
+        domains = self._domains("L2")
+
+        self.assertEqual([domain["devices"] for domain in domains], [["router1", "router2"], ["router3"]])
+        self.assertEqual(domains[0]["adjacencies"], 1)
+        self.assertEqual(self._domains("L1"), [])
+
+    def test_level1_domain_with_exit(self):
+        """Test that L1L2 routers form an L1 domain whose exits are the routers with L2 adjacencies."""
+        self._set_circuit_type("L1L2", "router1_ge1", "router2_ge1")
+
+        domain = self._domains("L1")[0]
+
+        self.assertEqual(domain["devices"], ["router1", "router2"])
+        self.assertEqual(domain["areas"], ["49.0001"])
+        self.assertEqual(domain["exits"], ["router1", "router2"])
+        self.assertFalse(domain["island"])
+
+    def test_level1_island(self):
+        """Test that an L1 domain without any L2 adjacency is reported as an island."""
+        self._set_circuit_type("L1", "router1_ge1", "router2_ge1")
+
+        domain = self._domains("L1")[0]
+
+        self.assertEqual(domain["devices"], ["router1", "router2"])
+        self.assertTrue(domain["island"])
+
+    def test_level1_requires_matching_area(self):
+        """Test that level-1 adjacencies are only formed within an ISIS area."""
+        self._set_circuit_type("L1", "router1_ge1", "router2_ge1")
+        router2 = self.instances["isis_router2"]
+        router2.isis_area = "49.0002"
+        router2.save()
+
+        self.assertEqual(sorted(domain["devices"] for domain in self._domains("L1")), [["router1"], ["router2"]])
+
+    def test_instance_domains_cached(self):
+        """Test the cached per-instance lookup and its invalidation when a circuit type changes."""
+        with self.settings(PLUGINS_CONFIG={"nautobot_igp_models": {"effective_config_cache_timeout": 300}}):
+            domains = instance_flooding_domains(self.instances["isis_router1"].pk)
+            self.assertEqual([domain["level"] for domain in domains], ["L2"])
+
+            ISISInterfaceConfiguration.objects.filter(
+                pk=self.fixtures["isis_interface_configurations"]["router1_ge1"].pk
+            ).update(circuit_type="L1")
+            # Queryset updates send no signals, so the cached result is served
+            self.assertEqual(
+                [domain["level"] for domain in instance_flooding_domains(self.instances["isis_router1"].pk)], ["L2"]
+            )
+
+            self._set_circuit_type("L1", "router1_ge1")
+            domains = instance_flooding_domains(self.instances["isis_router1"].pk)
+            self.assertEqual([domain["level"] for domain in domains], ["L1"])
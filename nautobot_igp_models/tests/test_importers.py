@@ -0,0 +1,154 @@
+"""Tests for the IGP bulk importer."""
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from nautobot_igp_models.importers import IGPBulkImporter
+from nautobot_igp_models.models import (
+    IGPRoutingInstance,
+    ISISConfiguration,
+    ISISInterfaceConfiguration,
+    OSPFInterfaceConfiguration,
+)
+from nautobot_igp_models.tests.fixtures import (
+    create_interfaces,
+    create_ip_addresses,
+    create_ospf_configurations,
+    create_statuses,
+    create_vrfs,
+)
+
+
+class IGPBulkImporterTestCase(TestCase):
+    """Test cases for IGPBulkImporter."""
+
+    def setUp(self):
+        create_statuses()
+        create_interfaces()
+        create_ip_addresses()
+        create_vrfs()
+
+    def test_import_isis_hierarchy(self):
+        """Test importing an instance, its ISIS configuration and an interface in one run."""
+        data = {
+            "igp_routing_instances": [
+                {
+                    "name": "ISIS-Import-R1",
+                    "device": "router1",
+                    "protocol": "ISIS",
+                    "router_id": "10.0.0.1/32",
+                    "vrf": "Management",
+                    "isis_area": "49.0002",
+                    "status": "Active",
+                },
+            ],
+            "isis_configurations": [
+                {"name": "ISIS-Import-Config", "instance": "ISIS-Import-R1", "status": "Active"},
+            ],
+            "isis_interface_configurations": [
+                {
+                    "name": "ISIS-Import-GE2",
+                    "instance": "ISIS-Import-R1",
+                    "isis_config": "ISIS-Import-Config",
+                    "interface": "GigabitEthernet2",
+                    "circuit_type": "L2",
+                    "metric": "20",
+                    "status": "Active",
+                },
+            ],
+        }
+
+        result = IGPBulkImporter().run(data)
+
+        self.assertEqual(result.errors, [])
+        self.assertEqual(result.total_created, 3)
+        isis_config = ISISConfiguration.objects.get(name="ISIS-Import-Config")
+        self.assertEqual(isis_config.system_id, "49.0002.0010.0000.0001.00")
+        interface_config = ISISInterfaceConfiguration.objects.get(name="ISIS-Import-GE2")
+        self.assertEqual(interface_config.device.name, "router1")
+        self.assertEqual(interface_config.metric, 20)
+
+    def test_row_errors_do_not_abort_batch(self):
+        """Test that invalid rows are reported while valid rows are still created."""
+        data = {
+            "igp_routing_instances": [
+                {
+                    "name": "Bad-Area",
+                    "device": "router1",
+                    "protocol": "ISIS",
+                    "isis_area": "49.abcd",
+                    "status": "Active",
+                },
+                {"name": "Bad-Device", "device": "missing", "protocol": "OSPF", "status": "Active"},
+                {"name": "Good-OSPF", "device": "router2", "protocol": "OSPF", "vrf": "Management", "status": "Active"},
+                {"name": "Dup-OSPF", "device": "router2", "protocol": "OSPF", "vrf": "Management", "status": "Active"},
+            ],
+        }
+
+        result = IGPBulkImporter().run(data)
+
+        self.assertEqual(result.created["igp_routing_instances"], 1)
+        self.assertEqual([error.row for error in result.errors], [1, 2, 4])
+        self.assertIn("isis_area", result.errors[0].message)
+        self.assertTrue(IGPRoutingInstance.objects.filter(name="Good-OSPF").exists())
+
+    def test_import_ospf_interfaces_existing_config(self):
+        """Test importing OSPF interface configurations against an existing OSPF configuration."""
+        ospf_configs = create_ospf_configurations()
+        instance_name = ospf_configs["router1"].instance.name
+        data = {
+            "ospf_interface_configurations": [
+                {
+                    "name": "OSPF-GE2",
+                    "instance": instance_name,
+                    "interface": "GigabitEthernet2",
+                    "area": "0.0.0.1",
+                    "status": "Active",
+                },
+                {
+                    "name": "OSPF-Missing",
+                    "instance": instance_name,
+                    "interface": "GigabitEthernet9",
+                    "area": "0",
+                    "status": "Active",
+                },
+            ],
+        }
+
+        result = IGPBulkImporter().run(data)
+
+        self.assertEqual(result.created["ospf_interface_configurations"], 1)
+        self.assertEqual(len(result.errors), 1)
+        self.assertEqual(OSPFInterfaceConfiguration.objects.get(name="OSPF-GE2").area, "0.0.0.1")
+
+    def test_dry_run(self):
+        """Test that a dry-run validates without writing."""
+        data = {
+            "igp_routing_instances": [
+                {"name": "Dry-Run", "device": "router3", "protocol": "OSPF", "vrf": "Management", "status": "Active"},
+            ],
+        }
+
+        result = IGPBulkImporter().run(data, dry_run=True)
+
+        self.assertEqual(result.created["igp_routing_instances"], 1)
+        self.assertFalse(IGPRoutingInstance.objects.filter(name="Dry-Run").exists())
+
+    def test_queries_do_not_grow_with_rows(self):
+        """Test that foreign keys are resolved once per referenced model, not validated again per row."""
+        instance_name = create_ospf_configurations()["router1"].instance.name
+        rows = [
+            {"name": f"OSPF-{interface}", "instance": instance_name, "interface": interface, "area": "0"}
+            for interface in ("Loopback0", "GigabitEthernet1", "GigabitEthernet2")
+        ]
+        OSPFInterfaceConfiguration.objects.all().delete()
+
+        with CaptureQueriesContext(connection) as single:
+            single_result = IGPBulkImporter().run({"ospf_interface_configurations": rows[:1]}, dry_run=True)
+        with CaptureQueriesContext(connection) as full:
+            full_result = IGPBulkImporter().run({"ospf_interface_configurations": rows}, dry_run=True)
+
+        self.assertEqual((single_result.errors, full_result.errors), ([], []))
+        self.assertEqual(full_result.created["ospf_interface_configurations"], 3)
+        self.assertEqual(len(full.captured_queries), len(single.captured_queries))
@@ -0,0 +1,68 @@
+"""Tests that the hot filter paths are served by database indexes."""
+
+from unittest import skipUnless
+
+from django.db import connection
+from django.test import TestCase
+
+from nautobot_igp_models.models import (
+    IGPRoutingInstance,
+    ISISConfiguration,
+    ISISInterfaceConfiguration,
+    OSPFInterfaceConfiguration,
+)
+from nautobot_igp_models.tests.fixtures import create_all_fixtures
+
+
+@skipUnless(connection.vendor == "postgresql", "Query plans are only checked on PostgreSQL")
+class FilterIndexTestCase(TestCase):
+    """Check EXPLAIN output of the filter queries for the expected index."""
+
+    def setUp(self):
+        self.fixtures = create_all_fixtures()
+        with connection.cursor() as cursor:
+            # The test tables are tiny; make the planner prefer any usable index over a sequential scan.
+            cursor.execute("SET LOCAL enable_seqscan = off")
+
+    def assertUsesIndex(self, queryset, index_name):  # pylint: disable=invalid-name
+        """Assert that the query plan of ``queryset`` references ``index_name``."""
+        plan = queryset.explain()
+        self.assertIn(index_name, plan)
+
+    def test_instance_protocol_area(self):
+        """Test instance lookups by protocol and ISIS area."""
+        self.assertUsesIndex(
+            IGPRoutingInstance.objects.filter(protocol="ISIS", isis_area="49.0001"), "igp_instance_proto_area_idx"
+        )
+
+    def test_isis_system_id(self):
+        """Test ISIS configuration lookups by NET."""
+        self.assertUsesIndex(
+            ISISConfiguration.objects.filter(system_id=self.fixtures["isis_configurations"]["router1"].system_id),
+            "igp_isis_system_id_idx",
+        )
+
+    def test_isis_interface_config_circuit_type(self):
+        """Test ISIS interface configuration lookups by configuration and circuit type."""
+        self.assertUsesIndex(
+            ISISInterfaceConfiguration.objects.filter(
+                isis_config=self.fixtures["isis_configurations"]["router1"], circuit_type="L2"
+            ),
+            "igp_isisif_cfg_circuit_idx",
+        )
+
+    def test_ospf_interface_config_area(self):
+        """Test OSPF interface configuration lookups by configuration and area."""
+        self.assertUsesIndex(
+            OSPFInterfaceConfiguration.objects.filter(
+                ospf_config=self.fixtures["ospf_configurations"]["router1"], area_number=0
+            ),
+            "igp_ospfif_cfg_areanum_idx",
+        )
+
+    def test_ospf_area_network_type(self):
+        """Test OSPF interface configuration lookups by area and network type."""
+        self.assertUsesIndex(
+            OSPFInterfaceConfiguration.objects.filter(area_number=0, network_type="point-to-point"),
+            "igp_ospfif_areanum_nettype_idx",
+        )
@@ -0,0 +1,67 @@
+"""Tests for effective configuration instrumentation."""
+
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+
+from nautobot_igp_models import instrumentation
+from nautobot_igp_models.inheritance import resolve_effective_configs, with_inheritance_related
+from nautobot_igp_models.metrics import metric_effective_config_instrumentation
+from nautobot_igp_models.middleware import SUMMARY_HEADER, InstrumentationSummaryMiddleware
+from nautobot_igp_models.models import ISISInterfaceConfiguration
+from nautobot_igp_models.tests.fixtures import create_all_fixtures
+
+ENABLED = {"nautobot_igp_models": {"instrumentation_enabled": True, "effective_config_cache_timeout": 0}}
+DISABLED = {"nautobot_igp_models": {"instrumentation_enabled": False, "effective_config_cache_timeout": 0}}
+
+
+class InstrumentationTestCase(TestCase):
+    """Test cases for instrumented effective configuration resolution."""
+
+    def setUp(self):
+        create_all_fixtures()
+        self.interface_configs = list(with_inheritance_related(ISISInterfaceConfiguration.objects.all()))
+        instrumentation.reset()
+
+    @override_settings(PLUGINS_CONFIG=ENABLED)
+    def test_records_calls_queries_and_merges(self):
+        """Test that resolution records per-operation totals and config context merges."""
+        resolve_effective_configs(self.interface_configs)
+
+        operations, merges = instrumentation.snapshot()
+        self.assertEqual(operations["get_effective_config"]["calls"], 3)
+        self.assertEqual(operations["resolve_effective_configs"]["calls"], 1)
+        self.assertGreater(operations["attach_config_contexts"]["queries"], 0)
+        self.assertEqual(merges, 3)
+
+    @override_settings(PLUGINS_CONFIG=DISABLED)
+    def test_disabled_records_nothing(self):
+        """Test that nothing is recorded unless instrumentation is enabled."""
+        resolve_effective_configs(self.interface_configs)
+
+        self.assertEqual(instrumentation.snapshot(), ({}, 0))
+
+    @override_settings(PLUGINS_CONFIG=ENABLED)
+    def test_metrics(self):
+        """Test that the Prometheus metric generator exposes the totals."""
+        resolve_effective_configs(self.interface_configs)
+
+        samples = {
+            (sample.name, sample.labels.get("operation")): sample.value
+            for family in metric_effective_config_instrumentation()
+            for sample in family.samples
+        }
+        self.assertEqual(samples[("nautobot_igp_models_operation_calls_total", "get_effective_config")], 3)
+        self.assertEqual(samples[("nautobot_igp_models_config_context_merges_total", None)], 3)
+
+    @override_settings(PLUGINS_CONFIG=ENABLED, DEBUG=True)
+    def test_middleware_summary_header(self):
+        """Test that the per-request summary is reported in DEBUG mode."""
+
+        def view(request):
+            resolve_effective_configs(self.interface_configs)
+            return HttpResponse()
+
+        response = InstrumentationSummaryMiddleware(view)(RequestFactory().get("/"))
+
+        self.assertIn("get_effective_config=3c/", response[SUMMARY_HEADER])
+        self.assertIn("merges=3", response[SUMMARY_HEADER])
@@ -0,0 +1,81 @@
+"""Tests for the load_igp_resources management command."""
+
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from nautobot.extras.models import ConfigContextSchema, ExportTemplate
+
+from nautobot_igp_models.management.commands.load_igp_resources import (
+    FINGERPRINT_CACHE_KEY,
+    FINGERPRINT_NAME,
+    SCHEMA_DEFINITIONS,
+    TEMPLATE_DEFINITIONS,
+)
+from nautobot_igp_models.models import IGPResourceFingerprint
+
+
+@override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+class LoadIGPResourcesTestCase(TestCase):
+    """Test cases for load_igp_resources."""
+
+    def setUp(self):
+        cache.delete(FINGERPRINT_CACHE_KEY)
+        IGPResourceFingerprint.objects.all().delete()
+        ConfigContextSchema.objects.filter(name__in=[schema["name"] for schema in SCHEMA_DEFINITIONS]).delete()
+        ExportTemplate.objects.filter(name__in=[template["name"] for template in TEMPLATE_DEFINITIONS]).delete()
+
+    def test_load_creates_resources(self):
+        """Test that all bundled resources are created and the fingerprint is stored."""
+        call_command("load_igp_resources", stdout=StringIO())
+
+        self.assertEqual(
+            ConfigContextSchema.objects.filter(name__in=[schema["name"] for schema in SCHEMA_DEFINITIONS]).count(),
+            len(SCHEMA_DEFINITIONS),
+        )
+        self.assertEqual(
+            ExportTemplate.objects.filter(name__in=[template["name"] for template in TEMPLATE_DEFINITIONS]).count(),
+            len(TEMPLATE_DEFINITIONS),
+        )
+        self.assertEqual(
+            IGPResourceFingerprint.objects.get(name=FINGERPRINT_NAME).fingerprint, cache.get(FINGERPRINT_CACHE_KEY)
+        )
+
+    def test_unchanged_resources_skip_writes(self):
+        """Test that a second run with an unchanged fingerprint only verifies presence."""
+        call_command("load_igp_resources", stdout=StringIO())
+
+        out = StringIO()
+        with self.assertNumQueries(2):
+            call_command("load_igp_resources", stdout=out)
+        self.assertIn("nothing to do", out.getvalue())
+
+    def test_fingerprint_survives_cache_flush(self):
+        """Test that the fast path reads the fingerprint from the database when the cache was flushed."""
+        call_command("load_igp_resources", stdout=StringIO())
+        cache.clear()
+
+        out = StringIO()
+        with self.assertNumQueries(3):
+            call_command("load_igp_resources", stdout=out)
+        self.assertIn("nothing to do", out.getvalue())
+        self.assertIsNotNone(cache.get(FINGERPRINT_CACHE_KEY))
+
+    def test_missing_resources_are_reloaded(self):
+        """Test that a matching fingerprint does not hide resources deleted from the database."""
+        call_command("load_igp_resources", stdout=StringIO())
+        ExportTemplate.objects.filter(name=TEMPLATE_DEFINITIONS[0]["name"]).delete()
+
+        call_command("load_igp_resources", stdout=StringIO())
+
+        self.assertTrue(ExportTemplate.objects.filter(name=TEMPLATE_DEFINITIONS[0]["name"]).exists())
+
+    def test_force_updates_existing(self):
+        """Test that --force rewrites existing templates even when the fingerprint matches."""
+        call_command("load_igp_resources", stdout=StringIO())
+        ExportTemplate.objects.filter(name=TEMPLATE_DEFINITIONS[0]["name"]).update(template_code="stale")
+
+        call_command("load_igp_resources", "--force", stdout=StringIO())
+
+        self.assertNotEqual(ExportTemplate.objects.get(name=TEMPLATE_DEFINITIONS[0]["name"]).template_code, "stale")
@@ -0,0 +1,138 @@
+"""Tests for the traffic engineering metric optimizer."""
+
+import importlib.util
+from unittest import mock, skipUnless
+
+from django.test import TestCase, override_settings
+from nautobot.dcim.models import Interface
+
+from nautobot_igp_models import cache, failures
+from nautobot_igp_models.metric_optimizer import (
+    MIN_PARALLEL_NODES,
+    TrafficModel,
+    apply_proposal,
+    arc_loads,
+    load_traffic_model,
+    objective,
+    optimize_metrics,
+    parse_demands,
+)
+from nautobot_igp_models.models import ISISInterfaceConfiguration
+from nautobot_igp_models.tests.fixtures import create_all_fixtures, create_cables
+
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+
+def square_model():
+    """Four routers in a square plus a 0-3 diagonal, with 15 Gbps from 0 to 3 over 10 Gbps links."""
+    links = [(0, 1), (0, 2), (1, 3), (2, 3), (0, 3)]
+    tails = [node for a, b in links for node in (a, b)]
+    heads = [node for a, b in links for node in (b, a)]
+    demand = [[0, 0, 0, 15], [0] * 4, [0] * 4, [0] * 4]
+    return TrafficModel(4, tails, heads, [1] * len(tails), [10] * len(tails), demand)
+
+
+class ParseDemandsTestCase(TestCase):
+    """Test cases for parse_demands()."""
+
+    def test_parse(self):
+        """Test parsing a demand file."""
+        demands = parse_demands("source,destination,gbps\n10.0.0.1, router2 ,2.5\n")
+        self.assertEqual(demands, [("10.0.0.1", "router2", 2.5)])
+
+    def test_missing_column(self):
+        """Test that a file without the gbps column is rejected."""
+        with self.assertRaisesRegex(ValueError, "gbps"):
+            parse_demands("source,destination\nrouter1,router2\n")
+
+    def test_invalid_demand(self):
+        """Test that non-numeric and negative demands are rejected with their line."""
+        with self.assertRaisesRegex(ValueError, "Line 2"):
+            parse_demands("source,destination,gbps\nrouter1,router2,lots\n")
+        with self.assertRaisesRegex(ValueError, "negative"):
+            parse_demands("source,destination,gbps\nrouter1,router2,-1\n")
+
+
+@skipUnless(HAS_NUMPY, "numpy is not installed")
+class OptimizeMetricsTestCase(TestCase):
+    """Test cases for the vectorized routing and the local search."""
+
+    def test_equal_cost_split(self):
+        """Test that traffic is split evenly over equal-cost paths and forwarded hop by hop."""
+        model = square_model()
+        weights = model.metrics.copy()
+        weights[8] = 5  # 0 -> 3 diagonal
+
+        loads = arc_loads(model, weights)
+
+        # 0 -> 1 -> 3 and 0 -> 2 -> 3 carry half each; the diagonal carries nothing
+        self.assertEqual(loads.tolist(), [7.5, 0, 7.5, 0, 7.5, 0, 7.5, 0, 0, 0])
+
+    def test_optimize(self):
+        """Test that the search spreads the demand from the congested diagonal over all three paths."""
+        model = square_model()
+        self.assertEqual(objective(model, model.metrics), (1.5, 2.25))
+
+        weights, initial, final = optimize_metrics(model, workers=1)
+
+        self.assertEqual(initial[0], 1.5)
+        self.assertEqual(final[0], 0.5)
+        self.assertEqual(weights[8], 2)
+
+    def test_in_process_when_daemonic(self):
+        """Test that a daemonic process (e.g. a Celery prefork child) runs in-process, with the same results."""
+        count = MIN_PARALLEL_NODES
+        links = [(node, (node + 1) % count) for node in range(count)] + [(0, count // 2)]
+        tails = [node for a, b in links for node in (a, b)]
+        heads = [node for a, b in links for node in (b, a)]
+        demand = [[0] * count for _ in range(count)]
+        demand[0][count // 2] = 15
+        model = TrafficModel(count, tails, heads, [1] * len(tails), [10] * len(tails), demand)
+        expected = optimize_metrics(model, iterations=3, workers=1)
+
+        with (
+            mock.patch.object(failures.multiprocessing, "current_process", return_value=mock.Mock(daemon=True)),
+            mock.patch.object(failures, "ProcessPoolExecutor") as executor,
+        ):
+            weights, initial, final = optimize_metrics(model, iterations=3, workers=2)
+
+        executor.assert_not_called()
+        self.assertEqual(weights.tolist(), expected[0].tolist())
+        self.assertEqual((initial, final), expected[1:])
+
+
+@override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+class ApplyProposalTestCase(TestCase):
+    """Test cases for the traffic model loading and apply_proposal()."""
+
+    def setUp(self):
+        self.fixtures = create_all_fixtures()
+        create_cables()
+        self.interface_config = self.fixtures["isis_interface_configurations"]["router1_ge1"]
+
+    @skipUnless(HAS_NUMPY, "numpy is not installed")
+    def test_load_traffic_model(self):
+        """Test that capacity comes from the slower interface and demands are matched by device name."""
+        Interface.objects.filter(device__name="router1", name="GigabitEthernet1").update(speed=10_000_000)
+        Interface.objects.filter(device__name="router2", name="GigabitEthernet1").update(speed=1_000_000)
+
+        model, unmatched = load_traffic_model("ISIS", [("router1", "router2", 0.5), ("router1", "unknown", 1)])
+
+        self.assertEqual(model.node_count, 2)
+        self.assertEqual(model.capacity.tolist(), [1.0, 1.0])
+        self.assertEqual(model.demand.sum(), 0.5)
+        self.assertEqual(unmatched, [("router1", "unknown", 1)])
+        self.assertEqual(arc_loads(model, model.metrics).sum(), 0.5)
+
+    def test_apply_proposal(self):
+        """Test that proposed metrics are written in bulk and the cached objects invalidated."""
+        scopes = [cache.object_scope(ISISInterfaceConfiguration, self.interface_config.pk), cache.TOPOLOGY_SCOPE]
+        before = cache.get_generations(scopes)
+
+        updated = apply_proposal("ISIS", [{"config_id": str(self.interface_config.pk), "proposed_metric": 42}])
+
+        self.assertEqual(updated, 1)
+        self.interface_config.refresh_from_db()
+        self.assertEqual(self.interface_config.metric, 42)
+        after = cache.get_generations(scopes)
+        self.assertTrue(all(after[scope] != before[scope] for scope in scopes))
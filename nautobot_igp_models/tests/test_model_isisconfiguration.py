@@ -2,9 +2,10 @@
 
 from django.test import TestCase
 
-from nautobot_igp_models.models import ISISConfiguration
+from nautobot_igp_models.models import IGPRoutingInstance, ISISConfiguration
 from nautobot_igp_models.tests.fixtures import (
     create_igp_routing_instances,
+    create_ip_addresses,
     create_isis_configurations,
     create_statuses,
 )
@@ -218,3 +219,116 @@ class ISISConfigurationModelTestCase(TestCase):
         self.assertEqual(isis_config.name, "Updated-ISIS-Config")
         # system_id should remain unchanged
         self.assertEqual(isis_config.system_id, original_system_id)
+
+
+class ISISConfigurationAutoNetTestCase(TestCase):
+    """Test cases for NET re-derivation of auto-NET ISIS configurations."""
+
+    def setUp(self):
+        self.isis_configs = create_isis_configurations()
+        self.igp_instances = create_igp_routing_instances()
+        ISISConfiguration.objects.filter(
+            pk__in=[self.isis_configs["router1"].pk, self.isis_configs["router2"].pk]
+        ).update(auto_net=True)
+
+    def _net(self, key):
+        return ISISConfiguration.objects.get(pk=self.isis_configs[key].pk).system_id
+
+    def test_isis_area_change_rederives_net(self):
+        """Test that changing the instance ISIS area updates auto-NET configurations on commit."""
+        instance = self.igp_instances["isis_router1"]
+        instance.isis_area = "49.0002"
+        with self.captureOnCommitCallbacks(execute=True):
+            instance.save()
+
+        self.assertEqual(self._net("router1"), "49.0002.0010.0000.0001.00")
+
+    def test_router_id_change_rederives_net(self):
+        """Test that pointing the instance at another router ID updates auto-NET configurations."""
+        instance = self.igp_instances["isis_router2"]
+        instance.router_id = create_ip_addresses()["router3"]
+        ISISConfiguration.objects.filter(pk=self.isis_configs["router3"].pk).update(system_id="")
+        with self.captureOnCommitCallbacks(execute=True):
+            instance.save()
+
+        self.assertEqual(self._net("router2"), "49.0001.0010.0000.0003.00")
+
+    def test_opted_out_configuration_is_not_updated(self):
+        """Test that configurations without auto_net keep their NET."""
+        instance = self.igp_instances["isis_router3"]
+        original = self._net("router3")
+        instance.isis_area = "49.0003"
+        with self.captureOnCommitCallbacks(execute=True):
+            instance.save()
+
+        self.assertEqual(self._net("router3"), original)
+
+    def test_unrelated_change_queues_nothing(self):
+        """Test that saving an instance without changing its router ID or ISIS area queues no re-derivation."""
+        instance = self.igp_instances["isis_router1"]
+        instance.description = "Updated"
+        with self.captureOnCommitCallbacks() as callbacks:
+            instance.save()
+
+        self.assertEqual(callbacks, [])
+
+    def test_renumbered_router_id_rederives_net(self):
+        """Test that renumbering the router ID IP address updates auto-NET configurations."""
+        ip_address = create_ip_addresses()["router1"]
+        ip_address.host = "10.0.0.11"
+        with self.captureOnCommitCallbacks(execute=True):
+            ip_address.save()
+
+        self.assertEqual(self._net("router1"), "49.0001.0010.0000.0011.00")
+
+
+class ISISConfigurationLookupTestCase(TestCase):
+    """Test cases for the indexed System ID and router ID lookup columns."""
+
+    def setUp(self):
+        self.isis_configs = create_isis_configurations()
+        self.igp_instances = create_igp_routing_instances()
+
+    def test_net_columns_synced_on_save(self):
+        """Test that saving splits the NET into the System ID and area columns."""
+        isis_config = self.isis_configs["router1"]
+
+        self.assertEqual(isis_config.system_id_number, 0x001000000001)
+        self.assertEqual(isis_config.isis_area_hex, "490001")
+
+    def test_for_system_id(self):
+        """Test lookups by System ID, LAN ID and LSP ID."""
+        for value in ("0010.0000.0001", "0010.0000.0001.00", "0010.0000.0001.00-00"):
+            self.assertEqual(list(ISISConfiguration.objects.for_system_id(value)), [self.isis_configs["router1"]])
+
+    def test_resolve_system_ids(self):
+        """Test mapping many LSP IDs to configurations at once."""
+        resolved = ISISConfiguration.objects.resolve_system_ids(
+            ["0010.0000.0001.00-00", "0010.0000.0002.01-00", "0010.0000.0099.00-00", "not-an-lsp-id"], chunk_size=1
+        )
+
+        self.assertEqual(
+            resolved,
+            {
+                "0010.0000.0001.00-00": self.isis_configs["router1"],
+                "0010.0000.0002.01-00": self.isis_configs["router2"],
+            },
+        )
+
+    def test_for_router_id(self):
+        """Test instance lookups by router ID."""
+        self.assertEqual(
+            set(IGPRoutingInstance.objects.for_router_id("10.0.0.1")),
+            {self.igp_instances["isis_router1"], self.igp_instances["ospf_router1"]},
+        )
+
+    def test_renumbered_router_id_resyncs_instances(self):
+        """Test that renumbering a router ID IP address updates the integer router ID of its instances."""
+        ip_address = create_ip_addresses()["router2"]
+        ip_address.host = "10.0.0.12"
+        ip_address.save()
+
+        self.assertEqual(
+            set(IGPRoutingInstance.objects.for_router_id("10.0.0.12")),
+            {self.igp_instances["isis_router2"], self.igp_instances["ospf_router2"]},
+        )
@@ -1,5 +1,6 @@
 """Tests for OSPFInterfaceConfiguration model."""
 
+from django.core.exceptions import ValidationError
 from django.test import TestCase
 
 from nautobot_igp_models.models import OSPFInterfaceConfiguration
@@ -59,6 +60,7 @@ class OSPFInterfaceConfigurationModelTestCase(TestCase):
         )
 
         self.assertEqual(ospf_int_config.area, "1")
+        self.assertEqual(ospf_int_config.area_number, 1)
 
     def test_ospf_interface_area_formats_large_integer(self):
         """Test OSPF interface with large integer area format."""
@@ -76,6 +78,7 @@ class OSPFInterfaceConfigurationModelTestCase(TestCase):
         )
 
         self.assertEqual(ospf_int_config.area, "4294967295")
+        self.assertEqual(ospf_int_config.area_number, 4294967295)
 
     def test_ospf_interface_unique_together_constraint(self):
         """Test that (ospf_config, interface) must be unique."""
@@ -217,3 +220,44 @@ class OSPFInterfaceConfigurationModelTestCase(TestCase):
         # All test fixtures use backbone area
         for config in ospf_int_configs.values():
             self.assertEqual(config.area, "0.0.0.0")
+
+    def test_ospf_interface_area_number_normalizes_notation(self):
+        """Test that equivalent area notations share one numeric area."""
+        ospf_int_configs = create_ospf_interface_configurations()
+        statuses = create_statuses()
+        interfaces = create_interfaces()
+
+        OSPFInterfaceConfiguration.objects.create(
+            name="Zero-Padded-Area",
+            ospf_config=ospf_int_configs["router1_ge1"].ospf_config,
+            interface=interfaces["router1"]["ge2"],
+            area="00.0.0.0",
+            status=statuses["active"],
+        )
+
+        self.assertEqual(OSPFInterfaceConfiguration.objects.in_area("0").count(), 4)
+
+    def test_ospf_interface_invalid_area(self):
+        """Test that an area that is not a 32-bit area ID fails validation."""
+        ospf_int_config = create_ospf_interface_configurations()["router1_ge1"]
+        ospf_int_config.area = "256.0.0.0"
+
+        with self.assertRaises(ValidationError):
+            ospf_int_config.full_clean()
+
+    def test_ospf_interface_areas_per_device(self):
+        """Test the per-device distinct area count."""
+        ospf_int_configs = create_ospf_interface_configurations()
+        statuses = create_statuses()
+        interfaces = create_interfaces()
+
+        OSPFInterfaceConfiguration.objects.create(
+            name="Area-1",
+            ospf_config=ospf_int_configs["router2_ge1"].ospf_config,
+            interface=interfaces["router2"]["ge2"],
+            area="0.0.0.1",
+            status=statuses["active"],
+        )
+
+        counts = {row["device"]: row["area_count"] for row in OSPFInterfaceConfiguration.objects.areas_per_device()}
+        self.assertEqual(counts, {"router1": 1, "router2": 2, "router3": 1})
@@ -0,0 +1,105 @@
+"""Tests for bulk ISIS NET regeneration."""
+
+from django.test import TestCase
+from nautobot.ipam.models import IPAddress, Prefix
+
+from nautobot_igp_models.models import IGPRoutingInstance, ISISConfiguration
+from nautobot_igp_models.nets import regenerate_nets
+from nautobot_igp_models.tests.fixtures import (
+    create_all_fixtures,
+    create_namespace,
+)
+
+
+class RegenerateNetsTestCase(TestCase):
+    """Test cases for regenerate_nets()."""
+
+    def setUp(self):
+        self.fixtures = create_all_fixtures()
+        self.isis_configs = self.fixtures["isis_configurations"]
+        prefix = Prefix.objects.create(
+            prefix="10.0.100.0/24",
+            namespace=create_namespace(),
+            status=self.fixtures["statuses"]["active"],
+            type="network",
+        )
+        self.new_router_id = IPAddress.objects.create(
+            address="10.0.100.4/32", parent=prefix, status=self.fixtures["statuses"]["active"], type="host"
+        )
+        # 10.0.100.1 truncates to the same System ID as router1's 10.0.0.1
+        self.colliding_router_id = IPAddress.objects.create(
+            address="10.0.100.1/32", parent=prefix, status=self.fixtures["statuses"]["active"], type="host"
+        )
+
+    def _set_router2_router_id(self, router_id):
+        IGPRoutingInstance.objects.filter(pk=self.fixtures["igp_instances"]["isis_router2"].pk).update(
+            router_id=router_id
+        )
+
+    def test_unchanged(self):
+        """Test that NETs already matching their router ID are left alone."""
+        result = regenerate_nets()
+
+        self.assertEqual(result.updated, 0)
+        self.assertEqual(result.unchanged, 3)
+        self.assertEqual(result.collisions, {})
+
+    def test_renumbered_router_id(self):
+        """Test that a changed router ID produces a new NET."""
+        self._set_router2_router_id(self.new_router_id)
+
+        result = regenerate_nets()
+
+        self.assertEqual(result.updated, 1)
+        isis_config = ISISConfiguration.objects.get(pk=self.isis_configs["router2"].pk)
+        self.assertEqual(isis_config.system_id, "49.0001.0010.0000.0004.00")
+        self.assertEqual(isis_config.system_id_number, 0x001000000004)
+
+    def test_dry_run(self):
+        """Test that a dry run reports without writing."""
+        self._set_router2_router_id(self.new_router_id)
+
+        result = regenerate_nets(dry_run=True)
+
+        self.assertEqual(result.updated, 1)
+        self.assertEqual(
+            ISISConfiguration.objects.get(pk=self.isis_configs["router2"].pk).system_id,
+            self.isis_configs["router2"].system_id,
+        )
+
+    def test_truncation_collision(self):
+        """Test that a NET colliding with an existing one is reported and not written."""
+        self._set_router2_router_id(self.colliding_router_id)
+
+        result = regenerate_nets()
+
+        self.assertEqual(result.updated, 0)
+        self.assertEqual(
+            result.collisions,
+            {
+                self.isis_configs["router1"].system_id: sorted(
+                    [self.isis_configs["router1"].pk, self.isis_configs["router2"].pk], key=str
+                )
+            },
+        )
+        self.assertEqual(
+            ISISConfiguration.objects.get(pk=self.isis_configs["router2"].pk).system_id,
+            self.isis_configs["router2"].system_id,
+        )
+
+    def test_missing_only(self):
+        """Test that --missing-only fills in blank NETs without touching stale ones."""
+        self._set_router2_router_id(self.new_router_id)
+        ISISConfiguration.objects.filter(pk=self.isis_configs["router3"].pk).update(system_id="")
+
+        result = regenerate_nets(missing_only=True)
+
+        self.assertEqual(result.updated, 1)
+        self.assertEqual(
+            ISISConfiguration.objects.get(pk=self.isis_configs["router3"].pk).system_id,
+            self.isis_configs["router3"].system_id,
+        )
+        self.assertEqual(
+            ISISConfiguration.objects.get(pk=self.isis_configs["router2"].pk).system_id,
+            self.isis_configs["router2"].system_id,
+        )
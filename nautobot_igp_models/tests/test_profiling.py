@@ -0,0 +1,95 @@
+"""Tests for export template render profiling."""
+
+import io
+import os
+import tempfile
+import zipfile
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from nautobot.extras.models import ExportTemplate
+
+from nautobot_igp_models.models import ISISConfiguration
+from nautobot_igp_models.profiling import profile_call
+from nautobot_igp_models.tests.fixtures import create_all_fixtures
+
+User = get_user_model()
+
+
+def render_names():
+    """Render ISIS configuration names, issuing at least one query."""
+    return ",".join(ISISConfiguration.objects.values_list("name", flat=True))
+
+
+class ProfileCallTestCase(TestCase):
+    """Test cases for profile_call()."""
+
+    def setUp(self):
+        create_all_fixtures()
+
+    def test_profile_call(self):
+        """Test that the result, SQL timings and call stacks are captured."""
+        profile = profile_call(render_names)
+
+        self.assertIn("ISIS", profile.result)
+        self.assertGreaterEqual(len(profile.queries), 1)
+        self.assertLessEqual(profile.query_seconds, profile.elapsed)
+        self.assertIn("SELECT", profile.sql_report(top=1))
+        self.assertEqual(len(profile.slowest_queries(top=1)), 1)
+        stacks = dict(line.rsplit(" ", 1) for line in profile.collapsed_stacks().splitlines())
+        self.assertTrue(any(stack.startswith("render_names (test_profiling.py:") for stack in stacks))
+        self.assertTrue(all(int(microseconds) > 0 for microseconds in stacks.values()))
+
+    def test_profile_igp_render_command(self):
+        """Test that the management command writes the collapsed stacks and SQL report."""
+        ExportTemplate.objects.create(
+            name="Names",
+            content_type=ContentType.objects.get_for_model(ISISConfiguration),
+            template_code="{% for config in queryset %}{{ config.name }}\n{% endfor %}",
+        )
+        with tempfile.TemporaryDirectory() as output_dir:
+            call_command("profile_igp_render", "isis", "Names", "--output-dir", output_dir, stdout=StringIO())
+
+            self.assertEqual(sorted(os.listdir(output_dir)), ["isis-names.collapsed", "isis-names.sql.txt"])
+            with open(os.path.join(output_dir, "isis-names.sql.txt"), encoding="utf-8") as report_file:
+                self.assertIn("SELECT", report_file.read())
+
+
+@override_settings(STRICT_FILTERING=True)
+class ProfiledExportViewTestCase(TestCase):
+    """Test cases for the profile=1 switch of the export views."""
+
+    def setUp(self):
+        self.fixtures = create_all_fixtures()
+        ExportTemplate.objects.create(
+            name="Names",
+            content_type=ContentType.objects.get_for_model(ISISConfiguration),
+            template_code="{% for config in queryset %}{{ config.name }}\n{% endfor %}",
+        )
+        self.client.force_login(User.objects.create(username="admin", is_superuser=True))
+
+    def test_profiled_export(self):
+        """Test that a profiled export renders the real rows and returns them with the profile files."""
+        url = reverse("plugins:nautobot_igp_models:isisconfiguration_list")
+
+        response = self.client.get(url, {"export": "Names", "profile": "1"})
+
+        self.assertEqual(response["Content-Type"], "application/zip")
+        with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+            self.assertEqual(
+                sorted(archive.namelist()),
+                [
+                    "isisconfiguration-names.collapsed",
+                    "isisconfiguration-names.export",
+                    "isisconfiguration-names.sql.txt",
+                ],
+            )
+            rendered = archive.read("isisconfiguration-names.export").decode()
+        self.assertEqual(
+            sorted(filter(None, rendered.splitlines())),
+            sorted(config.name for config in self.fixtures["isis_configurations"].values()),
+        )
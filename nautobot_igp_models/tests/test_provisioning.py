@@ -0,0 +1,87 @@
+"""Tests for bulk provisioning of interface configurations."""
+
+from django.test import TestCase
+from nautobot.dcim.models import Interface
+
+from nautobot_igp_models.models import ISISInterfaceConfiguration, OSPFInterfaceConfiguration
+from nautobot_igp_models.provisioning import area_for_interface, compile_area_rules, provision_interface_configs
+from nautobot_igp_models.tests.fixtures import create_all_fixtures, create_cables
+
+
+class AreaRuleTestCase(TestCase):
+    """Test cases for the OSPF area rules."""
+
+    def test_first_match_wins(self):
+        """Test that rules are tried in order and the default applies when none matches."""
+        rules = compile_area_rules({"^GigabitEthernet1$": "0.0.0.1", "^Gigabit": "0.0.0.2"})
+
+        self.assertEqual(area_for_interface(rules, "GigabitEthernet1"), "0.0.0.1")
+        self.assertEqual(area_for_interface(rules, "GigabitEthernet2"), "0.0.0.2")
+        self.assertEqual(area_for_interface(rules, "Ethernet3", default="0.0.0.9"), "0.0.0.9")
+
+    def test_invalid_rules(self):
+        """Test that invalid patterns and areas are rejected."""
+        with self.assertRaises(ValueError):
+            compile_area_rules({"(": "0.0.0.1"})
+        with self.assertRaises(ValueError):
+            compile_area_rules({"^Gi": "not-an-area"})
+
+
+class ProvisionInterfaceConfigsTestCase(TestCase):
+    """Test cases for provision_interface_configs()."""
+
+    def setUp(self):
+        self.fixtures = create_all_fixtures()
+        create_cables()
+        self.instances = [
+            self.fixtures["igp_instances"]["isis_router2"],
+            self.fixtures["igp_instances"]["ospf_router2"],
+        ]
+
+    def test_provision(self):
+        """Test that the uncovered cabled interface gets deterministic ISIS and OSPF configurations."""
+        result = provision_interface_configs(self.instances, area_rules={"Ethernet2$": "0.0.0.2"}, circuit_type="L2")
+
+        self.assertEqual(
+            sorted(row["name"] for row in result["rows"]),
+            ["ISIS-router2-GigabitEthernet2", "OSPF-router2-GigabitEthernet2"],
+        )
+        self.assertEqual(result["existing"], 2)
+        isis_config = ISISInterfaceConfiguration.objects.get(name="ISIS-router2-GigabitEthernet2")
+        self.assertEqual(isis_config.circuit_type, "L2")
+        self.assertEqual(isis_config.device.name, "router2")
+        ospf_config = OSPFInterfaceConfiguration.objects.get(name="OSPF-router2-GigabitEthernet2")
+        self.assertEqual((ospf_config.area, ospf_config.area_number), ("0.0.0.2", 2))
+
+    def test_rerun(self):
+        """Test that a rerun creates nothing."""
+        provision_interface_configs(self.instances)
+
+        result = provision_interface_configs(self.instances)
+
+        self.assertEqual(result["rows"], [])
+        self.assertEqual(result["existing"], 4)
+
+    def test_excluded_interfaces(self):
+        """Test that management-only and disabled interfaces are not provisioned."""
+        Interface.objects.filter(device__name="router2", name="GigabitEthernet2").update(mgmt_only=True)
+        self.assertEqual(provision_interface_configs(self.instances)["rows"], [])
+
+        Interface.objects.filter(device__name="router2", name="GigabitEthernet2").update(mgmt_only=False, enabled=False)
+        self.assertEqual(provision_interface_configs(self.instances)["rows"], [])
+
+    def test_dry_run(self):
+        """Test that a dry run reports the rows without creating them."""
+        result = provision_interface_configs(self.instances, dry_run=True)
+
+        self.assertEqual(len(result["rows"]), 2)
+        self.assertFalse(ISISInterfaceConfiguration.objects.filter(name="ISIS-router2-GigabitEthernet2").exists())
+
+    def test_instance_without_configuration(self):
+        """Test that instances without an ISIS/OSPF configuration are skipped."""
+        self.fixtures["ospf_configurations"]["router2"].delete()
+
+        result = provision_interface_configs(self.instances)
+
+        self.assertEqual(result["skipped"], [self.fixtures["igp_instances"]["ospf_router2"]])
+        self.assertEqual([row["protocol"] for row in result["rows"]], ["ISIS"])
@@ -0,0 +1,92 @@
+"""Tests for versioned IGP topology snapshots."""
+
+from django.test import TestCase, override_settings
+
+from nautobot_igp_models.models import ISISInterfaceConfiguration, OSPFConfiguration, OSPFInterfaceConfiguration
+from nautobot_igp_models.snapshots import (
+    apply_delta,
+    capture_state,
+    compute_delta,
+    diff_snapshots,
+    reconstruct,
+    take_snapshot,
+)
+from nautobot_igp_models.tests.fixtures import create_all_fixtures, create_cables
+from nautobot_igp_models.topology import iter_edge_batches
+
+
+class TopologySnapshotTestCase(TestCase):
+    """Test cases for capturing, reconstructing and comparing snapshots."""
+
+    def setUp(self):
+        self.fixtures = create_all_fixtures()
+        self.cables = create_cables()
+        self.interface_config = ISISInterfaceConfiguration.objects.get(interface__device__name="router1")
+
+    def test_delta_round_trip(self):
+        """Test that applying a computed delta to the old state yields the new state."""
+        old_state = capture_state()
+        self.interface_config.delete()
+        new_state = capture_state()
+
+        delta = compute_delta(old_state, new_state)
+
+        self.assertIn(str(self.interface_config.pk), delta["isis_interface_configurations"]["delete"])
+        self.assertEqual(apply_delta(old_state, delta), new_state)
+
+    def test_instances_sharing_a_cable(self):
+        """Test that the adjacencies of two OSPF processes over one cable are all captured."""
+        for router in ("router1", "router2"):
+            ospf_config = OSPFConfiguration.objects.create(
+                name=f"OSPF-2-{router}", instance=self.fixtures["igp_instances"][f"ospf_{router}"], process_id=2
+            )
+            OSPFInterfaceConfiguration.objects.create(
+                name=f"OSPF-2-{router}-GE1",
+                ospf_config=ospf_config,
+                interface=self.fixtures["interfaces"][router]["ge1"],
+                area="0.0.0.0",
+            )
+        cable_id = str(self.cables["router1_router2"].pk)
+        rows = [row for batch in iter_edge_batches(OSPFInterfaceConfiguration.objects.all()) for row in batch]
+        cable_rows = [row for row in rows if row["cable_id"] == cable_id]
+
+        state = capture_state()
+
+        self.assertGreater(len(cable_rows), 1)
+        ospf_keys = [key for key in state["adjacencies"] if key.startswith(f"OSPF:{cable_id}:")]
+        self.assertEqual(len(ospf_keys), len(cable_rows))
+
+    def test_unchanged_topology_stores_empty_delta(self):
+        """Test that a snapshot of an unchanged topology stores no rows."""
+        first = take_snapshot()
+        second = take_snapshot()
+
+        self.assertTrue(first.checkpoint)
+        self.assertFalse(second.checkpoint)
+        self.assertEqual(second.sequence, first.sequence + 1)
+        self.assertEqual(second.change_count, 0)
+        self.assertEqual(second.row_count, first.row_count)
+
+    def test_reconstruct_and_diff(self):
+        """Test that earlier snapshots are reconstructed and compared after later changes."""
+        original_state = capture_state()
+        first = take_snapshot(original_state)
+        self.interface_config.metric = 70
+        self.interface_config.save()
+        second = take_snapshot()
+
+        self.assertEqual(reconstruct(first), original_state)
+        self.assertEqual(second.change_count, 2)  # the interface configuration and its adjacency
+        diff = diff_snapshots(first, second)
+        key = str(self.interface_config.pk)
+        self.assertEqual(diff["isis_interface_configurations"]["changed"][key], {"metric": [10, 70]})
+        self.assertEqual(len(diff["adjacencies"]["changed"]), 1)
+        self.assertEqual(diff_snapshots(second, second), {})
+
+    @override_settings(PLUGINS_CONFIG={"nautobot_igp_models": {"snapshot_checkpoint_interval": 2}})
+    def test_checkpoint_interval(self):
+        """Test that a full checkpoint is stored every snapshot_checkpoint_interval snapshots."""
+        snapshots = [take_snapshot() for _ in range(4)]
+
+        self.assertEqual([snapshot.checkpoint for snapshot in snapshots], [True, False, True, False])
+        self.assertEqual(reconstruct(snapshots[3]), reconstruct(snapshots[0]))
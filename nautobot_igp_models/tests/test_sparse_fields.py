@@ -0,0 +1,77 @@
+"""Tests for the sparse fieldsets of the API endpoints."""
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from nautobot.users.models import Token
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from nautobot_igp_models.tests.fixtures import create_all_fixtures
+
+User = get_user_model()
+
+
+class SparseFieldsAPITestCase(TestCase):
+    """Test the fields and exclude query parameters."""
+
+    def setUp(self):
+        self.fixtures = create_all_fixtures()
+        self.user = User.objects.create(username="testuser", is_superuser=True)
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {Token.objects.create(user=self.user).key}")
+        self.url = reverse("plugins-api:nautobot_igp_models-api:ospfinterfaceconfiguration-list")
+
+    def test_fields(self):
+        """Test that only the requested columns are rendered and selected, without joins."""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(f"{self.url}?fields=cost")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 2)
+        self.assertEqual({frozenset(result) for result in response.data["results"]}, {frozenset({"id", "cost"})})
+        table = "nautobot_igp_models_ospfinterfaceconfiguration"
+        selects = [query["sql"] for query in queries.captured_queries if f'FROM "{table}"' in query["sql"]]
+        self.assertTrue(selects)
+        for sql in selects:
+            self.assertNotIn("dcim_interface", sql)
+            self.assertNotIn("area_number", sql)
+
+    def test_exclude(self):
+        """Test that excluded fields are not rendered."""
+        response = self.client.get(f"{self.url}?exclude=interface,tags,display")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        result = response.data["results"][0]
+        self.assertNotIn("interface", result)
+        self.assertNotIn("tags", result)
+        self.assertIn("ospf_config", result)
+
+    def test_detail_with_related_field(self):
+        """Test a detail request rendering a related object among the selected fields."""
+        interface_config = self.fixtures["ospf_interface_configurations"]["router1_ge1"]
+        url = reverse(
+            "plugins-api:nautobot_igp_models-api:ospfinterfaceconfiguration-detail", kwargs={"pk": interface_config.pk}
+        )
+
+        response = self.client.get(f"{url}?fields=interface&fields=area")
+
+        self.assertEqual(set(response.data), {"id", "interface", "area"})
+        self.assertEqual(response.data["interface"]["id"], interface_config.interface_id)
+
+    def test_unknown_field(self):
+        """Test that unknown field names are rejected."""
+        response = self.client.get(f"{self.url}?fields=cost,bandwidth")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_full_representation_by_default(self):
+        """Test that requests without the parameters render every field."""
+        url = reverse("plugins-api:nautobot_igp_models-api:isisconfiguration-list")
+
+        response = self.client.get(url)
+
+        self.assertIn("display", response.data["results"][0])
+        self.assertIn("instance", response.data["results"][0])
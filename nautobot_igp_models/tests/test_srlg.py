@@ -0,0 +1,61 @@
+"""Tests for shared risk link group failure simulation."""
+
+from unittest import mock
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from nautobot.extras.models import ConfigContext, Tag
+
+from nautobot_igp_models import srlg
+from nautobot_igp_models.models import ISISInterfaceConfiguration
+from nautobot_igp_models.tests.fixtures import create_all_fixtures, create_cables
+
+
+@override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+class SRLGFailureImpactTestCase(TestCase):
+    """Test cases for srlg_failure_impact()."""
+
+    def setUp(self):
+        cache.clear()
+        self.fixtures = create_all_fixtures()
+        create_cables()
+        self.interface_config = self.fixtures["isis_interface_configurations"]["router1_ge1"]
+        tag = Tag.objects.create(name="srlg:conduit-17")
+        tag.content_types.add(ContentType.objects.get_for_model(ISISInterfaceConfiguration))
+        self.interface_config.tags.add(tag)
+
+    def test_group_impact(self):
+        """Test that the links of a tagged group are failed together."""
+        rows = srlg.srlg_failure_impact("ISIS", workers=1)
+
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["srlg"], "conduit-17")
+        self.assertEqual(rows[0]["link_count"], 1)
+        self.assertEqual(rows[0]["lost_pairs"], 2)
+
+    def test_cached_by_graph_fingerprint(self):
+        """Test that edits outside the graph reuse the cached impacts and effective metric changes do not."""
+        self.interface_config.metric = None
+        self.interface_config.save()
+        expected = srlg.srlg_failure_impact("ISIS", workers=1)
+
+        device = self.interface_config.interface.device
+        device.name = "router1-renamed"
+        device.save()
+        with mock.patch.object(srlg, "simulate_failures", wraps=srlg.simulate_failures) as simulate:
+            rows = srlg.srlg_failure_impact("ISIS", workers=1)
+            simulate.assert_not_called()
+            self.assertEqual(rows[0]["lost_pairs"], expected[0]["lost_pairs"])
+            self.assertIn("router1-renamed", rows[0]["links"])
+
+            ConfigContext.objects.create(name="ISIS metric", data={"igp": {"isis": {"metric": 50}}})
+            srlg.srlg_failure_impact("ISIS", workers=1)
+            simulate.assert_called_once()
+
+            tag = Tag.objects.create(name="srlg:duct-3")
+            tag.content_types.add(ContentType.objects.get_for_model(ISISInterfaceConfiguration))
+            self.interface_config.tags.add(tag)
+            rows = srlg.srlg_failure_impact("ISIS", workers=1)
+            self.assertEqual(simulate.call_count, 2)
+            self.assertEqual({row["srlg"] for row in rows}, {"conduit-17", "duct-3"})
@@ -0,0 +1,59 @@
+"""Tests for the adjacency timer mismatch check."""
+
+import json
+
+from django.test import TestCase
+
+from nautobot_igp_models.models import ISISConfiguration
+from nautobot_igp_models.tests.fixtures import (
+    create_all_fixtures,
+    create_cables,
+)
+from nautobot_igp_models.timers import MISMATCH_COLUMNS, find_timer_mismatches
+from nautobot_igp_models.utils import render_rows
+
+
+class TimerMismatchTestCase(TestCase):
+    """Test cases for find_timer_mismatches()."""
+
+    def setUp(self):
+        self.fixtures = create_all_fixtures()
+        create_cables()
+
+    def test_matching_timers(self):
+        """Test that the default fixtures have no timer mismatches."""
+        self.assertEqual(find_timer_mismatches(), [])
+
+    def test_isis_config_default_mismatch(self):
+        """Test that an ISIS configuration default is inherited and compared across the cable."""
+        ISISConfiguration.objects.filter(pk=self.fixtures["isis_configurations"]["router2"].pk).update(
+            default_hello_interval=5
+        )
+
+        rows = find_timer_mismatches()
+
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["protocol"], "ISIS")
+        self.assertEqual(rows[0]["timer"], "hello_interval")
+        self.assertEqual({rows[0]["a_value"], rows[0]["b_value"]}, {5, 10})
+
+    def test_device_config_context_mismatch(self):
+        """Test that a timer set in a device config context is compared across the cable."""
+        router1 = self.fixtures["devices"]["router1"]
+        router1.local_config_context_data = {"igp": {"ospf": {"dead_interval": 60}}}
+        router1.save()
+
+        rows = find_timer_mismatches()
+
+        self.assertEqual([(row["protocol"], row["timer"]) for row in rows], [("OSPF", "dead_interval")])
+
+    def test_render_rows(self):
+        """Test CSV and JSON rendering of mismatch rows."""
+        ISISConfiguration.objects.filter(pk=self.fixtures["isis_configurations"]["router2"].pk).update(
+            default_hello_interval=5
+        )
+        rows = find_timer_mismatches()
+
+        csv_text = render_rows(rows, MISMATCH_COLUMNS)
+        self.assertTrue(csv_text.startswith(",".join(MISMATCH_COLUMNS)))
+        self.assertEqual(json.loads(render_rows(rows, MISMATCH_COLUMNS, "json")), rows)
@@ -0,0 +1,62 @@
+"""Tests for the topology node/edge export."""
+
+import importlib.util
+import io
+import unittest
+
+from django.test import TestCase
+
+from nautobot_igp_models.arrow_export import write_table
+from nautobot_igp_models.models import IGPRoutingInstance, ISISInterfaceConfiguration, OSPFInterfaceConfiguration
+from nautobot_igp_models.tests.fixtures import create_all_fixtures, create_cables
+from nautobot_igp_models.topology import EDGE_COLUMNS, NODE_COLUMNS, iter_edge_batches, iter_node_batches
+
+
+class TopologyRowsTestCase(TestCase):
+    """Test cases for the node and edge row generators."""
+
+    def setUp(self):
+        create_all_fixtures()
+        create_cables()
+
+    def test_nodes(self):
+        """Test that every routing instance is a node with its areas and NETs."""
+        rows = [row for batch in iter_node_batches(IGPRoutingInstance.objects.all(), batch_size=4) for row in batch]
+
+        self.assertEqual(len(rows), IGPRoutingInstance.objects.count())
+        self.assertTrue(all(list(row) == NODE_COLUMNS for row in rows))
+        nodes = {row["name"]: row for row in rows}
+        self.assertEqual(nodes["ISIS-router1"]["areas"], ["49.0001"])
+        self.assertEqual(nodes["ISIS-router1"]["router_id"], "10.0.0.1")
+        self.assertEqual(len(nodes["ISIS-router1"]["nets"]), 1)
+        self.assertEqual(nodes["OSPF-router1"]["areas"], ["0.0.0.0"])
+        self.assertEqual(nodes["OSPF-router1"]["nets"], [])
+
+    def test_edges(self):
+        """Test that cabled adjacencies become edges carrying the effective metric/cost of both ends."""
+        ISISInterfaceConfiguration.objects.filter(interface__device__name="router1").update(metric=50)
+
+        isis_rows = [row for batch in iter_edge_batches(ISISInterfaceConfiguration.objects.all()) for row in batch]
+        ospf_rows = [row for batch in iter_edge_batches(OSPFInterfaceConfiguration.objects.all()) for row in batch]
+
+        self.assertEqual(len(isis_rows), 1)
+        self.assertEqual(list(isis_rows[0]), EDGE_COLUMNS)
+        metrics = {
+            isis_rows[0]["a_device"]: isis_rows[0]["a_metric"],
+            isis_rows[0]["b_device"]: isis_rows[0]["b_metric"],
+        }
+        self.assertEqual(metrics["router1"], 50)
+        self.assertEqual(isis_rows[0]["a_area"], "49.0001")
+        self.assertEqual(len(ospf_rows), 1)
+        self.assertEqual((ospf_rows[0]["a_metric"], ospf_rows[0]["a_area"]), (1, "0.0.0.0"))
+        self.assertIsNone(ospf_rows[0]["a_circuit_type"])
+
+    @unittest.skipUnless(importlib.util.find_spec("pyarrow"), "pyarrow is not installed")
+    def test_arrow_round_trip(self):
+        """Test that the written Arrow streams read back with all rows."""
+        import pyarrow  # pylint: disable=import-outside-toplevel
+
+        for table, expected in (("nodes", IGPRoutingInstance.objects.count()), ("edges", 2)):
+            sink = io.BytesIO()
+            self.assertEqual(write_table(table, sink, batch_size=1), expected)
+            self.assertEqual(pyarrow.ipc.open_stream(sink.getvalue()).read_all().num_rows, expected)
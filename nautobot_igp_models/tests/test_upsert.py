@@ -0,0 +1,198 @@
+"""Tests for the bulk upsert API action."""
+
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from nautobot.users.models import ObjectPermission, Token
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from nautobot_igp_models.models import IGPRoutingInstance, OSPFConfiguration, OSPFInterfaceConfiguration
+from nautobot_igp_models.tests.fixtures import create_all_fixtures
+
+User = get_user_model()
+
+
+class BulkUpsertAPITestCase(TestCase):
+    """Test the upsert action of the API viewsets."""
+
+    def setUp(self):
+        self.fixtures = create_all_fixtures()
+        self.user = User.objects.create(username="testuser", is_superuser=True)
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {Token.objects.create(user=self.user).key}")
+        self.url = reverse("plugins-api:nautobot_igp_models-api:ospfinterfaceconfiguration-upsert")
+        self.ospf_config = self.fixtures["ospf_configurations"]["router1"]
+        self.interfaces = self.fixtures["interfaces"]["router1"]
+
+    def _payload(self):
+        return [
+            {"ospf_config": str(self.ospf_config.pk), "interface": str(self.interfaces["ge1"].pk), "cost": 5},
+            {
+                "name": "OSPF-R1-GE2",
+                "ospf_config": str(self.ospf_config.pk),
+                "interface": {"id": str(self.interfaces["ge2"].pk)},
+                "area": "0.0.0.1",
+            },
+        ]
+
+    def test_create_and_update(self):
+        """Test that existing objects are updated, new ones created, and each result reported."""
+        response = self.client.post(self.url, self._payload(), format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual((response.data["created"], response.data["updated"]), (1, 1))
+        self.assertEqual([result["result"] for result in response.data["results"]], ["updated", "created"])
+        updated = OSPFInterfaceConfiguration.objects.get(
+            pk=self.fixtures["ospf_interface_configurations"]["router1_ge1"].pk
+        )
+        self.assertEqual(updated.cost, 5)
+        created = OSPFInterfaceConfiguration.objects.get(pk=response.data["results"][1]["id"])
+        self.assertEqual((created.area, created.area_number), ("0.0.0.1", 1))
+
+    def test_rerun_is_unchanged(self):
+        """Test that upserting the same payload again changes nothing."""
+        self.client.post(self.url, self._payload(), format="json")
+
+        response = self.client.post(self.url, self._payload(), format="json")
+
+        self.assertEqual([result["result"] for result in response.data["results"]], ["unchanged", "unchanged"])
+
+    def test_invalid_item_writes_nothing(self):
+        """Test that one invalid object rejects the whole payload."""
+        payload = self._payload()
+        payload[1]["area"] = "not-an-area"
+
+        response = self.client.post(self.url, payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual([result["result"] for result in response.data["results"]], ["skipped", "invalid"])
+        self.assertIn("area", response.data["results"][1]["errors"])
+        self.assertFalse(OSPFInterfaceConfiguration.objects.filter(cost=5).exists())
+
+    def test_duplicate_natural_key(self):
+        """Test that two objects with the same natural key are rejected."""
+        payload = self._payload()
+        payload.append(dict(payload[0]))
+
+        response = self.client.post(self.url, payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("Duplicate", str(response.data["results"][2]["errors"]))
+
+    def test_default_key_value(self):
+        """Test that a natural key field left out of the payload takes the model default (OSPF process 1)."""
+        url = reverse("plugins-api:nautobot_igp_models-api:ospfconfiguration-upsert")
+        instance = self.fixtures["igp_instances"]["ospf_router1"]
+
+        response = self.client.post(url, [{"instance": str(instance.pk), "default_cost": 20}], format="json")
+
+        self.assertEqual(response.data["results"][0]["result"], "updated")
+        self.assertEqual(OSPFConfiguration.objects.get(instance=instance, process_id=1).default_cost, 20)
+
+    def test_routing_instance_natural_key(self):
+        """Test upserting routing instances on (device, protocol, vrf)."""
+        url = reverse("plugins-api:nautobot_igp_models-api:igproutinginstance-upsert")
+        instance = self.fixtures["igp_instances"]["isis_router1"]
+
+        response = self.client.post(
+            url,
+            [
+                {
+                    "device": str(instance.device_id),
+                    "protocol": "ISIS",
+                    "vrf": str(instance.vrf_id),
+                    "isis_area": "49.0009",
+                }
+            ],
+            format="json",
+        )
+
+        self.assertEqual(response.data["results"][0], {"index": 0, "result": "updated", "id": str(instance.pk)})
+        self.assertEqual(IGPRoutingInstance.objects.get(pk=instance.pk).isis_area, "49.0009")
+
+    def test_requires_permissions(self):
+        """Test that users without add and change permissions are refused."""
+        user = User.objects.create(username="viewer")
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {Token.objects.create(user=user).key}")
+
+        response = self.client.post(self.url, self._payload(), format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_queries_do_not_grow_with_items(self):
+        """Test that related objects are resolved once per foreign key and items are validated without queries."""
+        interface_configs = self.fixtures["ospf_interface_configurations"]
+        payload = [
+            {"ospf_config": str(config.ospf_config_id), "interface": str(config.interface_id), "cost": 7}
+            for config in (interface_configs["router1_ge1"], interface_configs["router2_ge1"])
+        ]
+
+        with CaptureQueriesContext(connection) as single:
+            self.client.post(self.url, payload[:1], format="json")
+        for item in payload:
+            item["cost"] = 8
+        with CaptureQueriesContext(connection) as full:
+            response = self.client.post(self.url, payload, format="json")
+
+        self.assertEqual(response.data["updated"], 2)
+        self.assertEqual(len(full.captured_queries), len(single.captured_queries))
+
+    def _constrained_user(self, constraints):
+        user = User.objects.create(username="constrained")
+        permission = ObjectPermission.objects.create(
+            name="Constrained OSPF interfaces", actions=["view", "add", "change"], constraints=constraints
+        )
+        permission.object_types.add(ContentType.objects.get_for_model(OSPFInterfaceConfiguration))
+        permission.users.add(user)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {Token.objects.create(user=user).key}")
+
+    def test_existing_object_outside_change_constraints(self):
+        """Test that an existing object the user may not change is reported as forbidden, not created again."""
+        self._constrained_user({"cost__gte": 1000})
+
+        response = self.client.post(self.url, self._payload(), format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual([result["result"] for result in response.data["results"]], ["forbidden", "skipped"])
+        self.assertFalse(OSPFInterfaceConfiguration.objects.filter(interface=self.interfaces["ge2"]).exists())
+
+    def test_written_object_outside_constraints(self):
+        """Test that the transaction is rolled back when a written object leaves the user's constraints."""
+        self._constrained_user({"cost__lt": 100})
+        payload = self._payload()
+        payload[0]["cost"] = 500
+        payload[1]["cost"] = 10
+
+        response = self.client.post(self.url, payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual([result["result"] for result in response.data["results"]], ["forbidden", "skipped"])
+        self.assertFalse(OSPFInterfaceConfiguration.objects.filter(cost=500).exists())
+        self.assertFalse(OSPFInterfaceConfiguration.objects.filter(interface=self.interfaces["ge2"]).exists())
+
+    def test_integrity_error(self):
+        """Test that a unique constraint violated within the payload is a 400 naming the offending object."""
+        url = reverse("plugins-api:nautobot_igp_models-api:igproutinginstance-upsert")
+        router3 = self.fixtures["devices"]["router3"]
+        payload = [
+            {
+                "name": "OSPF-router3",
+                "device": str(router3.pk),
+                "protocol": "OSPF",
+                "vrf": str(self.fixtures["vrfs"][vrf].pk),
+                "status": str(self.fixtures["statuses"]["active"].pk),
+            }
+            for vrf in ("global", "management")
+        ]
+
+        response = self.client.post(url, payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual([result["result"] for result in response.data["results"]], ["skipped", "invalid"])
+        self.assertEqual(list(response.data["results"][1]["errors"]), ["name"])
+        self.assertNotIn("duplicate key", str(response.data))
+        self.assertFalse(IGPRoutingInstance.objects.filter(name="OSPF-router3").exists())
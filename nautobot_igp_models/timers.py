@@ -0,0 +1,62 @@
+"""Adjacency timer analysis based on effective (inherited) interface configuration."""
+
+from nautobot_igp_models.inheritance import resolve_effective_configs, with_inheritance_related
+from nautobot_igp_models.topology import PROTOCOL_MODELS, cabled, iter_cabled_pairs
+
+# Timers that must match on both ends of an adjacency
+TIMER_FIELDS = ("hello_interval", "dead_interval", "hello_multiplier")
+
+MISMATCH_COLUMNS = [
+    "protocol",
+    "timer",
+    "a_device",
+    "a_interface",
+    "a_value",
+    "b_device",
+    "b_interface",
+    "b_value",
+]
+
+
+def cabled_effective_configs(model, queryset=None):
+    """Load all cabled interface configurations of ``model`` and resolve their effective config in one pass.
+
+    Args:
+        model: ISISInterfaceConfiguration or OSPFInterfaceConfiguration.
+        queryset: Interface configurations of ``model`` to consider (default: all).
+
+    Returns:
+        tuple: (interface configurations ordered by cable, dict of pk -> effective config)
+    """
+    if queryset is None:
+        queryset = model.objects.all()
+    interface_configs = list(with_inheritance_related(cabled(queryset)))
+    return interface_configs, resolve_effective_configs(interface_configs)
+
+
+def find_timer_mismatches():
+    """Compare effective hello/dead timers on both ends of every cabled IGP adjacency.
+
+    Returns:
+        list: One dict per mismatched timer per adjacency, with the MISMATCH_COLUMNS keys.
+    """
+    mismatches = []
+    for protocol, model in PROTOCOL_MODELS.items():
+        interface_configs, effective = cabled_effective_configs(model)
+        for side_a, side_b in iter_cabled_pairs(interface_configs):
+            config_a, config_b = effective[side_a.pk], effective[side_b.pk]
+            for timer in TIMER_FIELDS:
+                if config_a.get(timer) != config_b.get(timer):
+                    mismatches.append(
+                        {
+                            "protocol": protocol,
+                            "timer": timer,
+                            "a_device": side_a.interface.device.name,
+                            "a_interface": side_a.interface.name,
+                            "a_value": config_a.get(timer),
+                            "b_device": side_b.interface.device.name,
+                            "b_interface": side_b.interface.name,
+                            "b_value": config_b.get(timer),
+                        }
+                    )
+    return mismatches
@@ -0,0 +1,181 @@
+"""Helpers for building the IGP topology from cabled interface configurations."""
+
+from itertools import combinations, groupby
+from operator import attrgetter
+
+from django.db.models import F
+
+from nautobot_igp_models.inheritance import resolve_effective_configs, with_inheritance_related
+from nautobot_igp_models.models import ISISConfiguration, ISISInterfaceConfiguration, OSPFInterfaceConfiguration
+
+
+def cabled(queryset):
+    """Restrict an interface configuration queryset to cabled interfaces, ordered by cable.
+
+    Each row is annotated with ``cable_id`` so that pairs can be formed without touching the interface.
+    """
+    return (
+        queryset.filter(interface__cable__isnull=False)
+        .annotate(cable_id=F("interface__cable"))
+        .order_by("cable_id", "pk")
+    )
+
+
+def iter_cabled_pairs(interface_configs):
+    """Yield (a, b) for every two interface configurations on opposite ends of the same cable.
+
+    Args:
+        interface_configs: Interface configurations ordered by ``cable_id``, as returned by ``cabled()``.
+    """
+    for _, group in groupby(interface_configs, key=attrgetter("cable_id")):
+        for side_a, side_b in combinations(list(group), 2):
+            if side_a.interface_id != side_b.interface_id:
+                yield side_a, side_b
+
+
+DEFAULT_BATCH_SIZE = 2000
+
+PROTOCOL_MODELS = {
+    "ISIS": ISISInterfaceConfiguration,
+    "OSPF": OSPFInterfaceConfiguration,
+}
+
+NODE_COLUMNS = [
+    "instance_id",
+    "name",
+    "device",
+    "protocol",
+    "vrf",
+    "router_id",
+    "router_id_number",
+    "areas",
+    "nets",
+]
+
+EDGE_SIDE_COLUMNS = [
+    "config_id",
+    "instance_id",
+    "device",
+    "interface",
+    "metric",
+    "area",
+    "circuit_type",
+    "network_type",
+]
+
+EDGE_COLUMNS = ["protocol", "cable_id"] + [f"{side}_{column}" for side in "ab" for column in EDGE_SIDE_COLUMNS]
+
+
+def iter_batches(iterable, batch_size):
+    """Yield lists of up to ``batch_size`` items from ``iterable``."""
+    batch = []
+    for item in iterable:
+        batch.append(item)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _node_rows(instances):
+    instance_pks = [instance.pk for instance in instances]
+    nets, ospf_areas = {}, {}
+    for instance_pk, net in (
+        ISISConfiguration.objects.filter(instance__in=instance_pks)
+        .exclude(system_id="")
+        .values_list("instance_id", "system_id")
+        .order_by("system_id")
+    ):
+        nets.setdefault(instance_pk, []).append(net)
+    for instance_pk, area in (
+        OSPFInterfaceConfiguration.objects.filter(ospf_config__instance__in=instance_pks)
+        .values_list("ospf_config__instance_id", "area")
+        .order_by("area_number")
+        .distinct()
+    ):
+        ospf_areas.setdefault(instance_pk, []).append(area)
+
+    return [
+        {
+            "instance_id": str(instance.pk),
+            "name": instance.name,
+            "device": instance.device.name,
+            "protocol": instance.protocol,
+            "vrf": instance.vrf.name if instance.vrf else None,
+            "router_id": str(instance.router_id.host) if instance.router_id else None,
+            "router_id_number": instance.router_id_number,
+            "areas": [instance.isis_area] if instance.isis_area else ospf_areas.get(instance.pk, []),
+            "nets": nets.get(instance.pk, []),
+        }
+        for instance in instances
+    ]
+
+
+def iter_node_batches(queryset, batch_size=DEFAULT_BATCH_SIZE):
+    """Yield lists of node rows (NODE_COLUMNS dicts), one per IGP routing instance in ``queryset``.
+
+    Instances are streamed from a server-side cursor; NETs and OSPF areas are fetched with two queries per batch.
+    """
+    instances = queryset.select_related("device", "vrf", "router_id").order_by("pk").iterator(chunk_size=batch_size)
+    for batch in iter_batches(instances, batch_size):
+        yield _node_rows(batch)
+
+
+def _edge_side(interface_config, effective, side):
+    if isinstance(interface_config, ISISInterfaceConfiguration):
+        protocol_config = interface_config.isis_config
+        values = {
+            "metric": effective.get("metric"),
+            "area": protocol_config.instance.isis_area,
+            "circuit_type": effective.get("circuit_type"),
+        }
+    else:
+        protocol_config = interface_config.ospf_config
+        values = {
+            "metric": effective.get("cost"),
+            "area": effective.get("area"),
+            "circuit_type": None,
+        }
+    values.update(
+        {
+            "config_id": str(interface_config.pk),
+            "instance_id": str(protocol_config.instance_id),
+            "device": interface_config.interface.device.name,
+            "interface": interface_config.interface.name,
+            "network_type": interface_config.network_type or None,
+        }
+    )
+    return {f"{side}_{column}": values[column] for column in EDGE_SIDE_COLUMNS}
+
+
+def _edge_rows(protocol, pairs):
+    effective = resolve_effective_configs({config.pk: config for pair in pairs for config in pair}.values())
+    return [
+        {
+            "protocol": protocol,
+            "cable_id": str(side_a.cable_id),
+            **_edge_side(side_a, effective[side_a.pk], "a"),
+            **_edge_side(side_b, effective[side_b.pk], "b"),
+        }
+        for side_a, side_b in pairs
+    ]
+
+
+def iter_edge_batches(queryset, batch_size=DEFAULT_BATCH_SIZE):
+    """Yield lists of edge rows (EDGE_COLUMNS dicts), one per cabled adjacency among the interface configurations.
+
+    Interface configurations are streamed in cable order from a server-side cursor, and the effective configuration
+    of each batch is resolved in one pass, so memory stays bounded by ``batch_size`` regardless of topology size.
+    """
+    if queryset.model is ISISInterfaceConfiguration:
+        protocol, protocol_config_field = "ISIS", "isis_config"
+    else:
+        protocol, protocol_config_field = "OSPF", "ospf_config"
+    interface_configs = (
+        with_inheritance_related(cabled(queryset))
+        .select_related(f"{protocol_config_field}__instance")
+        .iterator(chunk_size=batch_size)
+    )
+    for pairs in iter_batches(iter_cabled_pairs(interface_configs), batch_size):
+        yield _edge_rows(protocol, pairs)
@@ -0,0 +1,126 @@
+"""Helper functions for nautobot_igp_models."""
+
+import csv
+import io
+import json
+
+
+def system_id_from_router_id(router_id):
+    """Derive the ISIS System ID (XXXX.XXXX.XXXX) from an IPv4 router ID.
+
+    Args:
+        router_id: IPv4 address, with or without a prefix length (e.g. "192.168.3.2/32").
+
+    Returns:
+        str: System ID built from the octets, e.g. "0192.0168.0302".
+    """
+    octets = str(router_id).split("/")[0].split(".")
+    if len(octets) != 4:
+        raise ValueError("Router ID format invalid; expected IPv4 address.")
+
+    octet_values = [int(octet) for octet in octets]
+    first_segment = f"{octet_values[0]:04d}"[-4:]
+    second_segment = f"{octet_values[1]:04d}"[-4:]
+    third_segment = f"{octet_values[2]:02d}{octet_values[3]:02d}"[-4:]
+    return f"{first_segment}.{second_segment}.{third_segment}"
+
+
+def build_net(isis_area, router_id):
+    """Build the full NET (Area ID + System ID + NSEL) for an ISIS area and IPv4 router ID."""
+    return f"{isis_area}.{system_id_from_router_id(router_id)}.00"
+
+
+def render_rows(rows, columns, output_format="csv"):
+    """Render a list of row dicts as CSV or JSON text."""
+    if output_format == "json":
+        return json.dumps(rows, indent=2, default=str)
+    output = io.StringIO()
+    writer = csv.DictWriter(output, fieldnames=columns, extrasaction="ignore")
+    writer.writeheader()
+    writer.writerows(rows)
+    return output.getvalue()
+
+
+def ospf_area_to_int(area):
+    """Normalize an OSPF area to its 32-bit integer value.
+
+    Accepts dotted-decimal ("0.0.0.1", "00.0.0.0") and plain decimal ("1") notation.
+
+    Raises:
+        ValueError: If the area is not a valid 32-bit OSPF area ID.
+    """
+    area = str(area).strip()
+    parts = area.split(".")
+    try:
+        if len(parts) == 1:
+            value = int(area)
+            if not 0 <= value <= 0xFFFFFFFF:
+                raise ValueError
+            return value
+        octets = [int(part) for part in parts]
+    except ValueError:
+        raise ValueError(f"Invalid OSPF area: {area!r}") from None
+    if len(octets) != 4 or any(not 0 <= octet <= 255 for octet in octets):
+        raise ValueError(f"Invalid OSPF area: {area!r}")
+    return (octets[0] << 24) | (octets[1] << 16) | (octets[2] << 8) | octets[3]
+
+
+def int_to_ospf_area(value):
+    """Render a 32-bit integer OSPF area in dotted-decimal notation."""
+    return ".".join(str((value >> shift) & 0xFF) for shift in (24, 16, 8, 0))
+
+
+def system_id_to_int(system_id):
+    """Convert a 6-byte ISIS System ID (XXXX.XXXX.XXXX, hex) to a 48-bit integer."""
+    parts = str(system_id).strip().split(".")
+    if len(parts) != 3 or any(len(part) != 4 for part in parts):
+        raise ValueError(f"Invalid ISIS System ID: {system_id!r}")
+    try:
+        return int("".join(parts), 16)
+    except ValueError:
+        raise ValueError(f"Invalid ISIS System ID: {system_id!r}") from None
+
+
+def int_to_system_id(value):
+    """Render a 48-bit integer as an ISIS System ID (XXXX.XXXX.XXXX)."""
+    digits = f"{value:012x}"
+    return f"{digits[0:4]}.{digits[4:8]}.{digits[8:12]}"
+
+
+def parse_lsp_id(lsp_id):
+    """Return the 48-bit System ID of an LSP ID ("0010.0000.0001.00-00"), LAN ID or bare System ID."""
+    return system_id_to_int(".".join(str(lsp_id).strip().split("-")[0].split(".")[:3]))
+
+
+def net_columns(net):
+    """Split a stored NET into the indexed lookup columns of an ISIS configuration.
+
+    Accepts a full NET (area, System ID and NSEL, e.g. "49.0001.0010.0000.0001.00") or a bare System ID.
+    Values that cannot be parsed yield empty columns.
+
+    Returns:
+        dict: ``system_id_number`` (48-bit int or None) and ``isis_area_hex`` (area digits, "" if none).
+    """
+    parts = str(net or "").strip().split(".")
+    try:
+        if len(parts) == 3:
+            return {"system_id_number": system_id_to_int(net), "isis_area_hex": ""}
+        if len(parts) >= 5:
+            area_hex = "".join(parts[:-4]).lower()
+            int(area_hex, 16)
+            return {"system_id_number": system_id_to_int(".".join(parts[-4:-1])), "isis_area_hex": area_hex}
+    except ValueError:
+        pass
+    return {"system_id_number": None, "isis_area_hex": ""}
+
+
+def ipv4_to_int(address):
+    """Convert an IPv4 address (with or without prefix length) to a 32-bit integer; other values yield None."""
+    octets = str(address).split("/")[0].split(".")
+    try:
+        values = [int(octet) for octet in octets]
+    except ValueError:
+        return None
+    if len(values) != 4 or any(not 0 <= value <= 255 for value in values):
+        return None
+    return (values[0] << 24) | (values[1] << 16) | (values[2] << 8) | values[3]
@@ -1,9 +1,44 @@
 """Views for nautobot_igp_models."""
 
+from django.http import HttpResponse
 from nautobot.apps.views import NautobotUIViewSet
 
 from nautobot_igp_models import filters, forms, models, tables
 from nautobot_igp_models.api import serializers
+from nautobot_igp_models.flooding import instance_flooding_domains
+from nautobot_igp_models.instrumentation import instrumented
+from nautobot_igp_models.profiling import profile_call
+
+PROFILE_PARAM = "profile"
+
+
+class InstrumentedExportMixin:
+    """Record export template renders of the list view as the ``export_render`` instrumented operation.
+
+    Superusers can add ``profile=1`` to an export URL to download a ZIP of the rendered export, the render's collapsed
+    call stacks and its slowest SQL statements.
+    """
+
+    # Not a filter: under STRICT_FILTERING it would otherwise empty the exported queryset
+    non_filter_params = (*NautobotUIViewSet.non_filter_params, PROFILE_PARAM)
+
+    @instrumented("export_render")
+    def check_for_export(self, request, model, content_type):
+        """Render the requested export, if any."""
+        if request.GET.get("export") and request.GET.get(PROFILE_PARAM) == "1" and request.user.is_superuser:
+            return self.profile_export(request, model, content_type)
+        return super().check_for_export(request, model, content_type)
+
+    def profile_export(self, request, model, content_type):
+        """Render the requested export under the profiler and return the profile report files."""
+        profile = profile_call(super().check_for_export, request, model, content_type)
+        if profile.result is None:
+            return None
+        name = f"{model._meta.model_name}-{request.GET['export']}".lower().replace(" ", "-")
+        archive = profile.zip_archive(name, extra_files={f"{name}.export": profile.result.content})
+        response = HttpResponse(archive, content_type="application/zip")
+        response["Content-Disposition"] = f'attachment; filename="{name}-profile.zip"'
+        return response
 
 
 class IGPRoutingInstanceUIViewSet(NautobotUIViewSet):
@@ -19,7 +54,7 @@ class IGPRoutingInstanceUIViewSet(NautobotUIViewSet):
     table_class = tables.IGPRoutingInstanceTable
 
 
-class ISISConfigurationUIViewSet(NautobotUIViewSet):
+class ISISConfigurationUIViewSet(InstrumentedExportMixin, NautobotUIViewSet):
     """UIViewset for ISISConfiguration model."""
 
     bulk_update_form_class = forms.ISISConfigurationBulkEditForm
@@ -31,6 +66,13 @@ class ISISConfigurationUIViewSet(NautobotUIViewSet):
     serializer_class = serializers.ISISConfigurationSerializer
     table_class = tables.ISISConfigurationTable
 
+    def get_extra_context(self, request, instance=None):
+        """Add the flooding domains of the configuration's routing instance to the detail view."""
+        context = super().get_extra_context(request, instance)
+        if instance is not None and self.action == "retrieve":
+            context["flooding_domains"] = instance_flooding_domains(instance.instance_id)
+        return context
+
 
 class ISISInterfaceConfigurationUIViewSet(NautobotUIViewSet):
     """UIViewset for ISISInterfaceConfiguration model."""
@@ -45,7 +87,7 @@ class ISISInterfaceConfigurationUIViewSet(NautobotUIViewSet):
     table_class = tables.ISISInterfaceConfigurationTable
 
 
-class OSPFConfigurationUIViewSet(NautobotUIViewSet):
+class OSPFConfigurationUIViewSet(InstrumentedExportMixin, NautobotUIViewSet):
     """UIViewset for OSPFConfiguration model."""
 
     bulk_update_form_class = forms.OSPFConfigurationBulkEditForm